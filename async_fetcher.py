@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""Tor SOCKS5 proxy üzerinden eşzamanlı (asyncio) sayfa indirme motoru"""
+import asyncio
+import contextlib
+import re
+import socket
+import ssl
+import struct
+import threading
+import time
+from urllib.parse import urljoin, urlsplit
+
+import config
+import metrics
+from tor_pool import all_pools, get_pool
+
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+READ_CHUNK_SIZE = 64 * 1024
+
+SOCKS_ERRORS = {
+    1: "genel SOCKS sunucu hatası",
+    2: "bağlantıya izin verilmedi",
+    3: "ağ erişilemez",
+    4: "host erişilemez",
+    5: "bağlantı reddedildi",
+    6: "TTL süresi doldu",
+    7: "komut desteklenmiyor",
+    8: "adres tipi desteklenmiyor",
+}
+
+
+class FetchError(Exception):
+    """SOCKS veya HTTP seviyesinde indirme hatası"""
+
+
+class FetchTimeout(FetchError):
+    """İstek süre sınırı içinde tamamlanmadı"""
+
+
+class SocksError(FetchError):
+    """SOCKS5 proxy CONNECT isteğini reddetti (`code` SOCKS yanıt kodu)"""
+
+    def __init__(self, code):
+        super().__init__(f"SOCKS5 hatası: {SOCKS_ERRORS.get(code, code)}")
+        self.code = code
+
+
+class FetchResult:
+    """Tek bir indirmenin sonucu"""
+    __slots__ = ("url", "status", "headers", "body", "truncated", "cache_status")
+
+    def __init__(self, url, status, headers, body, truncated=False, cache_status=None):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.truncated = truncated
+        # Önbellek kullanıldıysa: "hit" (304), "unchanged" (aynı içerik) veya "miss"
+        self.cache_status = cache_status
+
+    @property
+    def encoding(self):
+        """Content-Type başlığındaki karakter setini döndür (yoksa None)"""
+        match = re.search(r"charset=([\w-]+)", self.headers.get("content-type", ""), re.I)
+        return match.group(1) if match else None
+
+    @property
+    def text(self):
+        try:
+            return self.body.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def default_proxy():
+    """Ayarlardaki Tor SOCKS5 adresini döndür"""
+    return (config.TOR_SOCKS_HOST, config.TOR_SOCKS_PORT)
+
+
+async def _sock_recv_exact(loop, sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = await loop.sock_recv(sock, size - len(data))
+        if not chunk:
+            raise FetchError("SOCKS5 bağlantısı beklenmedik şekilde kapandı")
+        data += chunk
+    return data
+
+
+async def socks5_open(host, port, proxy=None, use_ssl=False):
+    """SOCKS5 (socks5h, DNS proxy tarafında) üzerinden host:port'a bağlan, (reader, writer) döndür"""
+    loop = asyncio.get_running_loop()
+    proxy_host, proxy_port = proxy or default_proxy()
+    family, type_, proto, _, address = (
+        await loop.getaddrinfo(proxy_host, proxy_port, type=socket.SOCK_STREAM)
+    )[0]
+    sock = socket.socket(family, type_, proto)
+    sock.setblocking(False)
+    try:
+        await loop.sock_connect(sock, address)
+
+        # Kimlik doğrulamasız selamlaşma
+        await loop.sock_sendall(sock, b"\x05\x01\x00")
+        if await _sock_recv_exact(loop, sock, 2) != b"\x05\x00":
+            raise FetchError("SOCKS5 kimlik doğrulama yöntemi reddedildi")
+
+        # CONNECT isteği (alan adı proxy tarafında çözülür)
+        host_bytes = host.encode("idna")
+        await loop.sock_sendall(
+            sock,
+            b"\x05\x01\x00\x03" + bytes([len(host_bytes)]) + host_bytes + struct.pack(">H", port),
+        )
+        head = await _sock_recv_exact(loop, sock, 4)
+        if head[1] != 0:
+            raise SocksError(head[1])
+
+        # Bağlanılan adres alanını atla
+        if head[3] == 1:
+            await _sock_recv_exact(loop, sock, 4 + 2)
+        elif head[3] == 4:
+            await _sock_recv_exact(loop, sock, 16 + 2)
+        else:
+            length = (await _sock_recv_exact(loop, sock, 1))[0]
+            await _sock_recv_exact(loop, sock, length + 2)
+    except BaseException:
+        sock.close()
+        raise
+
+    ssl_context = ssl.create_default_context() if use_ssl else None
+    return await asyncio.open_connection(
+        sock=sock, ssl=ssl_context, server_hostname=host if use_ssl else None
+    )
+
+
+async def read_response_head(reader):
+    """Durum satırını ve başlıkları oku, (status, headers) döndür"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise FetchError("Sunucudan boş yanıt geldi")
+    parts = status_line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise FetchError(f"Geçersiz HTTP durum satırı: {status_line[:50]!r}")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+async def iter_response_body(reader, headers):
+    """Yanıt gövdesini parça parça üret (Content-Length, chunked veya bağlantı sonuna kadar)"""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise FetchError("Chunked yanıt yarıda kesildi")
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailer başlıklarını atla
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            yield await reader.readexactly(size)
+            await reader.readline()
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining > 0:
+            chunk = await reader.read(min(READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise FetchError("Yanıt gövdesi yarıda kesildi")
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        while True:
+            chunk = await reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _build_request(method, parts, headers):
+    host = parts.hostname
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    request_headers = {
+        "Host": host,
+        "User-Agent": config.USER_AGENT,
+        "Accept": "*/*",
+        "Connection": "keep-alive",
+    }
+    request_headers.update(headers or {})
+    lines = [f"{method} {path} HTTP/1.1"]
+    lines.extend(f"{name}: {value}" for name, value in request_headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _send(reader, writer, request, max_bytes):
+    started = time.perf_counter()
+    writer.write(request)
+    await writer.drain()
+    status, response_headers = await read_response_head(reader)
+    first_byte = time.perf_counter()
+
+    chunks = []
+    size = 0
+    truncated = False
+    async for chunk in iter_response_body(reader, response_headers):
+        if max_bytes and size + len(chunk) > max_bytes:
+            chunks.append(chunk[:max_bytes - size])
+            truncated = True
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    body = b"".join(chunks)
+
+    metrics.observe("fetch_ttfb_seconds", first_byte - started)
+    metrics.observe("fetch_download_seconds", time.perf_counter() - first_byte)
+    metrics.observe("fetch_response_bytes", len(body))
+    metrics.inc("fetch_bytes_total", len(body))
+    return status, response_headers, body, truncated
+
+
+async def _request(url, pool, headers, max_bytes, inflight=None):
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise FetchError(f"Desteklenmeyen URL: {url}")
+    use_ssl = parts.scheme == "https"
+    port = parts.port or (443 if use_ssl else 80)
+    key = (parts.hostname, port, use_ssl)
+    request = _build_request("GET", parts, headers)
+
+    circuit = pool.choose()
+    if inflight is not None:
+        # İptal edilirse devre listede kalır; zaman aşımını yakalayan `fetch` onu cezalandırır
+        inflight.append(circuit)
+    started = time.monotonic()
+    connection = pool.take_idle(circuit, key)
+    try:
+        if connection is not None:
+            try:
+                status, response_headers, body, truncated = await _send(*connection, request, max_bytes)
+            except (FetchError, ConnectionError, asyncio.IncompleteReadError):
+                # Sunucu boşta bekleyen bağlantıyı kapatmış olabilir, yeni bağlantıyla tekrar dene
+                connection[1].close()
+                connection = None
+        if connection is None:
+            connect_started = time.perf_counter()
+            connection = await socks5_open(parts.hostname, port, circuit.proxy, use_ssl=use_ssl)
+            metrics.observe("fetch_socks_connect_seconds", time.perf_counter() - connect_started)
+            status, response_headers, body, truncated = await _send(*connection, request, max_bytes)
+    except Exception:
+        if inflight is not None:
+            inflight.remove(circuit)
+        circuit.record_failure()
+        metrics.inc("fetch_errors_total")
+        if connection is not None:
+            connection[1].close()
+        raise
+    except BaseException:
+        # Dışarıdan iptal edilen istekler (ör. yarışı kaybeden test siteleri) devre sağlığını etkilemez
+        if connection is not None:
+            connection[1].close()
+        raise
+
+    if inflight is not None:
+        inflight.remove(circuit)
+    circuit.record_success(time.monotonic() - started)
+    metrics.inc("fetch_requests_total")
+    reusable = (
+        not truncated
+        and response_headers.get("connection", "").lower() != "close"
+        and ("content-length" in response_headers or "transfer-encoding" in response_headers)
+    )
+    pool.release(circuit, key, *connection, reusable)
+    return FetchResult(url, status, response_headers, body, truncated)
+
+
+def _cached_result(cache, url):
+    """304 yanıtı için önbellekteki gövdeyi döndür (gövde kaybolduysa None)"""
+    entry = cache.lookup(url)
+    body = cache.read_body(entry) if entry is not None else None
+    if body is None:
+        return None
+    cache.hits += 1
+    return FetchResult(url, 200, entry.headers, body, cache_status="hit")
+
+
+async def fetch(url, proxy=None, timeout=None, headers=None, pool=None, max_bytes=None, cache=None):
+    """Tek bir URL'yi SOCKS5 devre havuzu üzerinden indir (yönlendirmeleri takip eder).
+
+    Gövde `max_bytes` (varsayılan MAX_BODY_BYTES) baytta kesilir. `cache` verilirse
+    koşullu istek gönderilir; 304 yanıtında gövde önbellekten döner.
+    """
+    timeout = config.FETCH_TIMEOUT if timeout is None else timeout
+    max_bytes = config.MAX_BODY_BYTES if max_bytes is None else max_bytes
+    pool = pool or get_pool(proxy)
+    inflight = []  # Zaman aşımında yanıt bekleyen isteğin devresi
+
+    async def _follow():
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            request_headers = dict(headers or {})
+            if cache is not None:
+                request_headers.update(cache.validators(current))
+            result = await _request(current, pool, request_headers, max_bytes, inflight)
+
+            if result.status == 304 and cache is not None:
+                cached = _cached_result(cache, current)
+                if cached is not None:
+                    return cached
+                # Önbellek gövdesi silinmiş, koşulsuz tekrar iste
+                result = await _request(current, pool, headers, max_bytes, inflight)
+            if result.status in REDIRECT_CODES and "location" in result.headers:
+                current = urljoin(current, result.headers["location"])
+                continue
+            if cache is not None and result.status == 200 and not result.truncated:
+                unchanged = cache.store(current, result.headers, result.body)
+                result.cache_status = "unchanged" if unchanged else "miss"
+            return result
+        raise FetchError(f"Çok fazla yönlendirme: {url}")
+
+    try:
+        return await asyncio.wait_for(_follow(), timeout)
+    except asyncio.TimeoutError:
+        # İç istek yalnızca iptal görür; zaman aşımı, yanıt vermeyen devrenin hatası olarak burada sayılır
+        for circuit in inflight:
+            circuit.record_failure()
+        metrics.inc("fetch_errors_total")
+        raise FetchTimeout(f"Zaman aşımı ({timeout} sn)") from None
+
+
+async def fetch_all(urls, concurrency=None, proxy=None, timeout=None, pool=None, cache=None):
+    """URL'leri en fazla `concurrency` eşzamanlı istekle indir.
+
+    Sonuçlar girdi sırasıyla döner; başarısız indirmeler için exception nesnesi döner.
+    """
+    limit = concurrency or config.FETCH_CONCURRENCY
+    limit = max(1, min(limit, config.MAX_FETCH_CONCURRENCY))
+    semaphore = asyncio.Semaphore(limit)
+    pool = pool or get_pool(proxy)
+
+    async def _limited(url):
+        async with semaphore:
+            return await fetch(url, timeout=timeout, pool=pool, cache=cache)
+
+    return await asyncio.gather(*(_limited(url) for url in urls), return_exceptions=True)
+
+
+# --- senkron çalıştırma ve kalıcı event loop ---
+
+_local = threading.local()
+
+
+def run_sync(coro):
+    """Coroutine'i senkron çalıştır; `warm_loop()` içindeyse kalıcı event loop kullanılır"""
+    loop = getattr(_local, "loop", None)
+    if loop is None:
+        return asyncio.run(coro)
+    return loop.run_until_complete(coro)
+
+
+async def release_idle(pool):
+    """İşlem bitince boştaki bağlantıları kapat; kalıcı loop'ta sonraki işler için açık bırak"""
+    if getattr(_local, "loop", None) is None:
+        await pool.close_idle()
+
+
+@contextlib.contextmanager
+def warm_loop():
+    """Bu thread'deki `run_sync` çağrıları için tek bir event loop açık tut.
+
+    Keep-alive bağlantıları çağrılar (ör. daemon işleri) arasında korunur;
+    blok sonunda tüm havuzların boştaki bağlantıları kapatılır.
+    """
+    loop = asyncio.new_event_loop()
+    _local.loop = loop
+    try:
+        yield loop
+    finally:
+        _local.loop = None
+        for pool in all_pools():
+            loop.run_until_complete(pool.close_idle())
+        loop.close()
+
+
+def fetch_many(urls, proxy=None, pool=None, **kwargs):
+    """fetch_all için senkron sarmalayıcı"""
+    pool = pool or get_pool(proxy)
+
+    async def _run():
+        try:
+            return await fetch_all(urls, pool=pool, **kwargs)
+        finally:
+            await release_idle(pool)
+
+    return run_sync(_run())
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import argparse
 import subprocess
 import random
 import time
@@ -6,6 +7,9 @@ import sys
 import re
 import os
 
+import config
+from fleet import DockerRunner, FleetRunner, summarize
+
 def generate_random_mac():
     """Rastgele MAC adresi üret"""
     # MAC adresi formatı: XX:XX:XX:XX:XX:XX
@@ -21,49 +25,41 @@ def generate_random_mac():
     print(f"🔄 Yeni MAC adresi üretildi: {mac_address}")
     return mac_address
 
-def run_docker_container(mac_address):
+def run_docker_container(mac_address, timeout=300):
     """Docker container'ı belirtilen MAC adresiyle başlat"""
     container_name = f"tor-scanner-{int(time.time())}"
     
     print(f"🚀 Container başlatılıyor: {container_name}")
     print(f"📡 MAC Adresi: {mac_address}")
+    print("⏳ Container çalışıyor...")
     
     try:
-        # Docker container'ı başlat
-        cmd = [
-            "docker", "run", 
-            "--name", container_name,
-            "--mac-address", mac_address,
-            "--rm",  # Container'ı otomatik sil
-            "-v", f"{os.getcwd()}:/app/output",
-            "tor-onion-scanner:latest",
-            "sh", "-c", "cd /app && python3 script.py && cp *.json *.pdf /app/output/ 2>/dev/null || true"
-        ]
-        
-        print("⏳ Container çalışıyor...")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300, encoding='utf-8', errors='ignore')
-        
-        print("\n" + "="*60)
-        print("📋 CONTAINER ÇIKTISI:")
-        print("="*60)
-        
-        if result.stdout:
-            print(result.stdout)
-        
-        if result.stderr:
-            print("⚠️  Hata çıktısı:")
-            print(result.stderr)
-        
-        print("="*60)
-        
-        return result.returncode == 0
-        
-    except subprocess.TimeoutExpired:
-        print("⏰ Container zaman aşımına uğradı (5 dakika)")
-        return False
+        # Her çalıştırma kendi dizinine yazar; önceki sonuçların üzerine yazılmaz
+        output_dir = os.path.join("runs", container_name)
+        os.makedirs(output_dir, exist_ok=True)
+        outcome = DockerRunner().run(container_name, mac_address, output_dir, timeout)
     except Exception as e:
         print(f"❌ Container çalıştırma hatası: {e}")
         return False
+    
+    if outcome.timed_out:
+        print(f"⏰ Container zaman aşımına uğradı ({timeout} saniye)")
+        return False
+    
+    print("\n" + "="*60)
+    print("📋 CONTAINER ÇIKTISI:")
+    print("="*60)
+    
+    if outcome.stdout:
+        print(outcome.stdout)
+    
+    if outcome.stderr:
+        print("⚠️  Hata çıktısı:")
+        print(outcome.stderr)
+    
+    print("="*60)
+    
+    return outcome.ok
 
 def cleanup_containers():
     """Çalışan container'ları temizle"""
@@ -76,7 +72,27 @@ def cleanup_containers():
     except Exception as e:
         print(f"⚠️  Temizlik sırasında hata: {e}")
 
+def print_run_summary(summary):
+    attempts = summary["attempts"]
+    icon = {"ok": "✅", "failed": "❌", "timeout": "⏰"}[summary["status"]]
+    retry_note = f", {len(attempts)} deneme" if len(attempts) > 1 else ""
+    print(f"{icon} Çalıştırma {summary['run'] + 1}: {summary['status']} "
+          f"({summary['seconds']:.1f} sn{retry_note}) -> {summary['output_dir']}")
+    if summary["status"] != "ok" and attempts[-1]["stderr_tail"]:
+        print(f"   ⚠️  {attempts[-1]['stderr_tail'].strip().splitlines()[-1]}")
+
 def main():
+    parser = argparse.ArgumentParser(description="Tor Onion Scanner container otomasyonu")
+    parser.add_argument("--runs", type=int, help="çalıştırma sayısı (verilmezse sorulur)")
+    parser.add_argument("--batch", action="store_true", help="soru sormadan çalış (varsayılan: 1 çalıştırma)")
+    parser.add_argument("-c", "--concurrency", type=int, default=config.FLEET_CONCURRENCY,
+                        help="aynı anda çalışan container sayısı")
+    parser.add_argument("--timeout", type=int, default=config.FLEET_RUN_TIMEOUT, help="çalıştırma başına zaman aşımı (saniye)")
+    parser.add_argument("--retries", type=int, default=config.FLEET_RETRIES, help="başarısız çalıştırma için yeniden deneme sayısı")
+    parser.add_argument("--output-dir", default="runs", help="çalıştırma çıktılarının kök dizini")
+    parser.add_argument("--tor-data-volume", help="Tor veri dizinini bu adla başlayan volume'larda sakla ve yeniden kullan")
+    args = parser.parse_args()
+    
     print("🤖 Tor Onion Scanner Otomasyonu")
     print("=" * 50)
     
@@ -84,37 +100,30 @@ def main():
     cleanup_containers()
     
     # Kaç kez çalıştırılacağını sor
-    try:
-        runs = int(input("Kaç kez çalıştırmak istiyorsunuz? (varsayılan: 1): ") or "1")
-    except ValueError:
-        runs = 1
-    
-    successful_runs = 0
-    
-    for i in range(runs):
-        print(f"\n🔄 Çalıştırma {i+1}/{runs}")
-        print("-" * 30)
-        
-        # Rastgele MAC adresi üret
-        mac_address = generate_random_mac()
-        
-        # Container'ı çalıştır
-        success = run_docker_container(mac_address)
-        
-        if success:
-            successful_runs += 1
-            print(f"✅ Çalıştırma {i+1} başarılı!")
-        else:
-            print(f"❌ Çalıştırma {i+1} başarısız!")
-        
-        # Son çalıştırma değilse bekle
-        if i < runs - 1:
-            print("⏳ 3 saniye bekleniyor...")
-            time.sleep(3)
+    runs = args.runs
+    if runs is None and not args.batch:
+        try:
+            runs = int(input("Kaç kez çalıştırmak istiyorsunuz? (varsayılan: 1): ") or "1")
+        except (ValueError, EOFError):
+            runs = 1
+    runs = max(1, runs or 1)
+    
+    runner = DockerRunner(tor_data_volume=args.tor_data_volume)
+    fleet = FleetRunner(runner, concurrency=args.concurrency, timeout=args.timeout,
+                        retries=args.retries, output_root=args.output_dir)
+    print(f"\n🔄 {runs} çalıştırma, aynı anda en fazla {fleet.concurrency} container "
+          f"(zaman aşımı {fleet.timeout} sn, {fleet.retries} yeniden deneme)")
+    print("-" * 30)
+    
+    started = time.perf_counter()
+    summaries = fleet.run(runs, on_finish=print_run_summary)
+    totals = summarize(summaries, time.perf_counter() - started)
     
-    print(f"\n📊 Özet: {successful_runs}/{runs} başarılı çalıştırma")
+    print(f"\n📊 Özet: {totals['ok']}/{totals['runs']} başarılı çalıştırma "
+          f"({totals['wall_seconds']:.1f} sn, dakikada {totals['runs_per_minute']} çalıştırma)")
+    print(f"📝 Çalıştırma özetleri: {fleet.summary_file}")
     
-    if successful_runs > 0:
+    if totals['ok'] > 0:
         print("🎉 Otomasyon tamamlandı!")
     else:
         print("⚠️  Hiç başarılı çalıştırma olmadı!")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Bir dizindeki (veya glob desenine uyan) tarama sonuçlarından süreç havuzunda toplu PDF rapor üretimi"""
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import config
+
+
+def find_result_files(source):
+    """Dizin (alt dizinleriyle), glob deseni veya dosya listesinden JSON sonuç dosyalarını sıralı döndür"""
+    if isinstance(source, (list, tuple)):
+        return [os.path.abspath(path) for path in source]
+    if os.path.isdir(source):
+        source = os.path.join(source, "**", "*.json")
+    return sorted(os.path.abspath(path) for path in glob.glob(source, recursive=True))
+
+
+def report_paths(json_files, output_dir, root=None):
+    """Her sonuç dosyasının PDF yolu; kök dizine göre göreli yol korunur.
+
+    Filo çıktılarında her çalıştırmanın dosya adı aynıdır (`runs/<ad>/onion_scan_results.json`),
+    bu yüzden raporlar `output_dir/<ad>/onion_scan_results.pdf` olarak yazılır. İki dosya aynı
+    rapora yazılacaksa hiçbir rapor üretilmeden ValueError fırlatılır.
+    """
+    if not json_files:
+        return []
+    root = root or os.path.commonpath([os.path.dirname(path) for path in json_files])
+    targets = [os.path.join(output_dir, os.path.splitext(os.path.relpath(path, root))[0] + ".pdf")
+               for path in json_files]
+    duplicates = sorted(target for target, count in Counter(targets).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Birden fazla sonuç dosyası aynı rapora yazılacak: {', '.join(duplicates)}")
+    return targets
+
+
+def _link_count(json_file):
+    """Başlıktaki `total_onion_links` değerini linkleri okumadan bul"""
+    from report_source import iter_json_top_level
+
+    for key, value in iter_json_top_level(json_file, "onion_links"):
+        if key == "total_onion_links":
+            return value
+        if key == "onion_links":
+            break
+    return 0
+
+
+def _init_worker(scratch_root, chart_cache_dir):
+    # Modüller dizin değişmeden önce yüklenir (sys.path'te göreli '' girdisi olabilir)
+    import pdf_generator  # noqa: F401
+    import report_source  # noqa: F401
+
+    # Her işçi kendi geçici dizininde çalışır; göreli yollar ve geçici dosyalar çakışmaz
+    scratch = tempfile.mkdtemp(prefix=f"worker_{os.getpid()}_", dir=scratch_root)
+    os.chdir(scratch)
+    tempfile.tempdir = scratch
+    config.CHART_CACHE_DIR = chart_cache_dir
+    sys.stdout = open(os.devnull, "w")
+
+
+def _render(json_file, output_file, large):
+    from pdf_generator import create_pdf_report
+
+    started = time.perf_counter()
+    try:
+        if large is None:
+            large = _link_count(json_file) > config.LARGE_REPORT_THRESHOLD
+        ok = create_pdf_report(json_file, output_file, large=large)
+        error = None if ok else "rapor oluşturulamadı"
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+    return {
+        "json_file": json_file,
+        "output_file": output_file if ok else None,
+        "ok": bool(ok),
+        "seconds": round(time.perf_counter() - started, 3),
+        "error": error,
+        "worker": os.getpid(),
+    }
+
+
+def create_pdf_reports(source, output_dir="reports", workers=None, large=None):
+    """Sonuç dosyalarının PDF raporlarını paralel üret.
+
+    `large=None` ise her dosya için link sayısına göre akış modu seçilir. Her dosya için
+    süre ve hata bilgisini içeren sözlüklerin listesi (girdi sırasıyla) döndürülür.
+    """
+    json_files = find_result_files(source)
+    output_dir = os.path.abspath(output_dir)
+    root = os.path.abspath(source) if isinstance(source, str) and os.path.isdir(source) else None
+    output_files = report_paths(json_files, output_dir, root)
+    for directory in {os.path.dirname(path) for path in output_files} | {output_dir}:
+        os.makedirs(directory, exist_ok=True)
+    chart_cache_dir = os.path.abspath(config.CHART_CACHE_DIR) if config.CHART_CACHE_DIR else ""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(json_files) or 1))
+
+    scratch_root = tempfile.mkdtemp(prefix="report_batch_")
+    results = []
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(scratch_root, chart_cache_dir)) as pool:
+            futures = []
+            for json_file, output_file in zip(json_files, output_files):
+                futures.append((json_file, pool.submit(_render, json_file, output_file, large)))
+            for json_file, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # İşçi süreci çöktüyse (ör. bellek yetersizliği) dosya başarısız sayılır
+                    results.append({"json_file": json_file, "output_file": None, "ok": False,
+                                    "seconds": None, "error": f"{type(e).__name__}: {e}", "worker": None})
+    finally:
+        shutil.rmtree(scratch_root, ignore_errors=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", help="sonuç dizini veya glob deseni (ör. 'output/*.json')")
+    parser.add_argument("-o", "--output-dir", default="reports")
+    parser.add_argument("-j", "--workers", type=int, help="süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--large", action="store_true", default=None, help="tüm dosyalar için akış modu")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        results = create_pdf_reports(args.source, args.output_dir, args.workers, args.large)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    failed = [result for result in results if not result["ok"]]
+    for result in results:
+        if result["ok"]:
+            print(f"✅ {result['json_file']} -> {result['output_file']} ({result['seconds']} sn)")
+        else:
+            print(f"❌ {result['json_file']}: {result['error']}")
+    print(f"\n📊 {len(results) - len(failed)}/{len(results)} rapor oluşturuldu "
+          f"({time.perf_counter() - started:.1f} sn)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Gösterge çıkarımı benchmark'ı: süreç sayısına göre işlenen MB/s ve sayfa/s.
+
+Sentetik Hidden Wiki sayfalarının bir kısmına kart, e-posta:parola, telefon ve dump
+satırları eklenir. Çıkan MB/s değeri taramanın indirme hızıyla (bkz. bench_offline.py
+`fetch` aşaması) karşılaştırılabilir. Kullanım:
+
+    python benchmarks/bench_indicators.py --pages 400 --page-kb 64 --workers 0,1,2,4
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LEAK_LINES = (
+    "<p>{user}@mail{n}.com:Pass{n}word</p>",
+    "<p>4111 1111 1111 1111 exp 0{m}/27</p>",
+    "<p>Contact +90 532 {n:03d} 45 67</p>",
+    "<p>customers_{n}.sql.gz 1.{m}GB {n},000 records</p>",
+)
+
+
+def synthetic_pages(count, page_kb, leak_ratio=0.2, seed=1):
+    from synthetic_corpus import hidden_wiki_page, onion_hosts
+
+    rng = random.Random(seed)
+    hosts = onion_hosts(200, seed)
+    pages = []
+    for n in range(count):
+        page = hidden_wiki_page(rng, hosts, page_kb * 1024)
+        if rng.random() < leak_ratio:
+            leaks = "".join(line.format(user=f"u{n}", n=n, m=n % 9 + 1) for line in LEAK_LINES)
+            page = page.replace("</body>", leaks + "</body>")
+        pages.append((page.encode("utf-8"), "utf-8", f"http://{hosts[n % len(hosts)]}/"))
+    return pages
+
+
+def run(pages, workers):
+    from indicators import extract_many, get_indicator_pool, shutdown_pool
+
+    get_indicator_pool(workers)  # Havuz açılışı ölçüme katılmaz
+    started = time.perf_counter()
+    found = sum(1 for _ in extract_many(pages, workers))
+    seconds = time.perf_counter() - started
+    shutdown_pool()
+    size = sum(len(body) for body, _, _ in pages)
+    return {
+        "workers": workers,
+        "indicators": found,
+        "seconds": round(seconds, 3),
+        "mb_per_second": round(size / seconds / 1024 / 1024, 1),
+        "pages_per_second": round(len(pages) / seconds, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--page-kb", type=int, default=64)
+    parser.add_argument("--workers", default="0,1,2,4")
+    args = parser.parse_args()
+
+    pages = synthetic_pages(args.pages, args.page_kb)
+    for workers in (int(n) for n in args.workers.split(",")):
+        print(json.dumps(dict(pages=args.pages, page_kb=args.page_kb, **run(pages, workers))), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Link çıkarıcı mikro-benchmark: akışlı ayrıştırıcı ile BeautifulSoup karşılaştırması.
+
+Her yöntem ayrı bir alt süreçte çalıştırılır ki tepe bellek (peak RSS) ölçümleri
+birbirini etkilemesin. Kullanım:
+
+    python benchmarks/bench_link_extractor.py --size-mb 50
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROW = (
+    '<tr><td><a href="http://{host}.onion/page/{i}">Service {i} &amp; mirror</a></td>'
+    '<td><a href="https://clearnet-{i}.example.com/">clearnet</a></td>'
+    '<td>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</td></tr>\n'
+)
+
+
+def synthetic_page_chunks(size_bytes, chunk_rows=500):
+    """Hidden Wiki benzeri dizin sayfasını parça parça üret (bellekte tamamı tutulmaz)"""
+    yield b"<html><head><title>Directory</title></head><body><table>\n"
+    produced = 0
+    i = 0
+    while produced < size_bytes:
+        rows = "".join(ROW.format(host=f"{i + j:056d}"[-56:], i=i + j) for j in range(chunk_rows))
+        data = rows.encode("utf-8")
+        produced += len(data)
+        i += chunk_rows
+        yield data
+    yield b"</table></body></html>\n"
+
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_method(method, size_bytes):
+    from link_extractor import iter_onion_links
+
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    if method == "stream":
+        count = sum(1 for _ in iter_onion_links(synthetic_page_chunks(size_bytes), "bench", max_bytes=0))
+    else:
+        from bs4 import BeautifulSoup
+        content = b"".join(synthetic_page_chunks(size_bytes))
+        soup = BeautifulSoup(content, "html.parser")
+        count = sum(1 for a in soup.find_all("a", href=True) if ".onion" in a["href"])
+    elapsed = time.perf_counter() - started
+    return {
+        "method": method,
+        "size_mb": round(size_bytes / 1024 / 1024, 1),
+        "links": count,
+        "seconds": round(elapsed, 3),
+        "pages_per_sec": round(1 / elapsed, 4),
+        "mb_per_sec": round(size_bytes / 1024 / 1024 / elapsed, 2),
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=50)
+    parser.add_argument("--methods", default="stream,bs4")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    size_bytes = int(args.size_mb * 1024 * 1024)
+
+    if args.worker:
+        print(json.dumps(run_method(args.worker, size_bytes)))
+        return
+
+    for method in args.methods.split(","):
+        output = subprocess.run(
+            [sys.executable, __file__, "--size-mb", str(args.size_mb), "--worker", method],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        print(output.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Link koleksiyonu benchmark'ı: link başına bellek ve okuma süresi (sözlük listesi ve sütunlu liste).
+
+Linkler tarayıcının yaptığı gibi frontier satırlarından (her satırda yeni bir `found_at`
+dizgesi) `OnionIndex`'e eklenir. `dicts` eski düzeni (link başına bir sözlük), `columns`
+`LinkList`'i ölçer; her ikisinde de tekilleştirme kümesi dahildir. Kullanım:
+
+    python benchmarks/bench_links.py --links 100000,1000000 --links-per-page 500
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class DictLinks(list):
+    """Eski düzen: link başına bir sözlük"""
+
+    def append(self, url, text='', found_at=None):
+        super().append({'url': url, 'text': text, 'found_at': found_at})
+
+
+def frontier_rows(count, links_per_page):
+    """`CrawlFrontier.links()` benzeri satırlar: kaynak URL her satırda ayrı bir dizge"""
+    from onion_address import v3_address
+
+    sources = [v3_address(n.to_bytes(32, "big")) for n in range(count // links_per_page + 1)]
+    for n in range(count):
+        host = v3_address((n + 1 << 128).to_bytes(32, "big"))
+        source = sources[n // links_per_page]
+        yield {"url": f"http://{host}/", "text": f"Service {n}", "found_at": "".join(("http://", source, "/"))}
+
+
+def run(layout, count, links_per_page):
+    from onion_address import OnionIndex
+
+    gc.collect()
+    tracemalloc.start()
+    index = OnionIndex(validate=False)
+    if layout == "dicts":
+        index.links = DictLinks()
+    index.extend(frontier_rows(count, links_per_page))
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    read = sum(1 for _ in index)
+    iterate_seconds = time.perf_counter() - started
+    assert read == count
+    return {
+        "layout": layout,
+        "links": count,
+        "links_per_page": links_per_page,
+        "mb": round(current / 1024 / 1024, 1),
+        "bytes_per_link": round(current / count),
+        "peak_mb": round(peak / 1024 / 1024, 1),
+        "iterate_seconds": round(iterate_seconds, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", default="100000,1000000")
+    parser.add_argument("--links-per-page", type=int, default=500)
+    parser.add_argument("--layouts", default="dicts,columns")
+    args = parser.parse_args()
+
+    for count in (int(n) for n in args.links.split(",")):
+        for layout in args.layouts.split(","):
+            print(json.dumps(run(layout, count, args.links_per_page)), flush=True)
+
+
+if __name__ == "__main__":
+    main()
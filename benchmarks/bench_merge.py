@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Parça birleştirme benchmark'ı: parça sayısına göre süre ve tepe bellek (peak RSS).
+
+Her sentetik parça, ortak bir alan adı havuzundan seçilmiş sıralı alan adlarını içerir;
+böylece çalıştırmalar arası tekrar eden alan adları birleştirilir. Her ölçüm ayrı bir
+alt süreçte yapılır. Kullanım:
+
+    python benchmarks/bench_merge.py --shards 100,1000,5000 --domains-per-shard 500 --fan-in 256
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def write_synthetic_shards(workdir, shard_count, per_shard, pool_size, seed=1):
+    from result_shards import SHARD_SUFFIX, write_records
+
+    rng = random.Random(seed)
+    paths = []
+    for run in range(shard_count):
+        seen_at = f"2026-01-01T00:00:{run:06d}"
+        domains = sorted(rng.sample(range(pool_size), min(per_shard, pool_size)))
+        path = os.path.join(workdir, f"run_{run:05d}{SHARD_SUFFIX}")
+        write_records(path, ({"domain": f"{d:056d}.onion", "url": f"http://{d:056d}.onion/", "text": "",
+                              "first_seen": seen_at, "last_seen": seen_at, "hits": 1, "runs": 1}
+                             for d in domains))
+        paths.append(path)
+    return paths
+
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_merge(workdir, fan_in):
+    import glob
+
+    from result_shards import SHARD_SUFFIX, merge_shards
+
+    paths = sorted(glob.glob(os.path.join(workdir, f"run_*{SHARD_SUFFIX}")))
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    domains = merge_shards(paths, os.path.join(workdir, "merged" + SHARD_SUFFIX), fan_in, tmp_dir=workdir)
+    return {
+        "domains": domains,
+        "seconds": round(time.perf_counter() - started, 2),
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", default="100,1000")
+    parser.add_argument("--domains-per-shard", type=int, default=500)
+    parser.add_argument("--domain-pool", type=int, default=100000)
+    parser.add_argument("--fan-in", type=int, default=256)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_merge(args.worker, args.fan_in)))
+        return
+
+    for shard_count in (int(n) for n in args.shards.split(",")):
+        with tempfile.TemporaryDirectory() as workdir:
+            write_synthetic_shards(workdir, shard_count, args.domains_per_shard, args.domain_pool)
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", workdir, "--fan-in", str(args.fan_in)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = dict(shards=shard_count, domains_per_shard=args.domains_per_shard, fan_in=args.fan_in,
+                          **json.loads(output.strip().splitlines()[-1]))
+            print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Ayna tespiti benchmark'ı: imza süresi, indeks araması ve aynalarda atlanan ayrıştırma süresi.
+
+Sentetik Hidden Wiki sayfalarının her biri birkaç adreste (küçük bir başlık farkıyla)
+aynalanır. Önce her sayfa ayrıştırılır (linkler ve göstergeler), sonra aynı derlem
+imzalanıp indeksten geçirilir ve yalnızca özgün sayfalar ayrıştırılır. Kullanım:
+
+    python benchmarks/bench_mirrors.py --pages 100 --mirrors 5 --page-kb 64
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def mirrored_corpus(pages, mirrors, page_kb, seed=1):
+    from synthetic_corpus import hidden_wiki_page, onion_hosts
+
+    rng = random.Random(seed)
+    hosts = onion_hosts(pages * (mirrors + 1), seed)
+    corpus = []
+    for n in range(pages):
+        page = hidden_wiki_page(rng, hosts[:200], page_kb * 1024)
+        for copy in range(mirrors + 1):
+            host = hosts[n * (mirrors + 1) + copy]
+            body = page.replace("<body>", f"<body><h1>Mirror {copy} at http://{host}/</h1>")
+            corpus.append((body.encode("utf-8"), f"http://{host}/"))
+    rng.shuffle(corpus)
+    return corpus
+
+
+def parse(body, url):
+    from indicators import analyze_page
+    from link_extractor import extract_onion_links
+
+    extract_onion_links(body, url, encoding="utf-8")
+    analyze_page(body, "utf-8", url)
+
+
+def run(corpus):
+    from mirrors import MirrorIndex, fingerprint
+
+    started = time.perf_counter()
+    for body, url in corpus:
+        parse(body, url)
+    parse_all = time.perf_counter() - started
+
+    index = MirrorIndex()
+    fingerprint_seconds = lookup_seconds = 0.0
+    started = time.perf_counter()
+    skipped = 0
+    for body, url in corpus:
+        mark = time.perf_counter()
+        signature = fingerprint(body)
+        checked = time.perf_counter()
+        original = index.check(url, signature)
+        lookup_seconds += time.perf_counter() - checked
+        fingerprint_seconds += checked - mark
+        if original is None:
+            parse(body, url)
+        else:
+            skipped += 1
+    with_mirrors = time.perf_counter() - started
+    return {
+        "pages": len(corpus),
+        "originals": len(index),
+        "mirrors_skipped": skipped,
+        "fingerprint_ms_per_page": round(fingerprint_seconds / len(corpus) * 1000, 3),
+        "lookup_ms_per_page": round(lookup_seconds / len(corpus) * 1000, 3),
+        "parse_all_seconds": round(parse_all, 3),
+        "with_mirror_detection_seconds": round(with_mirrors, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--mirrors", type=int, default=5)
+    parser.add_argument("--page-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    corpus = mirrored_corpus(args.pages, args.mirrors, args.page_kb)
+    print(json.dumps(dict(page_kb=args.page_kb, **run(corpus))), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Tor ve Docker gerektirmeyen uçtan uca benchmark paketi.
+
+Sentetik Hidden Wiki korpusu sahte SOCKS5 ağı (`mock_socks.MockTorNetwork`) üzerinden
+sunulur; gecikme ve hata oranı ayarlanabilir. Ölçülen aşamalar:
+
+    fetch    tarayıcının korpusu indirme hızı (sayfa/sn, MB/sn)
+    extract  link çıkarma hızı (link/sn, MB/sn)
+    save     `script.save_to_json` süresi (depo + JSON dışa aktarma)
+    pdf      `pdf_generator.create_pdf_report` süresi
+
+Her aşama bir JSON satırı basar. `--output` tüm sonucu (commit bilgisiyle) bir dosyaya
+yazar, `--compare` önceki bir sonuç dosyasıyla karşılaştırıp gerilemede 1 ile çıkar:
+
+    python benchmarks/bench_offline.py --output bench_baseline.json
+    python benchmarks/bench_offline.py --compare bench_baseline.json --tolerance 0.2
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STAGES = ("fetch", "extract", "save", "pdf")
+
+
+def _quiet():
+    return contextlib.redirect_stdout(open(os.devnull, "w"))
+
+
+def bench_fetch(corpus, workdir, args):
+    from crawler import crawl
+    from mock_socks import MockTorNetwork
+
+    network = MockTorNetwork(args.latency, args.jitter, args.failure_rate, seed=args.seed)
+    with corpus.serve(network):
+        started = time.perf_counter()
+        with _quiet():
+            links = crawl(corpus.seeds, max_depth=args.depth, max_pages=args.max_pages,
+                          db_path=os.path.join(workdir, f"frontier_{time.monotonic_ns()}.db"),
+                          concurrency=args.concurrency, proxy=network.proxy)
+        elapsed = time.perf_counter() - started
+    pages = sum(site.requests for site in network.sites.values())
+    fetched_bytes = sum(site.requests * len(site.body) for site in network.sites.values())
+    return {
+        "seconds": elapsed,
+        "pages": pages,
+        "links": len(links),
+        "socks_connections": network.socks_connections,
+        "socks_failures": network.socks_failures,
+        "pages_per_sec": pages / elapsed,
+        "mb_per_sec": fetched_bytes / 1024 / 1024 / elapsed,
+    }
+
+
+def bench_extract(corpus, workdir, args):
+    from link_extractor import extract_onion_links
+
+    pages = [(f"http://{host}/", page.encode("utf-8")) for host, page in corpus.pages.items()]
+    started = time.perf_counter()
+    links = sum(len(extract_onion_links(body, url, max_bytes=0)) for url, body in pages)
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "pages": len(pages),
+        "links": links,
+        "links_per_sec": links / elapsed,
+        "mb_per_sec": corpus.total_bytes / 1024 / 1024 / elapsed,
+    }
+
+
+def synthetic_links(corpus, count):
+    hosts = corpus.hosts
+    return [{"url": f"http://{hosts[i % len(hosts)]}/page/{i}", "text": f"Service {i}",
+             "found_at": f"http://{hosts[0]}/"} for i in range(count)]
+
+
+def bench_save(corpus, workdir, args):
+    import script
+
+    links = synthetic_links(corpus, args.links)
+    json_file = os.path.join(workdir, "onion_scan_results.json")
+    started = time.perf_counter()
+    with _quiet():
+        script.save_to_json(links, True, script.generate_fake_data(), json_file=json_file,
+                            db_path=os.path.join(workdir, f"scans_{time.monotonic_ns()}.db"))
+    elapsed = time.perf_counter() - started
+    return {"seconds": elapsed, "links": len(links), "links_per_sec": len(links) / elapsed}
+
+
+def bench_pdf(corpus, workdir, args):
+    import config
+    from pdf_generator import create_pdf_report
+
+    json_file = os.path.join(workdir, "onion_scan_results.json")
+    if not os.path.exists(json_file):
+        bench_save(corpus, workdir, args)
+    # Grafik önbelleği kapalı: her tekrar grafikleri yeniden çizer
+    config.CHART_CACHE_DIR = ""
+    output_file = os.path.join(workdir, "onion_scan_report.pdf")
+    started = time.perf_counter()
+    with _quiet():
+        ok = create_pdf_report(json_file, output_file, large=args.links > config.LARGE_REPORT_THRESHOLD)
+    elapsed = time.perf_counter() - started
+    if not ok:
+        raise RuntimeError("PDF oluşturulamadı")
+    return {"seconds": elapsed, "links": args.links, "pdf_kb": os.path.getsize(output_file) // 1024}
+
+
+BENCHES = {"fetch": bench_fetch, "extract": bench_extract, "save": bench_save, "pdf": bench_pdf}
+
+
+def run_stage(stage, corpus, workdir, args):
+    """Aşamayı `repeat` kez çalıştır; her metriğin medyanını döndür"""
+    runs = [BENCHES[stage](corpus, workdir, args) for _ in range(args.repeat)]
+    result = {"stage": stage}
+    for key in runs[0]:
+        value = statistics.median(run[key] for run in runs)
+        result[key] = round(value, 4) if isinstance(value, float) else value
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=ROOT, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Aşama sürelerini önceki sonuçla karşılaştır; gerileyen aşamaların listesini döndür"""
+    regressions = []
+    previous = {stage["stage"]: stage for stage in baseline["stages"]}
+    for stage in results["stages"]:
+        before = previous.get(stage["stage"])
+        if not before or not before.get("seconds"):
+            continue
+        change = stage["seconds"] / before["seconds"] - 1
+        print(json.dumps({"stage": stage["stage"], "baseline_seconds": before["seconds"],
+                          "seconds": stage["seconds"], "change": round(change, 4),
+                          "regression": change > tolerance}), flush=True)
+        if change > tolerance:
+            regressions.append(stage["stage"])
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", default=",".join(STAGES))
+    parser.add_argument("--sites", type=int, default=50, help="korpustaki onion sitesi sayısı")
+    parser.add_argument("--page-kb", type=int, default=64, help="sayfa başına boyut (KB)")
+    parser.add_argument("--links-per-kb", type=float, default=4.0, help="link yoğunluğu")
+    parser.add_argument("--latency", type=float, default=0.02, help="SOCKS bağlantısı başına gecikme (sn)")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--max-pages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--links", type=int, default=2000, help="save/pdf aşamalarındaki link sayısı")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="izin verilen göreli yavaşlama")
+    args = parser.parse_args()
+
+    import config
+    from synthetic_corpus import SyntheticCorpus
+
+    results = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "params": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "stages": [],
+    }
+    corpus = SyntheticCorpus(args.sites, args.page_kb * 1024, args.links_per_kb, seed=args.seed)
+    with tempfile.TemporaryDirectory(prefix="bench_offline_") as workdir:
+        # Sayfa önbelleği kapalı: her tekrar sayfaları yeniden indirir
+        config.FETCH_CACHE_MAX_BYTES = 0
+        for stage in args.stages.split(","):
+            result = run_stage(stage, corpus, workdir, args)
+            results["stages"].append(result)
+            print(json.dumps(result), flush=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ Gerileme: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""PDF rapor benchmark'ı: link sayısına göre üretim süresi ve tepe bellek (peak RSS).
+
+Sentetik sonuç dosyası akış halinde yazılır; her ölçüm ayrı bir alt süreçte yapılır.
+`normal` modu yalnızca ilk 20 linki basar, `large` modu tüm linkleri LongTable
+parçaları halinde basar. Kullanım:
+
+    python benchmarks/bench_pdf_report.py --links 10000,100000,1000000 --modes large
+    python benchmarks/bench_pdf_report.py --links 0 --modes normal --dark-multiplier 1000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def write_synthetic_results(path, link_count, dark_multiplier=1):
+    """`onion_scan_results.json` biçiminde sentetik dosya yaz (linkler bellekte tutulmaz)"""
+    from script import generate_fake_data
+
+    dark_web_data = {key: rows * dark_multiplier for key, rows in generate_fake_data().items()}
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{\n  "scan_date": "2024-01-01T00:00:00",\n  "tor_connection": true,\n')
+        f.write(f'  "total_onion_links": {link_count},\n  "onion_links": [')
+        for i in range(link_count):
+            link = {
+                "url": f"http://{i:056d}.onion/page/{i}",
+                "text": f"Service {i} mirror",
+                "found_at": "http://seed.onion/",
+            }
+            f.write(",\n    " if i else "\n    ")
+            f.write(json.dumps(link))
+        f.write("\n  ],\n")
+        summary = {"successful_connections": 1, "unique_domains": link_count, "scan_duration": "bench"}
+        f.write(f'  "scan_summary": {json.dumps(summary)},\n')
+        f.write(f'  "dark_web_data": {json.dumps(dark_web_data, ensure_ascii=False)}\n}}\n')
+
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode, json_file):
+    from pdf_generator import create_pdf_report
+
+    output_file = json_file[:-len(".json")] + f".{mode}.pdf"
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    create_pdf_report(json_file, output_file, large=(mode == "large"))
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": mode,
+        "seconds": round(elapsed, 2),
+        "pdf_mb": round(os.path.getsize(output_file) / 1024 / 1024, 1),
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", default="10000,100000")
+    parser.add_argument("--modes", default="normal,large")
+    parser.add_argument("--dark-multiplier", type=int, default=1,
+                        help="dark_web_data kategorilerindeki satırları bu kadar çoğalt")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--json-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            result = run_mode(args.worker, args.json_file)
+            sys.stdout = stdout
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for link_count in (int(n) for n in args.links.split(",")):
+            json_file = os.path.join(workdir, f"results_{link_count}.json")
+            write_synthetic_results(json_file, link_count, args.dark_multiplier)
+            for mode in args.modes.split(","):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--worker", mode, "--json-file", json_file],
+                    capture_output=True, text=True, check=True, cwd=workdir,
+                ).stdout
+                result = dict(links=link_count, dark_multiplier=args.dark_multiplier,
+                              **json.loads(output.strip().splitlines()[-1]))
+                print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
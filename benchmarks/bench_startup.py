@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Başlangıç süresi benchmark'ı: modül içe aktarma süreleri ve soğuk başlangıçtan ilk isteğe kadar geçen süre.
+
+Her ölçüm yeni bir Python sürecinde yapılır. İlk istek süresi, sahte Tor ağındaki
+(`mock_socks.py`) tohum sitenin ilk isteği aldığı ana kadar ölçülür. Sonuçlar
+`--history` dosyasına (JSON satırları) eklenir ve bir önceki kayıtla karşılaştırılır;
+`--budget-ms` aşılırsa çıkış kodu 1 olur. Kullanım:
+
+    python benchmarks/bench_startup.py --repeat 5 --budget-ms 500
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+HISTORY_FILE = os.path.join(ROOT, "benchmarks", "startup_history.jsonl")
+IMPORTS = {
+    "python": "pass",
+    "script": "import script",
+    "pdf_generator": "import pdf_generator",
+    "report_stack": "import reportlab.platypus, matplotlib.figure",
+}
+FIRST_REQUEST = """
+import script
+script.get_onion_links(seeds=[{url!r}], proxy={proxy!r}, max_depth=0, db_path={db_path!r})
+"""
+
+
+def child_env(workdir):
+    return dict(os.environ, PYTHONPATH=ROOT, FETCH_CACHE_MAX_BYTES="0",
+                CRAWL_DB_PATH=os.path.join(workdir, "crawl.db"))
+
+
+def import_ms(statement, workdir):
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True, env=child_env(workdir), cwd=workdir)
+    return (time.perf_counter() - started) * 1000
+
+
+def first_request_ms(network, site, url, workdir):
+    """Süreç başlatılmasından tohum sitenin ilk isteği almasına kadar geçen süre"""
+    code = FIRST_REQUEST.format(url=url, proxy=network.proxy, db_path=os.path.join(workdir, "crawl.db"))
+    before = site.requests
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", code], env=child_env(workdir), cwd=workdir,
+                               stdout=subprocess.DEVNULL)
+    while site.requests == before and process.poll() is None:
+        time.sleep(0.0005)
+    elapsed = (time.perf_counter() - started) * 1000
+    if process.wait() != 0 or site.requests == before:
+        raise RuntimeError("İlk istek ölçülemedi")
+    return elapsed
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(repeat):
+    from mock_socks import MockTorNetwork
+    from onion_address import v3_address
+
+    host = v3_address(b"s" * 32)
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir, MockTorNetwork() as network:
+        site = network.add_site(host, "<html><body>seed</body></html>")
+        for name, statement in IMPORTS.items():
+            results[f"import_{name}_ms"] = statistics.median(import_ms(statement, workdir) for _ in range(repeat))
+        results["first_request_ms"] = statistics.median(
+            first_request_ms(network, site, f"http://{host}/", workdir) for _ in range(repeat)
+        )
+    return {name: round(value, 1) for name, value in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--history", default=HISTORY_FILE, help="boş değer geçmişe yazmayı kapatır")
+    parser.add_argument("--budget-ms", type=float, help="first_request_ms için üst sınır")
+    args = parser.parse_args()
+
+    record = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        **measure(args.repeat),
+    }
+
+    previous = None
+    if args.history and os.path.exists(args.history):
+        with open(args.history, encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        previous = json.loads(lines[-1]) if lines else None
+    if previous:
+        record["first_request_delta_ms"] = round(record["first_request_ms"] - previous["first_request_ms"], 1)
+    if args.history:
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    print(json.dumps(record))
+    if args.budget_ms is not None and record["first_request_ms"] > args.budget_ms:
+        print(f"❌ Başlangıç bütçesi aşıldı: {record['first_request_ms']} ms > {args.budget_ms} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""İzleme listesi benchmark'ı: liste boyutuna göre indeks kurulum süresi, bellek ve sayfa başına eşleşme süresi.
+
+Her liste boyutu ayrı bir süreçte ölçülür (tepe RSS birbirini etkilemesin). Girdilerin
+üçte biri alan adı, üçte biri e-posta, kalanı tek veya iki kelimelik marka adıdır;
+sayfaların bir kısmına listeden rastgele girdiler eklenir. Kullanım:
+
+    python benchmarks/bench_watchlist.py --entries 100000,1000000 --pages 200 --page-kb 64
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def entry_line(n):
+    if n % 3 == 0:
+        return f"domain: customer{n}.com"
+    if n % 3 == 1:
+        return f"email: security{n}@corp{n}.net"
+    return f"keyword: brand{n} bank" if n % 2 else f"keyword: brand{n}"
+
+
+def write_watchlist(path, count):
+    with open(path, "w", encoding="utf-8") as f:
+        for n in range(count):
+            f.write(entry_line(n) + "\n")
+
+
+def synthetic_pages(count, page_kb, entries, hit_ratio=0.2, seed=1):
+    from synthetic_corpus import hidden_wiki_page, onion_hosts
+
+    rng = random.Random(seed)
+    hosts = onion_hosts(200, seed)
+    pages = []
+    for n in range(count):
+        page = hidden_wiki_page(rng, hosts, page_kb * 1024)
+        if rng.random() < hit_ratio:
+            hit = entry_line(rng.randrange(entries)).partition(": ")[2]
+            page = page.replace("</body>", f"<p>Leaked from mail.{hit}</p></body>")
+        pages.append((page, f"http://{hosts[n % len(hosts)]}/"))
+    return pages
+
+
+def run(entries, pages, page_kb):
+    from watchlist import Watchlist
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "watchlist.txt")
+        write_watchlist(path, entries)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        watchlist = Watchlist.from_file(path)
+        build_seconds = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    corpus = synthetic_pages(pages, page_kb, entries)
+    started = time.perf_counter()
+    alerts = sum(len(watchlist.alerts(text, source)) for text, source in corpus)
+    seconds = time.perf_counter() - started
+    size = sum(len(text) for text, _ in corpus)
+    return {
+        "entries": len(watchlist),
+        "build_seconds": round(build_seconds, 3),
+        "index_mb": round((rss_after - rss_before) / 1024, 1),  # ru_maxrss Linux'ta KB
+        "pages": pages,
+        "page_kb": page_kb,
+        "alerts": alerts,
+        "ms_per_page": round(seconds / pages * 1000, 3),
+        "mb_per_second": round(size / seconds / 1024 / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", default="100000,1000000")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.entries.split(",")]
+    if len(sizes) == 1:
+        print(json.dumps(run(sizes[0], args.pages, args.page_kb)), flush=True)
+        return
+    for size in sizes:
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--entries", str(size),
+                        "--pages", str(args.pages), "--page-kb", str(args.page_kb)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tarayıcı ayarları (ortam değişkenleriyle değiştirilebilir)"""
+import os
+
+
+def _env_int(name, default):
+    """Ortam değişkenini tam sayı olarak oku, hatalıysa varsayılanı kullan"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Tor SOCKS5 proxy
+TOR_SOCKS_HOST = os.environ.get("TOR_SOCKS_HOST", "127.0.0.1")
+TOR_SOCKS_PORT = _env_int("TOR_SOCKS_PORT", 9050)
+# Ayrı Tor devreleri için ek SOCKS portları (virgülle ayrılmış, ör. "9050,9052,9053")
+TOR_SOCKS_PORTS = [
+    int(port) for port in os.environ.get("TOR_SOCKS_PORTS", str(TOR_SOCKS_PORT)).split(",") if port.strip()
+]
+
+# Tor kontrol portu ve veri dizini (önyükleme takibi ve çalıştırmalar arası önbellek için)
+TOR_CONTROL_PORT = _env_int("TOR_CONTROL_PORT", 9051)
+TOR_DATA_DIR = os.environ.get("TOR_DATA_DIR", "/tmp/tor")
+TOR_BOOTSTRAP_TIMEOUT = _env_int("TOR_BOOTSTRAP_TIMEOUT", 120)
+
+# İndirme ayarları
+FETCH_TIMEOUT = _env_int("FETCH_TIMEOUT", 30)
+# Host gecikme geçmişine göre uyarlanan zaman aşımının alt ve üst sınırı (saniye)
+FETCH_MIN_TIMEOUT = _env_int("FETCH_MIN_TIMEOUT", 5)
+FETCH_MAX_TIMEOUT = _env_int("FETCH_MAX_TIMEOUT", 90)
+# Geçici hatalarda yeniden deneme sayısı ve üstel beklemenin tabanı/üst sınırı (saniye)
+FETCH_RETRIES = _env_int("FETCH_RETRIES", 2)
+RETRY_BACKOFF_BASE = _env_int("RETRY_BACKOFF_BASE", 1)
+RETRY_BACKOFF_MAX = _env_int("RETRY_BACKOFF_MAX", 30)
+# Devre kesici: art arda bu kadar başarısızlıktan sonra host bekleme süresi (saniye) boyunca denenmez
+BREAKER_THRESHOLD = _env_int("BREAKER_THRESHOLD", 3)
+BREAKER_COOLDOWN = _env_int("BREAKER_COOLDOWN", 3600)
+BREAKER_MAX_COOLDOWN = _env_int("BREAKER_MAX_COOLDOWN", 24 * 3600)
+# Host sağlık durumu (gecikme, devre kesici) taramalar arasında bu dosyada saklanır
+HOST_HEALTH_DB_PATH = os.environ.get("HOST_HEALTH_DB_PATH", "host_health.db")
+FETCH_CONCURRENCY = _env_int("FETCH_CONCURRENCY", 8)
+MAX_FETCH_CONCURRENCY = _env_int("MAX_FETCH_CONCURRENCY", 64)
+# Host başına eşzamanlı istek sınırı ve istek hızı (dakikada, en fazla HOST_BURST birikmiş hak)
+HOST_MAX_IN_FLIGHT = _env_int("HOST_MAX_IN_FLIGHT", 2)
+HOST_REQUESTS_PER_MINUTE = _env_int("HOST_REQUESTS_PER_MINUTE", 60)
+HOST_BURST = _env_int("HOST_BURST", 4)
+# Zamanlayıcıda bekletilecek en fazla URL (toplam ve host başına); kalanlar frontier'da bekler
+SCHEDULER_LOOKAHEAD = _env_int("SCHEDULER_LOOKAHEAD", 1000)
+SCHEDULER_HOST_QUEUE = _env_int("SCHEDULER_HOST_QUEUE", 50)
+USER_AGENT = os.environ.get("USER_AGENT", "Mozilla/5.0 (compatible; TorScanner/1.0)")
+
+# Tarayıcı (crawler) ayarları
+CRAWL_MAX_DEPTH = _env_int("CRAWL_MAX_DEPTH", 1)
+CRAWL_MAX_PAGES = _env_int("CRAWL_MAX_PAGES", 200)
+CRAWL_DB_PATH = os.environ.get("CRAWL_DB_PATH", "crawl_frontier.db")
+# Yarım kalan tarama normalde yalnızca aynı kaynaklarla devam ettirilir; CRAWL_RESUME=1 (veya --resume) her zaman devam eder
+CRAWL_RESUME = bool(_env_int("CRAWL_RESUME", 0))
+
+# Tor canlılık kontrolü önbelleği (saniye)
+TOR_STATUS_TTL = _env_int("TOR_STATUS_TTL", 300)
+TOR_STATUS_FAIL_TTL = _env_int("TOR_STATUS_FAIL_TTL", 15)
+
+# Sayfa gövdesi için üst sınır (bayt); daha büyük sayfaların kalanı okunmaz
+MAX_BODY_BYTES = _env_int("MAX_BODY_BYTES", 10 * 1024 * 1024)
+
+# Sızıntı göstergesi çıkarımı için süreç sayısı (0: tarayıcıyla aynı süreçte çalışır)
+INDICATOR_WORKERS = _env_int("INDICATOR_WORKERS", 2)
+# İzleme listesi dosyası (satır başına alan adı, e-posta veya anahtar kelime; boş değer kapatır)
+WATCHLIST_FILE = os.environ.get("WATCHLIST_FILE", "")
+# Bu benzerlik yüzdesini aşan sayfalar önceki bir sayfanın aynası sayılır, linkleri ayrıştırılmaz (0: kapalı)
+MIRROR_SIMILARITY = _env_int("MIRROR_SIMILARITY", 85)
+
+# Tarama sonuç deposu
+SCAN_DB_PATH = os.environ.get("SCAN_DB_PATH", "onion_scans.db")
+STORE_BATCH_SIZE = _env_int("STORE_BATCH_SIZE", 1000)
+
+# Sayfa önbelleği (FETCH_CACHE_MAX_BYTES=0 önbelleği kapatır)
+FETCH_CACHE_DIR = os.environ.get("FETCH_CACHE_DIR", ".fetch_cache")
+FETCH_CACHE_MAX_BYTES = _env_int("FETCH_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+
+# Bu sayıdan fazla link içeren taramalar için PDF akış modunda (tüm linkler, sınırlı bellek) üretilir
+LARGE_REPORT_THRESHOLD = _env_int("LARGE_REPORT_THRESHOLD", 5000)
+
+# Grafik önbelleği: aynı verinin grafikleri yeniden çizilmez (boş değer önbelleği kapatır)
+CHART_CACHE_DIR = os.environ.get("CHART_CACHE_DIR", ".chart_cache")
+
+# Tarama metrikleri bu dosyaya Prometheus metin biçiminde yazılır (boş değer kapatır)
+METRICS_FILE = os.environ.get("METRICS_FILE", "")
+
+# SCAN_ONLY=1: yalnızca JSON/depo çıktısı üretilir, PDF rapor yığını (reportlab, matplotlib) hiç yüklenmez
+SCAN_ONLY = bool(_env_int("SCAN_ONLY", 0))
+
+# Container filosu (automation.py): eşzamanlı çalıştırma sayısı, çalıştırma başına zaman aşımı (saniye), yeniden deneme
+FLEET_CONCURRENCY = _env_int("FLEET_CONCURRENCY", 1)
+FLEET_RUN_TIMEOUT = _env_int("FLEET_RUN_TIMEOUT", 300)
+FLEET_RETRIES = _env_int("FLEET_RETRIES", 1)
+
+# Sonuç parçalarının birleştirilmesi (result_shards.py): aynı anda açık tutulan en fazla parça sayısı
+MERGE_FAN_IN = _env_int("MERGE_FAN_IN", 256)
+
+# Tarama servisi (python3 script.py --daemon): yerel HTTP API adresi, iş çıktıları dizini, saklanan iş sayısı
+DAEMON_HOST = os.environ.get("DAEMON_HOST", "127.0.0.1")
+DAEMON_PORT = _env_int("DAEMON_PORT", 8765)
+DAEMON_OUTPUT_DIR = os.environ.get("DAEMON_OUTPUT_DIR", "jobs")
+DAEMON_JOB_HISTORY = _env_int("DAEMON_JOB_HISTORY", 1000)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+import pytest
+
+import fetch_cache
+import host_health
+import indicators
+import metrics
+import watchlist
+
+
+@pytest.fixture(autouse=True)
+def isolated_fetch_cache(tmp_path, monkeypatch):
+    """Her test kendi boş sayfa/grafik önbelleği, host sağlık deposu, izleme listesi ve sıfırlanmış metriklerle çalışsın"""
+    monkeypatch.setattr("config.FETCH_CACHE_DIR", str(tmp_path / "fetch_cache"))
+    monkeypatch.setattr("config.CHART_CACHE_DIR", str(tmp_path / "chart_cache"))
+    monkeypatch.setattr(fetch_cache, "_cache", None)
+    monkeypatch.setattr("config.HOST_HEALTH_DB_PATH", str(tmp_path / "host_health.db"))
+    monkeypatch.setattr(host_health, "_health", None)
+    monkeypatch.setattr("config.WATCHLIST_FILE", "")
+    monkeypatch.setattr(watchlist, "_watchlist", None)
+    monkeypatch.setattr(watchlist, "_watchlist_key", None)
+    metrics.reset()
+    yield
+    if fetch_cache._cache is not None:
+        fetch_cache._cache.close()
+    if host_health._health is not None:
+        host_health._health.close()
+    indicators.shutdown_pool()
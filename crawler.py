@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""Derinlik sınırlı, diskte kalıcı ve kaldığı yerden devam edebilen .onion tarayıcısı"""
+import asyncio
+import json
+import sqlite3
+import time
+from array import array
+from urllib.parse import urlsplit
+
+import config
+import metrics
+from async_fetcher import fetch, release_idle, run_sync
+from fetch_cache import get_fetch_cache
+from host_health import OPEN, PERMANENT, TRANSIENT, backoff_delay, classify, get_host_health
+from host_scheduler import HostScheduler
+from indicators import analyze_page, get_indicator_pool
+from link_extractor import extract_onion_links
+from mirrors import MirrorIndex, fingerprint
+from onion_address import OnionIndex, canonicalize_url, is_valid_v3, onion_domain
+from tor_pool import get_pool
+from watchlist import get_watchlist
+
+# Frontier durumları
+PENDING = 0
+IN_PROGRESS = 1
+DONE = 2
+FAILED = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    host TEXT,
+    depth INTEGER NOT NULL,
+    priority REAL NOT NULL,
+    found_at TEXT,
+    state INTEGER NOT NULL DEFAULT 0,
+    status INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS frontier_queue ON frontier (state, priority, id);
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    text TEXT NOT NULL,
+    found_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS links_url ON links (url);
+CREATE TABLE IF NOT EXISTS indicators (
+    category TEXT NOT NULL,
+    key TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (category, key)
+);
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY,
+    entry TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    matched TEXT,
+    source TEXT NOT NULL,
+    UNIQUE (entry, kind, source)
+);
+CREATE TABLE IF NOT EXISTS seeds (
+    url TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    fingerprint BLOB NOT NULL,
+    mirror_of TEXT
+);
+"""
+
+
+def url_priority(url, depth):
+    """Küçük değer önce taranır: sığ sayfalar ve servis kök sayfaları öne alınır"""
+    path = urlsplit(url).path
+    return depth + (0.0 if path in ("", "/") else 0.5)
+
+
+def url_host(url):
+    """Zamanlayıcı anahtarı: URL'nin onion servisi (alt alan adları aynı servise sayılır)"""
+    return onion_domain(urlsplit(url).hostname)
+
+
+def crawlable_url(href, base=None):
+    """Linki normalleştir; geçerli bir v3 .onion adresine gidiyorsa URL'yi, değilse None döndür"""
+    url = canonicalize_url(href, base)
+    if url is None or not is_valid_v3(onion_domain(urlsplit(url).hostname)):
+        return None
+    return url
+
+
+class CrawlFrontier:
+    """SQLite'ta tutulan öncelikli tarama kuyruğu.
+
+    `frontier` tablosundaki tekil URL sütunu aynı zamanda ziyaret edilenler
+    kümesidir: bir URL bir kez eklendikten sonra bir daha kuyruğa girmez.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or config.CRAWL_DB_PATH
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._migrate()
+        # Yarıda kesilen indirmeler tekrar kuyruğa alınır
+        self.db.execute("UPDATE frontier SET state = ? WHERE state = ?", (PENDING, IN_PROGRESS))
+        self.db.commit()
+
+    def _migrate(self):
+        """Host sütunu olmayan eski frontier dosyalarına sütunu ekle ve doldur"""
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(frontier)")}
+        if "host" in columns:
+            return
+        self.db.execute("ALTER TABLE frontier ADD COLUMN host TEXT")
+        rows = self.db.execute("SELECT id, url FROM frontier").fetchall()
+        self.db.executemany("UPDATE frontier SET host = ? WHERE id = ?", [(url_host(url), id_) for id_, url in rows])
+
+    def close(self):
+        self.db.close()
+
+    def reset(self, seeds=()):
+        """Önceki taramanın tüm durumunu sil ve yeni taramanın kaynaklarını kaydet"""
+        self.db.execute("DELETE FROM seeds")
+        self.db.executemany("INSERT OR IGNORE INTO seeds (url) VALUES (?)", ((seed,) for seed in seeds))
+        self.db.execute("DELETE FROM frontier")
+        self.db.execute("DELETE FROM links")
+        self.db.execute("DELETE FROM indicators")
+        self.db.execute("DELETE FROM alerts")
+        self.db.execute("DELETE FROM pages")
+        self.db.commit()
+
+    def seeds(self):
+        """Frontier'ı başlatan kaynak URL'ler (sıralı)"""
+        return [url for url, in self.db.execute("SELECT url FROM seeds ORDER BY url")]
+
+    def has_pending(self):
+        row = self.db.execute("SELECT 1 FROM frontier WHERE state = ? LIMIT 1", (PENDING,)).fetchone()
+        return row is not None
+
+    def add(self, url, depth, found_at=None, commit=True):
+        """URL'yi kuyruğa ekle; daha önce görüldüyse False döndür"""
+        cursor = self.db.execute(
+            "INSERT OR IGNORE INTO frontier (url, host, depth, priority, found_at) VALUES (?, ?, ?, ?, ?)",
+            (url, url_host(url), depth, url_priority(url, depth), found_at),
+        )
+        if commit:
+            self.db.commit()
+        return cursor.rowcount == 1
+
+    def pop(self, skip_hosts=()):
+        """En yüksek öncelikli bekleyen URL'yi (url, depth, host) al ve işleniyor olarak işaretle.
+
+        `skip_hosts` içindeki host'ların URL'leri atlanır (kuyruğu dolu host'lar diğerlerini bekletmesin).
+        """
+        skip_hosts = list(skip_hosts)
+        exclude = f"AND host NOT IN ({', '.join('?' * len(skip_hosts))})" if skip_hosts else ""
+        row = self.db.execute(
+            f"SELECT url, depth, host FROM frontier WHERE state = ? {exclude} ORDER BY priority, id LIMIT 1",
+            (PENDING, *skip_hosts),
+        ).fetchone()
+        if row is None:
+            return None
+        self.db.execute("UPDATE frontier SET state = ? WHERE url = ?", (IN_PROGRESS, row[0]))
+        self.db.commit()
+        return row
+
+    def requeue(self, urls):
+        """Gönderilmeden kalan URL'leri tekrar bekleyen durumuna al"""
+        self.db.executemany("UPDATE frontier SET state = ? WHERE url = ?", [(PENDING, url) for url in urls])
+        self.db.commit()
+
+    def complete(self, url, status, links, follow_depth=None, indicators=(), alerts=(), signature=None,
+                 mirror_of=None):
+        """Sayfayı bitti olarak işaretle, linkleri, göstergeleri ve uyarıları kaydet, takip edilecekleri kuyruğa ekle.
+
+        Linkler normalleştirilir; geçersiz adresler atılır, daha önce bulunan URL'ler tekrar kaydedilmez.
+        Sayfanın içerik imzası ve aynası olduğu sayfa (`mirror_of`) devam eden taramalar için saklanır.
+        """
+        if signature is not None:
+            self.db.execute(
+                "INSERT OR REPLACE INTO pages (url, fingerprint, mirror_of) VALUES (?, ?, ?)",
+                (url, signature.tobytes(), mirror_of),
+            )
+        self.db.executemany(
+            "INSERT OR IGNORE INTO indicators (category, key, record) VALUES (?, ?, ?)",
+            ((category, key, json.dumps(record, ensure_ascii=False)) for category, key, record in indicators),
+        )
+        self.db.executemany(
+            "INSERT OR IGNORE INTO alerts (entry, kind, matched, source) VALUES (?, ?, ?, ?)",
+            ((alert['entry'], alert['kind'], alert['matched'], alert['source']) for alert in alerts),
+        )
+        for link in links:
+            target = crawlable_url(link['url'], base=url)
+            if target is None:
+                continue
+            self.db.execute(
+                "INSERT OR IGNORE INTO links (url, text, found_at) VALUES (?, ?, ?)",
+                (target, link['text'], link['found_at']),
+            )
+            if follow_depth is not None:
+                self.add(target, follow_depth, found_at=url, commit=False)
+        self.db.execute(
+            "UPDATE frontier SET state = ?, status = ? WHERE url = ?", (DONE, status, url)
+        )
+        self.db.commit()
+
+    def fail(self, url, error):
+        self.db.execute(
+            "UPDATE frontier SET state = ?, error = ? WHERE url = ?", (FAILED, str(error)[:200], url)
+        )
+        self.db.commit()
+
+    def links(self):
+        """Şimdiye kadar bulunan tüm linkleri bulunma sırasıyla üret"""
+        for url, text, found_at in self.db.execute("SELECT url, text, found_at FROM links ORDER BY id"):
+            yield {'url': url, 'text': text, 'found_at': found_at}
+
+    def indicators(self):
+        """Sayfalardan çıkarılan göstergeleri (kategori, anahtar, kayıt) olarak bulunma sırasıyla üret"""
+        for category, key, record in self.db.execute("SELECT category, key, record FROM indicators ORDER BY rowid"):
+            yield category, key, json.loads(record)
+
+    def alerts(self):
+        """Sayfalarda bulunan izleme listesi eşleşmelerini bulunma sırasıyla üret"""
+        for entry, kind, matched, source in self.db.execute(
+                "SELECT entry, kind, matched, source FROM alerts ORDER BY id"):
+            yield {'entry': entry, 'kind': kind, 'matched': matched, 'source': source, 'context': 'page'}
+
+    def signatures(self):
+        """Ayna olmayan sayfaların içerik imzalarını kayıt sırasıyla üret"""
+        for url, raw in self.db.execute("SELECT url, fingerprint FROM pages WHERE mirror_of IS NULL ORDER BY rowid"):
+            yield url, array("I", raw)
+
+    def mirror_groups(self):
+        """Aynı içeriği sunan sayfa grupları: [{'original': url, 'mirrors': [url, ...]}, ...]"""
+        groups = {}
+        for url, original in self.db.execute(
+                "SELECT url, mirror_of FROM pages WHERE mirror_of IS NOT NULL ORDER BY rowid"):
+            groups.setdefault(original, []).append(url)
+        return [{'original': original, 'mirrors': urls} for original, urls in groups.items()]
+
+    def stats(self):
+        counts = dict(self.db.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state"))
+        return {
+            'pending': counts.get(PENDING, 0),
+            'done': counts.get(DONE, 0),
+            'failed': counts.get(FAILED, 0),
+        }
+
+
+def _page_links(result, url, cache):
+    """Sayfanın linklerini döndür; içerik önbellektekiyle aynıysa ayrıştırmayı atla"""
+    if cache is not None and result.cache_status in ("hit", "unchanged"):
+        entry = cache.lookup(result.url)
+        if entry is not None and entry.links is not None:
+            return entry.links
+    started = time.perf_counter()
+    links = extract_onion_links(result.body, url, encoding=result.encoding)
+    metrics.observe("fetch_parse_seconds", time.perf_counter() - started)
+    if cache is not None and result.cache_status:
+        cache.store_links(result.url, links)
+    return links
+
+
+def _page_mirror(result, url, mirrors):
+    """Ham gövdenin imzasını hesapla; sayfa daha önce görülen bir sayfanın aynasıysa o sayfanın URL'sini döndür"""
+    if mirrors is None:
+        return None, None
+    started = time.perf_counter()
+    signature = fingerprint(result.body)
+    metrics.observe("page_fingerprint_seconds", time.perf_counter() - started)
+    if signature is None:
+        return None, None
+    return signature, mirrors.check(url, signature)
+
+
+async def _analyze_page(result, url):
+    """Sayfadaki sızıntı göstergelerini ve izleme listesi eşleşmelerini çıkar.
+
+    Havuz varsa iş event loop'u bekletmeden ayrı süreçlerde yapılır.
+    """
+    started = time.perf_counter()
+    pool = get_indicator_pool()
+    if pool is None:
+        found, alerts = analyze_page(result.body, result.encoding, url)
+    else:
+        found, alerts = await asyncio.get_running_loop().run_in_executor(
+            pool, analyze_page, result.body, result.encoding, url
+        )
+    metrics.observe("indicator_extract_seconds", time.perf_counter() - started)
+    metrics.inc("indicators_found_total", len(found))
+    metrics.inc("watchlist_alerts_total", len(alerts))
+    for alert in alerts:
+        print(f"🚨 İzleme listesi eşleşmesi: {alert['entry']} ({alert['kind']}) -> {url}")
+    return found, alerts
+
+
+async def _fetch_with_retry(url, timeout, pool, cache, health):
+    """Geçici hatalarda üstel bekleme ile yeniden dene; sonuçları host sağlık durumuna yaz.
+
+    `timeout` verilmediyse host'un gecikme geçmişine göre seçilir.
+    """
+    host = urlsplit(url).hostname
+    for attempt in range(config.FETCH_RETRIES + 1):
+        started = time.monotonic()
+        try:
+            result = await fetch(url, timeout=timeout or health.timeout_for(host), pool=pool, cache=cache)
+        except Exception as e:
+            kind = classify(e)
+            if kind == PERMANENT:
+                health.release(host)
+                raise
+            if health.record_failure(host, e) == OPEN or kind != TRANSIENT or attempt == config.FETCH_RETRIES:
+                raise
+            metrics.inc("fetch_retries_total")
+            await asyncio.sleep(backoff_delay(attempt))
+        except BaseException:
+            health.release(host)
+            raise
+        else:
+            health.record_success(host, time.monotonic() - started)
+            return result
+
+
+async def _crawl(frontier, max_depth, max_pages, pool, timeout, cache, health, scheduler, mirrors=None):
+    """Frontier'dan URL çekip host zamanlayıcısı üzerinden dağıtan döngü"""
+    fetched = 0
+    tasks = {}
+
+    async def visit(url, depth):
+        try:
+            result = await _fetch_with_retry(url, timeout, pool, cache, health)
+        except Exception as e:
+            print(f"❌ {url} erişilemedi: {e}")
+            frontier.fail(url, e)
+        else:
+            links, found, alerts = [], [], []
+            signature = original = None
+            if result.status == 200:
+                # Aynalar ayrıştırılmaz: linkleri ve göstergeleri özgün sayfadan zaten alındı
+                signature, original = _page_mirror(result, url, mirrors)
+                if original is None:
+                    links = _page_links(result, url, cache)
+                    found, alerts = await _analyze_page(result, url)
+            follow_depth = depth + 1 if depth < max_depth else None
+            frontier.complete(url, result.status, links, follow_depth, found, alerts, signature, original)
+            if original is not None:
+                metrics.inc("mirror_pages_total")
+                print(f"🪞 {url} (derinlik {depth}): {original} sayfasının aynası, ayrıştırılmadı")
+            else:
+                print(f"✅ {url} (derinlik {depth}): {len(links)} .onion linki bulundu")
+
+    try:
+        while True:
+            # Zamanlayıcıyı frontier'dan doldur; sayfa bütçesine sığmayanlar taramanın sonunda geri bırakılır
+            room = config.SCHEDULER_LOOKAHEAD - scheduler.queued
+            full = scheduler.full_hosts()
+            while room > 0:
+                entry = frontier.pop(skip_hosts=full)
+                if entry is None:
+                    break
+                url, depth, host = entry
+                scheduler.submit(host, (url, depth))
+                if scheduler.is_full(host):
+                    full.add(host)
+                room -= 1
+
+            while fetched + len(tasks) < max_pages and (ready := scheduler.pop_ready()) is not None:
+                host, (url, depth) = ready
+                if not health.allow(urlsplit(url).hostname):
+                    # Devre kesici açık: bilinen ölü host'a zaman harcanmaz, sayfa bütçesinden düşülmez
+                    scheduler.release(host, refund=True)
+                    metrics.inc("fetch_skipped_total")
+                    frontier.fail(url, "devre kesici açık")
+                    print(f"⏭️ {url} atlandı: host art arda başarısız oldu, bekleme süresi dolmadı")
+                    continue
+                tasks[asyncio.ensure_future(visit(url, depth))] = host
+
+            if not tasks and (not scheduler.queued or fetched >= max_pages):
+                return fetched
+            # Bir indirme bitene ya da hız sınırındaki bir host'a yeni hak gelene kadar bekle
+            delay = scheduler.next_ready_in() if fetched + len(tasks) < max_pages else None
+            if not tasks:
+                await asyncio.sleep(delay)
+                continue
+            done, _ = await asyncio.wait(tasks, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                scheduler.release(tasks.pop(task))
+                fetched += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        frontier.requeue(url for url, _ in scheduler.drain())
+        await release_idle(pool)
+
+
+def crawl(seeds, max_depth=None, max_pages=None, db_path=None, concurrency=None, proxy=None, timeout=None,
+          cache=None, health=None, resume=None):
+    """Seed URL'lerden başlayarak .onion linklerini derinlik sınırıyla takip et.
+
+    Frontier diskte tutulur; bekleyen URL'ler varsa ve tarama aynı kaynaklarla başlatılmışsa
+    (veya `resume`/`CRAWL_RESUME` açıksa) kaldığı yerden devam eder, yoksa yeni bir tarama başlatılır. Bulunan tekil linkleri `OnionIndex` olarak döndürür.
+    `timeout` verilmezse her host için gecikme geçmişinden uyarlanır (bkz. `host_health`).
+    İstekler host başına hız ve eşzamanlılık sınırıyla dağıtılır (bkz. `host_scheduler`).
+    """
+    max_depth = config.CRAWL_MAX_DEPTH if max_depth is None else max_depth
+    max_pages = config.CRAWL_MAX_PAGES if max_pages is None else max_pages
+    resume = config.CRAWL_RESUME if resume is None else resume
+    cache = cache or get_fetch_cache()
+    health = health or get_host_health()
+    # İzleme listesi indeksi süreç havuzu açılmadan kurulur; işçi süreçler hazır indeksi devralır
+    get_watchlist()
+
+    frontier = CrawlFrontier(db_path)
+    try:
+        pending = frontier.has_pending()
+        if pending and (resume or frontier.seeds() == sorted(set(seeds))):
+            stats = frontier.stats()
+            print(f"🔁 Yarım kalan tarama devam ettiriliyor ({stats['done']} sayfa tamam, {stats['pending']} bekliyor)")
+        else:
+            if pending:
+                print("🆕 Kaynaklar değişti, yarım kalan tarama atılıp yeni tarama başlatılıyor")
+            frontier.reset(seeds)
+            for seed in seeds:
+                frontier.add(seed, 0)
+
+        mirrors = None
+        if config.MIRROR_SIMILARITY:
+            # Devam eden taramada önceki sayfaların imzaları yeniden yüklenir
+            mirrors = MirrorIndex()
+            for url, signature in frontier.signatures():
+                mirrors.add(url, signature)
+
+        limit = max(1, min(concurrency or config.FETCH_CONCURRENCY, config.MAX_FETCH_CONCURRENCY))
+        scheduler = HostScheduler(max_in_flight=limit)
+        fetched = run_sync(_crawl(frontier, max_depth, max_pages, get_pool(proxy), timeout, cache, health, scheduler,
+                                  mirrors))
+        stats = frontier.stats()
+        print(f"📊 Bu çalıştırmada {fetched} sayfa tarandı, {stats['pending']} URL kuyrukta bekliyor")
+        scheduler_stats = scheduler.stats()
+        print(f"🚦 Zamanlayıcı: {scheduler_stats['hosts']} host, {scheduler_stats['dispatched']} istek gönderildi, "
+              f"kuyrukta en fazla {scheduler_stats['max_queued']} URL bekledi")
+        if mirrors is not None:
+            mirror_count = sum(len(group['mirrors']) for group in frontier.mirror_groups())
+            print(f"🪞 Aynalar: {len(mirrors)} özgün sayfa, {mirror_count} ayna sayfa ayrıştırılmadı")
+        if cache is not None:
+            cache_stats = cache.stats()
+            print(f"💾 Önbellek: {cache_stats['hits']} isabet (304), {cache_stats['unchanged']} değişmemiş, "
+                  f"{cache_stats['misses']} kaçırma, {cache_stats['evictions']} silinen")
+        index = OnionIndex()
+        index.extend(frontier.links())
+        return index
+    finally:
+        frontier.close()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Tekrarlanan taramalar için koşullu istek (ETag/Last-Modified) destekli disk önbelleği"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    links TEXT,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+"""
+
+
+def content_hash(body):
+    return hashlib.sha256(body).hexdigest()
+
+
+class CacheEntry:
+    """Önbellekteki bir URL kaydı"""
+    __slots__ = ("url", "etag", "last_modified", "content_hash", "headers", "links", "size")
+
+    def __init__(self, url, etag, last_modified, content_hash, headers, links, size):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.headers = json.loads(headers)
+        self.links = json.loads(links) if links is not None else None
+        self.size = size
+
+
+class FetchCache:
+    """URL anahtarlı, LRU ve toplam boyut sınırıyla temizlenen sayfa önbelleği.
+
+    İndeks SQLite'ta, sayfa gövdeleri `bodies/` altında ayrı dosyalarda tutulur.
+    Sayfadan çıkarılan linkler de saklanır; içerik değişmediyse ayrıştırma atlanabilir.
+    """
+
+    def __init__(self, path=None, max_bytes=None):
+        self.path = path or config.FETCH_CACHE_DIR
+        self.max_bytes = config.FETCH_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        os.makedirs(os.path.join(self.path, "bodies"), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(self.path, "cache.db"), check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.hits = 0          # 304 yanıtı: gövde önbellekten
+        self.unchanged = 0     # 200 yanıtı ama içerik özeti aynı
+        self.misses = 0        # Yeni veya değişmiş içerik
+        self.evictions = 0
+
+    def close(self):
+        self.db.close()
+
+    def _body_path(self, url):
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, "bodies", name[:2], name)
+
+    def lookup(self, url):
+        with self._lock:
+            row = self.db.execute(
+                """SELECT url, etag, last_modified, content_hash, headers, links, size
+                   FROM entries WHERE url = ?""",
+                (url,),
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def validators(self, url):
+        """Koşullu istek başlıklarını döndür (kayıt yoksa boş sözlük)"""
+        entry = self.lookup(url)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def read_body(self, entry):
+        """Kaydın gövdesini oku; dosya silinmişse None döndür"""
+        try:
+            with open(self._body_path(entry.url), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        self.touch(entry.url)
+        return body
+
+    def touch(self, url):
+        with self._lock, self.db:
+            self.db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), url))
+
+    def store(self, url, headers, body):
+        """200 yanıtını kaydet; içerik özeti önceki kayıtla aynıysa True döndür"""
+        digest = content_hash(body)
+        previous = self.lookup(url)
+        unchanged = previous is not None and previous.content_hash == digest
+
+        if not unchanged:
+            path = self._body_path(url)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(body)
+
+        with self._lock, self.db:
+            self.db.execute(
+                """INSERT INTO entries (url, etag, last_modified, content_hash, headers, links, size, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (url) DO UPDATE SET
+                       etag = excluded.etag, last_modified = excluded.last_modified,
+                       content_hash = excluded.content_hash, headers = excluded.headers,
+                       links = CASE WHEN entries.content_hash = excluded.content_hash
+                                    THEN entries.links ELSE NULL END,
+                       size = excluded.size, last_access = excluded.last_access""",
+                (
+                    url,
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    digest,
+                    json.dumps(headers),
+                    None,
+                    len(body),
+                    time.time(),
+                ),
+            )
+        if unchanged:
+            self.unchanged += 1
+        else:
+            self.misses += 1
+            self.evict()
+        return unchanged
+
+    def store_links(self, url, links):
+        """Sayfadan çıkarılan linkleri kaydet (içerik değişmedikçe yeniden kullanılır)"""
+        with self._lock, self.db:
+            self.db.execute(
+                "UPDATE entries SET links = ? WHERE url = ?", (json.dumps(links, ensure_ascii=False), url)
+            )
+
+    def evict(self):
+        """Toplam boyut sınırı aşılırsa en uzun süredir kullanılmayan kayıtları sil"""
+        with self._lock:
+            total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for url, size in self.db.execute("SELECT url, size FROM entries ORDER BY last_access"):
+                if total <= self.max_bytes:
+                    break
+                victims.append(url)
+                total -= size
+            with self.db:
+                self.db.executemany("DELETE FROM entries WHERE url = ?", [(url,) for url in victims])
+        for url in victims:
+            try:
+                os.remove(self._body_path(url))
+            except FileNotFoundError:
+                pass
+        self.evictions += len(victims)
+
+    def stats(self):
+        requests = self.hits + self.unchanged + self.misses
+        return {
+            "hits": self.hits,
+            "unchanged": self.unchanged,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.unchanged) / requests, 3) if requests else 0.0,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_fetch_cache():
+    """Paylaşılan önbelleği döndür; FETCH_CACHE_MAX_BYTES=0 ise önbellek kapalıdır"""
+    global _cache
+    if not config.FETCH_CACHE_MAX_BYTES:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = FetchCache()
+        return _cache
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Tarama container'larını sınırlı bir işçi havuzunda eşzamanlı çalıştıran filo yöneticisi.
+
+Container'ı başlatan kod `ContainerRunner` arayüzünün arkasındadır: gerçek çalıştırmalar
+için `DockerRunner`, Docker olmadan (testler, yerel deneme) `LocalRunner` kullanılır.
+"""
+import json
+import os
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import config
+
+OUTPUT_TAIL = 2000  # Özete yazılan çıktının son karakter sayısı
+
+
+class RunOutcome:
+    """Tek bir çalıştırma denemesinin sonucu"""
+    __slots__ = ("returncode", "stdout", "stderr", "timed_out")
+
+    def __init__(self, returncode, stdout="", stderr="", timed_out=False):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.timed_out = timed_out
+
+    @property
+    def ok(self):
+        return self.returncode == 0 and not self.timed_out
+
+
+class ContainerRunner:
+    """Bir tarama çalıştırmasını başlatan arayüz"""
+
+    def run(self, name, mac_address, output_dir, timeout):
+        """Çalıştırmayı bitene (veya `timeout` saniye dolana) kadar yürüt ve `RunOutcome` döndür"""
+        raise NotImplementedError
+
+
+def _run_process(cmd, timeout, on_timeout=None, **kwargs):
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                                encoding="utf-8", errors="ignore", **kwargs)
+    except subprocess.TimeoutExpired as e:
+        if on_timeout:
+            on_timeout()
+        stdout = e.stdout.decode("utf-8", "ignore") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        return RunOutcome(None, stdout, "", timed_out=True)
+    return RunOutcome(result.returncode, result.stdout, result.stderr)
+
+
+def container_command(scan="python3 tor_bootstrap.py -- python3 script.py", workdir="/app", output_dir="/app/output"):
+    """Container içinde çalışan kabuk komutu.
+
+    Sonuç dosyalarının kopyalanamaması (ör. PDF üretilmediyse) hata sayılmaz; container
+    taramanın çıkış koduyla biter, böylece başarısız taramalar yeniden denenir.
+    """
+    return (f"tor > /dev/null & cd {workdir} && {scan}; rc=$?; "
+            f"cp *.json *.jsonl *.pdf {output_dir}/ 2>/dev/null; exit $rc")
+
+
+class DockerRunner(ContainerRunner):
+    """Tarama imajını belirtilen MAC adresiyle `docker run` ile çalıştırır.
+
+    `tor_data_volume` verilirse Tor veri dizini (`/tmp/tor`) adlandırılmış volume'larda
+    tutulur ve sonraki çalıştırmalarda yeniden kullanılır. Tor bir veri dizinini aynı anda
+    tek süreçle paylaşabildiği için her eşzamanlı çalıştırma kendi volume'unu
+    (`<ad>-0`, `<ad>-1`, ...) ödünç alır.
+    """
+
+    def __init__(self, image="tor-onion-scanner:latest", command=None, tor_data_volume=None):
+        self.image = image
+        self.command = command or container_command()
+        self.tor_data_volume = tor_data_volume
+        self._free_volumes = []
+        self._volume_count = 0
+        self._lock = threading.Lock()
+
+    def _acquire_volume(self):
+        with self._lock:
+            if self._free_volumes:
+                return self._free_volumes.pop()
+            self._volume_count += 1
+            return f"{self.tor_data_volume}-{self._volume_count - 1}"
+
+    def _release_volume(self, volume):
+        with self._lock:
+            self._free_volumes.append(volume)
+
+    def run(self, name, mac_address, output_dir, timeout):
+        volume = self._acquire_volume() if self.tor_data_volume else None
+        cmd = [
+            "docker", "run",
+            "--name", name,
+            "--mac-address", mac_address,
+            "--rm",  # Container'ı otomatik sil
+            "-v", f"{os.path.abspath(output_dir)}:/app/output",
+        ]
+        if volume:
+            cmd += ["-v", f"{volume}:/tmp/tor"]
+        cmd += [self.image, "sh", "-c", self.command]
+        try:
+            # Zaman aşımında yalnızca docker istemcisi ölür; container'ın kendisi de kaldırılmalı
+            return _run_process(cmd, timeout, on_timeout=lambda: self.remove(name))
+        finally:
+            if volume:
+                self._release_volume(volume)
+
+    @staticmethod
+    def remove(name):
+        subprocess.run(["docker", "rm", "-f", name], capture_output=True)
+
+
+class LocalRunner(ContainerRunner):
+    """Docker olmadan yerel bir komut çalıştıran yedek (testler ve yerel deneme için).
+
+    Komut çalıştırmanın çıktı dizininde yürütülür; `SCAN_RUN_NAME` ve `SCAN_MAC_ADDRESS`
+    ortam değişkenleri ayarlanır.
+    """
+
+    def __init__(self, command, env=None):
+        self.command = command
+        self.env = env
+
+    def run(self, name, mac_address, output_dir, timeout):
+        env = dict(os.environ, **(self.env or {}), SCAN_RUN_NAME=name, SCAN_MAC_ADDRESS=mac_address)
+        return _run_process(self.command, timeout, cwd=output_dir, env=env)
+
+
+class FleetRunner:
+    """En fazla `concurrency` çalıştırmayı aynı anda yürüten zamanlayıcı.
+
+    Başarısız veya zaman aşımına uğrayan çalıştırmalar `retries` kez yeniden denenir.
+    Her çalıştırmanın çıktısı `output_root/<ad>/` altına yazılır, özeti `summary_file`
+    dosyasına JSON satırı olarak eklenir.
+    """
+
+    def __init__(self, runner, concurrency=None, timeout=None, retries=None, retry_delay=3,
+                 output_root="runs", summary_file=None, mac_factory=None):
+        self.runner = runner
+        self.concurrency = max(1, concurrency or config.FLEET_CONCURRENCY)
+        self.timeout = timeout or config.FLEET_RUN_TIMEOUT
+        self.retries = config.FLEET_RETRIES if retries is None else retries
+        self.retry_delay = retry_delay
+        self.output_root = output_root
+        self.summary_file = summary_file or os.path.join(output_root, "fleet_summary.jsonl")
+        self.mac_factory = mac_factory or _random_mac
+        self.fleet_id = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+
+    def run(self, runs, on_finish=None):
+        """`runs` kez çalıştır; her çalıştırmanın özetini (sıralı) döndür"""
+        os.makedirs(self.output_root, exist_ok=True)
+        with ThreadPoolExecutor(self.concurrency) as pool:
+            futures = [pool.submit(self._run_one, index, on_finish) for index in range(runs)]
+            return [future.result() for future in futures]
+
+    def _run_one(self, index, on_finish):
+        name = f"tor-scanner-{self.fleet_id}-{index:04d}"
+        output_dir = os.path.join(self.output_root, name)
+        os.makedirs(output_dir, exist_ok=True)
+        summary = {
+            "fleet_id": self.fleet_id,
+            "run": index,
+            "name": name,
+            "output_dir": output_dir,
+            "started_at": datetime.now().isoformat(),
+            "attempts": [],
+        }
+        started = time.perf_counter()
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay)
+            # Her denemede yeni bir MAC adresi kullanılır
+            mac_address = self.mac_factory()
+            attempt_started = time.perf_counter()
+            try:
+                outcome = self.runner.run(name, mac_address, output_dir, self.timeout)
+            except Exception as e:
+                outcome = RunOutcome(None, "", f"{type(e).__name__}: {e}")
+            summary["attempts"].append({
+                "mac_address": mac_address,
+                "returncode": outcome.returncode,
+                "timed_out": outcome.timed_out,
+                "seconds": round(time.perf_counter() - attempt_started, 3),
+                "stdout_tail": outcome.stdout[-OUTPUT_TAIL:],
+                "stderr_tail": outcome.stderr[-OUTPUT_TAIL:],
+            })
+            if outcome.ok:
+                break
+
+        summary["status"] = "ok" if outcome.ok else "timeout" if outcome.timed_out else "failed"
+        summary["seconds"] = round(time.perf_counter() - started, 3)
+        summary["finished_at"] = datetime.now().isoformat()
+        summary["result_files"] = sorted(os.listdir(output_dir))
+
+        with self._lock:
+            with open(self.summary_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+            if on_finish:
+                on_finish(summary)
+        return summary
+
+
+def _random_mac():
+    from automation import generate_random_mac
+    return generate_random_mac()
+
+
+def summarize(summaries, wall_seconds):
+    """Filo çalıştırmasının toplu özeti"""
+    ok = [s for s in summaries if s["status"] == "ok"]
+    return {
+        "runs": len(summaries),
+        "ok": len(ok),
+        "failed": sum(s["status"] == "failed" for s in summaries),
+        "timeout": sum(s["status"] == "timeout" for s in summaries),
+        "retried": sum(len(s["attempts"]) > 1 for s in summaries),
+        "wall_seconds": round(wall_seconds, 3),
+        "runs_per_minute": round(len(ok) / wall_seconds * 60, 2) if wall_seconds else 0.0,
+    }
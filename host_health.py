@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Onion host'ları için uyarlanır zaman aşımı, yeniden deneme beklemesi ve devre kesici.
+
+Her host için gecikmenin EWMA'sı ve sapması tutulur (TCP RTO hesabına benzer şekilde);
+zaman aşımı `gecikme + 4 * sapma` olarak `FETCH_MIN_TIMEOUT`..`FETCH_MAX_TIMEOUT`
+aralığında seçilir. Üst üste `BREAKER_THRESHOLD` kez başarısız olan host'un devresi
+açılır ve bekleme süresi dolana kadar denenmez; süre dolunca tek bir deneme isteği
+gönderilir (yarı açık). Durum SQLite'ta saklanır, sonraki taramalarda da geçerlidir.
+"""
+import asyncio
+import random
+import sqlite3
+import threading
+import time
+
+import config
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+# Hata sınıfları: yeniden denenir / host'a yazılır ama denenmez / host'un suçu değil
+TRANSIENT, HOST_DOWN, PERMANENT = "transient", "host_down", "permanent"
+
+LATENCY_ALPHA = 1 / 8    # Gecikme EWMA ağırlığı
+DEVIATION_BETA = 1 / 4   # Sapma EWMA ağırlığı
+DEVIATION_FACTOR = 4     # Zaman aşımı = gecikme + 4 * sapma
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hosts (
+    host TEXT PRIMARY KEY,
+    latency REAL,
+    deviation REAL,
+    failures INTEGER NOT NULL DEFAULT 0,
+    opens INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'closed',
+    open_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def classify(error):
+    """Hatanın yeniden denenip denenmeyeceğini ve host'a yazılıp yazılmayacağını belirle"""
+    from async_fetcher import SocksError
+
+    if _is_timeout(error):
+        return TRANSIENT
+    if isinstance(error, SocksError):
+        # 1: genel hata, 6: TTL (devre kurulamadı) geçicidir; 3/4/5: onion servisi erişilemez
+        return TRANSIENT if error.code in (1, 6) else HOST_DOWN if error.code in (3, 4, 5) else PERMANENT
+    if isinstance(error, ConnectionRefusedError):
+        # Tor SOCKS portunun kendisi kapalı: host'un suçu değil
+        return PERMANENT
+    if isinstance(error, (ConnectionError, asyncio.IncompleteReadError, OSError)):
+        return TRANSIENT
+    return PERMANENT
+
+
+def _is_timeout(error):
+    from async_fetcher import FetchTimeout
+
+    return isinstance(error, (FetchTimeout, asyncio.TimeoutError))
+
+
+def backoff_delay(attempt, base=None, cap=None):
+    """Üstel bekleme, tam jitter ile: [0, min(cap, base * 2^attempt)] aralığında rastgele"""
+    base = config.RETRY_BACKOFF_BASE if base is None else base
+    cap = config.RETRY_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class HostState:
+    """Bir host'un gecikme istatistikleri ve devre kesici durumu"""
+    __slots__ = ("host", "latency", "deviation", "failures", "opens", "state", "open_until", "last_error",
+                 "probing")
+
+    def __init__(self, host, latency=None, deviation=None, failures=0, opens=0, state=CLOSED, open_until=0.0,
+                 last_error=None):
+        self.host = host
+        self.latency = latency
+        self.deviation = deviation
+        self.failures = failures
+        self.opens = opens
+        self.state = state
+        self.open_until = open_until
+        self.last_error = last_error
+        self.probing = False
+
+    def row(self):
+        return (self.host, self.latency, self.deviation, self.failures, self.opens, self.state,
+                self.open_until, self.last_error, time.time())
+
+
+class HostHealth:
+    """Host sağlık durumlarının deposu (bellekte önbelleklenir, her değişiklikte yazılır)"""
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path if db_path is not None else config.HOST_HEALTH_DB_PATH
+        self.db = sqlite3.connect(self.db_path or ":memory:", check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def close(self):
+        self.db.close()
+
+    def _get(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            row = self.db.execute(
+                """SELECT host, latency, deviation, failures, opens, state, open_until, last_error
+                   FROM hosts WHERE host = ?""",
+                (host,),
+            ).fetchone()
+            state = HostState(*row) if row else HostState(host)
+            self._hosts[host] = state
+        return state
+
+    def _save(self, state):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO hosts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", state.row())
+
+    def state(self, host):
+        with self._lock:
+            return self._get(host)
+
+    def timeout_for(self, host):
+        """Host'un geçmiş gecikmesine göre zaman aşımı (hiç ölçüm yoksa FETCH_TIMEOUT)"""
+        with self._lock:
+            state = self._get(host)
+            if state.latency is None:
+                return config.FETCH_TIMEOUT
+            timeout = state.latency + DEVIATION_FACTOR * state.deviation
+        return max(config.FETCH_MIN_TIMEOUT, min(config.FETCH_MAX_TIMEOUT, timeout))
+
+    def allow(self, host, now=None):
+        """Host'a istek gönderilebilir mi; açık devrenin süresi dolduysa tek deneme isteğine izin ver"""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self._get(host)
+            if state.state == CLOSED:
+                return True
+            if state.state == OPEN and now >= state.open_until:
+                state.state = HALF_OPEN
+            if state.state == HALF_OPEN and not state.probing:
+                state.probing = True
+                return True
+            return False
+
+    def record_success(self, host, latency):
+        with self._lock:
+            state = self._get(host)
+            if state.latency is None:
+                state.latency, state.deviation = latency, latency / 2
+            else:
+                state.deviation = (1 - DEVIATION_BETA) * state.deviation + DEVIATION_BETA * abs(state.latency - latency)
+                state.latency = (1 - LATENCY_ALPHA) * state.latency + LATENCY_ALPHA * latency
+            state.failures = 0
+            state.opens = 0
+            state.state = CLOSED
+            state.probing = False
+            state.last_error = None
+            self._save(state)
+
+    def record_failure(self, host, error, now=None):
+        """Başarısızlığı kaydet; eşik aşıldıysa (veya deneme isteği başarısızsa) devreyi aç"""
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self._get(host)
+            state.failures += 1
+            state.last_error = str(error)[:200]
+            if _is_timeout(error) and state.latency is not None:
+                # Yavaş ama canlı host: sonraki denemede daha uzun süre tanınsın
+                state.deviation = max(state.deviation, state.latency)
+            if state.state == HALF_OPEN or state.failures >= config.BREAKER_THRESHOLD:
+                # Art arda açılan devrelerde bekleme süresi ikiye katlanır
+                state.opens += 1
+                cooldown = min(config.BREAKER_MAX_COOLDOWN, config.BREAKER_COOLDOWN * 2 ** (state.opens - 1))
+                state.state = OPEN
+                state.open_until = now + cooldown
+            state.probing = False
+            self._save(state)
+            return state.state
+
+    def release(self, host):
+        """Sonucu host'a yazılmayan (ör. iptal edilen) deneme isteğini serbest bırak"""
+        with self._lock:
+            self._get(host).probing = False
+
+    def open_hosts(self, now=None):
+        """Devresi şu an açık olan host'lar"""
+        now = time.time() if now is None else now
+        rows = self.db.execute("SELECT host FROM hosts WHERE state != ? AND open_until > ?", (CLOSED, now))
+        return [host for (host,) in rows]
+
+
+_health = None
+_health_lock = threading.Lock()
+
+
+def get_host_health():
+    """Paylaşılan host sağlık deposunu döndür"""
+    global _health
+    with _health_lock:
+        if _health is None:
+            _health = HostHealth()
+        return _health
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tarama isteklerini host başına token bucket ve genel eşzamanlılık sınırıyla dağıtan zamanlayıcı.
+
+Toplam eşzamanlı istek sayısı yüksek tutulurken her onion servisine aynı anda en fazla
+`HOST_MAX_IN_FLIGHT` istek gider ve istekler `HOST_REQUESTS_PER_MINUTE` hızını (en fazla
+`HOST_BURST` birikmiş hak) aşmaz. Hazır host'lar sırayla (round-robin) seçilir; büyük bir
+dizin sitesinin binlerce sayfası diğer host'ları bekletmez.
+"""
+import collections
+import time
+
+import config
+import metrics
+
+
+class TokenBucket:
+    """Saniyede `rate` hak üreten, en fazla `capacity` hak biriktiren kova"""
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def ready_in(self, now):
+        """Bir hak için beklenecek süre (saniye); hak varsa 0"""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class _HostQueue:
+    __slots__ = ("items", "bucket", "in_flight")
+
+    def __init__(self, bucket):
+        self.items = collections.deque()
+        self.bucket = bucket
+        self.in_flight = 0
+
+
+class HostScheduler:
+    """Host kuyrukları arasında adil seçim yapan zamanlayıcı (tek event loop içinde kullanılır)"""
+
+    def __init__(self, max_in_flight=None, per_host=None, per_minute=None, burst=None, host_queue=None):
+        self.max_in_flight = max_in_flight or config.FETCH_CONCURRENCY
+        self.per_host = per_host or config.HOST_MAX_IN_FLIGHT
+        self.rate = (per_minute or config.HOST_REQUESTS_PER_MINUTE) / 60
+        self.burst = burst or config.HOST_BURST
+        self.host_queue = host_queue or config.SCHEDULER_HOST_QUEUE
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.dispatched = 0
+        self._hosts = {}
+        self._ring = collections.deque()  # Kuyruğunda iş olan host'lar, seçim sırasıyla
+
+    def submit(self, host, item, now=None):
+        now = time.monotonic() if now is None else now
+        queue = self._hosts.get(host)
+        if queue is None:
+            queue = self._hosts[host] = _HostQueue(TokenBucket(self.rate, self.burst, now))
+        if not queue.items:
+            self._ring.append(host)
+        queue.items.append((item, now))
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+
+    def is_full(self, host):
+        """Host kuyruğu dolu mu (doluysa frontier'dan bu host için yeni URL çekilmez)"""
+        queue = self._hosts.get(host)
+        return queue is not None and len(queue.items) >= self.host_queue
+
+    def full_hosts(self):
+        return {host for host, queue in self._hosts.items() if len(queue.items) >= self.host_queue}
+
+    def pop_ready(self, now=None):
+        """Sıradaki hazır host'un ilk işini (host, item) olarak döndür; hazır host yoksa None"""
+        if self.in_flight >= self.max_in_flight:
+            return None
+        now = time.monotonic() if now is None else now
+        for _ in range(len(self._ring)):
+            host = self._ring[0]
+            self._ring.rotate(-1)
+            queue = self._hosts[host]
+            if queue.in_flight >= self.per_host or queue.bucket.ready_in(now) > 0:
+                continue
+            queue.bucket.take(now)
+            item, submitted = queue.items.popleft()
+            if not queue.items:
+                self._ring.remove(host)
+            queue.in_flight += 1
+            self.in_flight += 1
+            self.queued -= 1
+            self.dispatched += 1
+            metrics.observe("scheduler_wait_seconds", now - submitted)
+            metrics.observe("scheduler_queue_depth", self.queued)
+            return host, item
+        return None
+
+    def next_ready_in(self, now=None):
+        """Yalnızca hız sınırı nedeniyle bekleyen en yakın host'un hazır olmasına kalan süre"""
+        if self.in_flight >= self.max_in_flight:
+            return None
+        now = time.monotonic() if now is None else now
+        delays = [self._hosts[host].bucket.ready_in(now) for host in self._ring
+                  if self._hosts[host].in_flight < self.per_host]
+        return min(delays) if delays else None
+
+    def release(self, host, refund=False):
+        """İstek bitti: host'un ve genel sınırın bir yerini boşalt.
+
+        `refund` ile istek hiç gönderilmediyse (ör. devre kesici açık) harcanan hak geri verilir.
+        """
+        queue = self._hosts[host]
+        queue.in_flight -= 1
+        self.in_flight -= 1
+        if refund:
+            queue.bucket.tokens = min(queue.bucket.capacity, queue.bucket.tokens + 1)
+
+    def drain(self):
+        """Henüz gönderilmemiş tüm işleri kuyruktan çıkarıp döndür"""
+        items = [item for host in self._ring for item, _ in self._hosts[host].items]
+        for host in self._ring:
+            self._hosts[host].items.clear()
+        self._ring.clear()
+        self.queued = 0
+        return items
+
+    def stats(self):
+        return {
+            'hosts': len(self._hosts),
+            'queued': self.queued,
+            'max_queued': self.max_queued,
+            'in_flight': self.in_flight,
+            'dispatched': self.dispatched,
+        }
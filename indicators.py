@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Taranan sayfalardan sızıntı göstergelerini (dark_web_data kategorileri) tek geçişte çıkaran motor.
+
+Sayfa metni tüm gösterge türlerini birleştiren tek bir derlenmiş düzenli ifadeyle bir kez
+taranır; her eşleşme ucuz bir doğrulayıcıdan geçer (kart numaraları için Luhn, TC kimlik
+numarası sağlaması, telefonlar için E.164 normalleştirmesi). Çıktı `create_dark_web_tables`
+ile aynı kategori şemasını kullanır; kart, kimlik numarası ve parolalar maskelenir.
+Büyük taramalarda sayfalar süreç havuzuna (`INDICATOR_WORKERS`) dağıtılır.
+"""
+import hashlib
+import html
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import config
+from watchlist import get_watchlist
+
+CATEGORIES = (
+    "email_passwords", "credit_cards", "identity_numbers", "phone_numbers", "database_dumps",
+    "phishing_sites", "ransomware_announcements", "malware_links", "hacked_sites",
+    "username_passwords", "personal_data",
+)
+
+RANSOMWARE_GROUPS = {
+    "lockbit": "LockBit", "blackcat": "BlackCat", "alphv": "ALPHV", "cl0p": "Cl0p", "clop": "Cl0p",
+    "conti": "Conti", "revil": "REvil", "darkside": "DarkSide", "akira": "Akira", "black basta": "Black Basta",
+    "blackbasta": "Black Basta", "medusa": "Medusa", "8base": "8Base", "rhysida": "Rhysida",
+    "ragnar locker": "Ragnar Locker",
+}
+
+# Tüm gösterge türleri tek ifadede: metin bir kez taranır, eşleşen grup `lastgroup` ile bulunur.
+# Alternatifler yalnızca kelime başlarında denenir (baştaki lookbehind); rakam dizileri (kart, SSN,
+# TC) ve noktalı adlar (dump dosyası, hacklenen alan adı) tek alternatifte yakalanıp Python'da ayrılır.
+PATTERN = re.compile(r"""(?<![\w.+-])(?:
+    (?P<email>(?P<address>[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-z]{2,})(?:[:;|](?P<password>[^\s:;|<>"']{4,64}))?)
+  | (?P<user_password>(?:user(?:name)?|login)\s*[:=]\s*(?P<username>[^\s:;|,]{2,64})[\s,;|]+
+        (?:pass(?:word)?|pwd)\s*[:=]\s*(?P<user_pass>[^\s,;|]{3,64}))
+  | (?P<phone>\+\d{1,3}[ .-]?\(?\d{1,4}\)?(?:[ .-]?\d{2,4}){2,4}\b)
+  | (?P<number>\d(?:[ -]?\d){8,18}\b)
+  | (?P<ransomware>(?-i:LockBit|BlackCat|ALPHV|Cl0p|CLOP|Conti|REvil|DarkSide|Akira|Black\ ?Basta|Medusa|8Base
+        |Rhysida|Ragnar\ Locker)\b)
+  | (?P<dotted>[\w-]+(?:\.[\w-]+)+)
+)""", re.I | re.X)
+SSN = re.compile(r"\d{3}-\d{2}-\d{4}")
+DUMP_SUFFIX = re.compile(r"\.(?:sql|dump|bak|mdb|sqlite3?)(?:\.(?:gz|zip|7z|rar|xz))?$", re.I)
+DOMAIN = re.compile(r"(?:[a-z0-9-]+\.)+[a-z]{2,}", re.I)
+HACKED = re.compile(r"\s+(?:was\s+|has\s+been\s+|got\s+)?(?:hacked|breached|leaked|defaced|pwned)\b", re.I)
+
+EXPIRY = re.compile(r"\b(0[1-9]|1[0-2])\s?/\s?(\d{2}|20\d{2})\b")
+SIZE = re.compile(r"\b(\d+(?:[.,]\d+)?\s?[KMGT]i?B)\b", re.I)
+RECORDS = re.compile(r"\b(\d[\d,.]*\s?[KM]?)\s+(?:records|rows|users|accounts|lines|customers)\b", re.I)
+DATE = re.compile(r"\b(20\d{2}-[01]\d-[0-3]\d)\b")
+DEMAND = re.compile(r"\$\s?\d[\d,.]*(?:\s?(?:[KM]|million|thousand)\b)?", re.I)
+VICTIM = re.compile(r"\b(?:victim|target|company)\s*[:\-]\s*([^\n,;<$]{3,60}?)(?=\s+(?:demand|ransom|deadline)\b|[\n,;<$]|$)",
+                    re.I)
+NAME = re.compile(r"\W*([A-ZÇĞİÖŞÜ][a-zçğıöşü]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü]+){1,2})\b")
+WINDOW = 200  # Kart son kullanma tarihi, dump boyutu gibi ek alanların aranacağı metin uzunluğu
+
+BLOCK_TAGS = re.compile(r"<(?:br|/p|/div|/tr|/li|/h\d|/td)\b[^>]*>", re.I)
+SKIPPED = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+TAGS = re.compile(r"<[^>]+>")
+
+# E.164 ülke kodları (en uzun önek eşleşir)
+CALLING_CODES = {
+    "1": "US", "7": "RU", "20": "EG", "27": "ZA", "30": "GR", "31": "NL", "32": "BE", "33": "FR", "34": "ES",
+    "36": "HU", "39": "IT", "40": "RO", "41": "CH", "43": "AT", "44": "UK", "45": "DK", "46": "SE", "47": "NO",
+    "48": "PL", "49": "DE", "51": "PE", "52": "MX", "54": "AR", "55": "BR", "56": "CL", "57": "CO", "60": "MY",
+    "61": "AU", "62": "ID", "63": "PH", "64": "NZ", "65": "SG", "66": "TH", "81": "JP", "82": "KR", "84": "VN",
+    "86": "CN", "90": "TR", "91": "IN", "92": "PK", "98": "IR", "351": "PT", "353": "IE", "358": "FI",
+    "380": "UA", "420": "CZ", "966": "SA", "971": "AE", "972": "IL", "994": "AZ",
+}
+MOBILE_PREFIXES = {"TR": "5", "UK": "7", "DE": "1", "FR": "6", "IT": "3", "ES": "6"}
+
+PHISHING_SIGNAL = re.compile(r"log-?in|sign-?in|verify|verification|secure|account|update|wallet-?connect", re.I)
+PHISHING_TARGETS = re.compile(
+    r"(?P<Banking>bank|paypal|chase|wells-?fargo|hsbc|barclays)"
+    r"|(?P<Email>mail|outlook|gmail|proton)"
+    r"|(?P<Social_Media>facebook|instagram|twitter|tiktok)"
+    r"|(?P<Crypto>wallet|metamask|binance|coinbase|blockchain)",
+    re.I,
+)
+MALWARE = re.compile(r"\b(rat|keylogger|stealer|botnet|crypter|miner|ransomware|exploit kit|loader|rootkit)s?\b",
+                     re.I)
+
+
+def luhn_valid(digits):
+    """Luhn sağlaması (kart numaraları)"""
+    total = 0
+    for index, char in enumerate(reversed(digits)):
+        digit = ord(char) - 48
+        if index % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def card_brand(digits):
+    if digits[0] == "4":
+        return "Visa"
+    if 51 <= int(digits[:2]) <= 55 or 2221 <= int(digits[:4]) <= 2720:
+        return "Mastercard"
+    if digits[:2] in ("34", "37"):
+        return "American Express"
+    if digits[:4] == "6011" or digits[:2] == "65":
+        return "Discover"
+    if digits[:4] == "9792":
+        return "Troy"
+    return "Unknown"
+
+
+def tckn_valid(number):
+    """TC kimlik numarası sağlaması (10. ve 11. haneler)"""
+    d = [ord(char) - 48 for char in number]
+    return (d[9] == ((d[0] + d[2] + d[4] + d[6] + d[8]) * 7 - (d[1] + d[3] + d[5] + d[7])) % 10
+            and d[10] == sum(d[:10]) % 10)
+
+
+def ssn_valid(number):
+    area, group, serial = number.split("-")
+    return area not in ("000", "666") and area[0] != "9" and group != "00" and serial != "0000"
+
+
+def normalize_phone(raw):
+    """Telefonu E.164 biçimine getir; (numara, ülke, tür) ya da geçersizse None döndür"""
+    digits = re.sub(r"\D", "", raw)
+    if not 8 <= len(digits) <= 15:
+        return None
+    for length in (3, 2, 1):
+        country = CALLING_CODES.get(digits[:length])
+        if country:
+            national = digits[length:]
+            kind = "mobile" if MOBILE_PREFIXES.get(country) == national[:1] else "unknown"
+            return f"+{digits}", country, kind
+    return None
+
+
+def mask(value, keep=4, char="*"):
+    """Son `keep` karakter dışındaki rakam ve harfleri maskele (ayırıcılar korunur)"""
+    cut = len(value) - keep
+    return "".join(char if i < cut and c.isalnum() else c for i, c in enumerate(value))
+
+
+def mask_secret(secret):
+    return secret[0] + "*" * (len(secret) - 2) + secret[-1] if len(secret) > 2 else "*" * len(secret)
+
+
+def page_text(body, encoding=None):
+    """HTML gövdesinden düz metin (blok etiketleri satır sonuna çevrilir)"""
+    if isinstance(body, bytes):
+        body = body.decode(encoding or "utf-8", errors="replace")
+    body = SKIPPED.sub(" ", body)
+    body = BLOCK_TAGS.sub("\n", body)
+    return html.unescape(TAGS.sub(" ", body))
+
+
+def _key(*parts):
+    # Aynı göstergenin tekrarlarını ayırt etmek için ham değerin özeti; ham değer çıktıya girmez
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8", "replace")).hexdigest()[:20]
+
+
+def _after(pattern, text, end):
+    match = pattern.search(text, end, end + WINDOW)
+    return match.group(1) if match and match.groups() else match.group(0) if match else ""
+
+
+def extract_text(text, source=""):
+    """Metindeki göstergeleri [(kategori, anahtar, kayıt), ...] olarak döndür"""
+    found = []
+    emails = {}  # satır başı -> e-posta (kişisel veri eşleştirmesi için)
+    phones = {}
+    for match in PATTERN.finditer(text):
+        kind = match.lastgroup  # İç içe gruplarda dıştaki grup en son kapandığı için türü verir
+        value = match.group(kind)
+
+        if kind == "email":
+            email, password = match.group("address").lower(), match.group("password")
+            emails.setdefault(text.rfind("\n", 0, match.start()) + 1, email)
+            if password and not (password.isdigit() and len(password) <= 5):  # host:port değil
+                found.append(("email_passwords", _key(email, password),
+                              {"email": email, "password": mask_secret(password), "source": source}))
+        elif kind == "user_password":
+            username, password = match.group("username"), match.group("user_pass")
+            found.append(("username_passwords", _key(username, password),
+                          {"username": username, "password": mask_secret(password), "source": source}))
+        elif kind == "phone":
+            phone = normalize_phone(value)
+            if phone:
+                number, country, phone_type = phone
+                found.append(("phone_numbers", _key(number), {"number": number, "country": country, "type": phone_type}))
+                phones.setdefault(text.rfind("\n", 0, match.start()) + 1, number)
+        elif kind == "number":
+            digits = value.replace(" ", "").replace("-", "")
+            if SSN.fullmatch(value):
+                if ssn_valid(value):
+                    found.append(("identity_numbers", _key("SSN", value),
+                                  {"type": "SSN", "number": f"***-**-{value[-4:]}", "country": "US"}))
+            elif len(digits) == 11 and digits == value:
+                if tckn_valid(value):
+                    found.append(("identity_numbers", _key("TC", value),
+                                  {"type": "TC", "number": mask(value), "country": "TR"}))
+            elif len(digits) >= 13 and len(set(digits)) > 1 and luhn_valid(digits):
+                expiry = EXPIRY.search(text, match.end(), match.end() + 40)
+                found.append(("credit_cards", _key(digits), {
+                    "number": f"****-****-****-{digits[-4:]}",
+                    "expiry": f"{expiry.group(1)}/{expiry.group(2)[-2:]}" if expiry else "",
+                    "cvv": "***",
+                    "bank": card_brand(digits),
+                }))
+        elif kind == "ransomware":
+            group = RANSOMWARE_GROUPS.get(value.lower(), value)
+            victim = _after(VICTIM, text, match.end()).strip()
+            found.append(("ransomware_announcements", _key(group, victim.lower(), source),
+                          {"group": group, "victim": victim, "demand": _after(DEMAND, text, match.end())}))
+        elif DUMP_SUFFIX.search(value):
+            found.append(("database_dumps", _key(value.lower()), {
+                "name": value,
+                "size": _after(SIZE, text, match.end()),
+                "records": _after(RECORDS, text, match.end()),
+            }))
+        elif HACKED.match(text, match.end()) and DOMAIN.fullmatch(value):
+            domain = value.lower()
+            found.append(("hacked_sites", _key(domain), {
+                "domain": domain,
+                "breach_date": _after(DATE, text, match.end()),
+                "records": _after(RECORDS, text, match.end()),
+            }))
+
+    # Aynı satırda e-posta ve telefon: kişisel veri kaydı
+    for line_start, email in emails.items():
+        phone = phones.get(line_start)
+        if phone:
+            name = NAME.match(text, line_start)
+            found.append(("personal_data", _key(email, phone), {
+                "name": name.group(1) if name else "", "email": email, "phone": phone, "address": "",
+            }))
+    return found
+
+
+def extract_page(body, encoding=None, source=""):
+    """Sayfa gövdesindeki göstergeleri çıkar (süreç havuzunda çalıştırılabilir)"""
+    return extract_text(page_text(body, encoding), source)
+
+
+def analyze_page(body, encoding=None, source=""):
+    """Sayfanın göstergelerini ve izleme listesi uyarılarını aynı metin üzerinden çıkar"""
+    text = page_text(body, encoding)
+    watchlist = get_watchlist()
+    return extract_text(text, source), watchlist.alerts(text, source) if watchlist is not None else []
+
+
+def classify_links(links):
+    """Link adres ve metinlerinden phishing ve malware kayıtları üret"""
+    found = []
+    for link in links:
+        haystack = f"{link['url']} {link.get('text', '')}"
+        target = PHISHING_TARGETS.search(haystack)
+        if target and PHISHING_SIGNAL.search(haystack):
+            found.append(("phishing_sites", _key(link['url']), {
+                "url": link['url'], "target": target.lastgroup.replace("_", " "), "status": "linked",
+            }))
+        malware = MALWARE.search(haystack)
+        if malware:
+            kind = malware.group(1)
+            found.append(("malware_links", _key(link['url']), {
+                "url": link['url'], "type": kind.upper() if len(kind) <= 3 else kind.title(), "detection": "-",
+            }))
+    return found
+
+
+def group_records(found):
+    """[(kategori, anahtar, kayıt), ...] listesini tekilleştirip dark_web_data şemasına çevir"""
+    data = {category: [] for category in CATEGORIES}
+    seen = set()
+    for category, key, record in found:
+        if (category, key) not in seen:
+            seen.add((category, key))
+            data[category].append(record)
+    return data
+
+
+def extract_many(pages, workers=None):
+    """(gövde, kodlama, kaynak) üçlülerini havuzda işle; kayıtları sayfa sırasıyla üret"""
+    pool = get_indicator_pool(workers)
+    if pool is None:
+        for page in pages:
+            yield from extract_page(*page)
+        return
+    bodies, encodings, sources = zip(*pages) if pages else ((), (), ())
+    for found in pool.map(extract_page, bodies, encodings, sources, chunksize=16):
+        yield from found
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_indicator_pool(workers=None):
+    """Paylaşılan süreç havuzunu döndür; `INDICATOR_WORKERS` 0 ise None (aynı süreçte çalışır)"""
+    global _pool
+    workers = config.INDICATOR_WORKERS if workers is None else workers
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers)
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
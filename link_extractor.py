@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""HTML sayfalarından .onion linklerini akış halinde (DOM kurmadan) çıkaran yardımcılar"""
+import codecs
+import re
+from html.parser import HTMLParser
+
+import config
+
+CHUNK_SIZE = 64 * 1024
+SNIFF_SIZE = 1024
+TEXT_LIMIT = 50
+
+META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+class OnionLinkParser(HTMLParser):
+    """`<a href>` etiketlerini ve metinlerini artımlı olarak toplayan ayrıştırıcı.
+
+    Metin, BeautifulSoup'taki `get_text(strip=True)` ile aynı şekilde birleştirilir:
+    her metin düğümü ayrı ayrı kırpılır ve boş olmayanlar araya boşluk koymadan eklenir.
+    """
+
+    def __init__(self, source_url):
+        super().__init__(convert_charrefs=True)
+        self.source_url = source_url
+        self._open = []      # Açık <a> etiketleri (iç içe olabilir)
+        self._pending = []   # Belge sırasını korumak için kapanmayı bekleyen linkler
+        self._text_run = []  # Henüz bitmemiş metin düğümü
+        self._skip = 0       # <script>/<style> içindeyken metin alınmaz
+
+    def _flush_text(self):
+        if self._text_run:
+            text = ''.join(self._text_run).strip()
+            self._text_run = []
+            if text:
+                for frame in self._open:
+                    frame[1].append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag == 'a':
+            href = None
+            for name, value in attrs:
+                if name == 'href':
+                    href = value or ''
+            frame = [href, [], False]
+            self._open.append(frame)
+            self._pending.append(frame)
+        elif tag in ('script', 'style'):
+            self._skip += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag != 'a':
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag == 'a' and self._open:
+            self._open.pop()[2] = True
+        elif tag in ('script', 'style') and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._text_run.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def unknown_decl(self, data):
+        # <![CDATA[...]]> ayrı bir metin düğümüdür
+        self._flush_text()
+        if data.startswith('CDATA[') and not self._skip:
+            self._text_run.append(data[6:])
+            self._flush_text()
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        # Kapanmamış <a> etiketleri belge sonunda kapanmış sayılır
+        for frame in self._open:
+            frame[2] = True
+        self._open = []
+
+    def drain(self):
+        """Tamamlanmış .onion linklerini belge sırasıyla üret"""
+        done = 0
+        for href, texts, closed in self._pending:
+            if not closed:
+                break
+            done += 1
+            if href is not None and '.onion' in href:
+                yield {
+                    'url': href,
+                    'text': ''.join(texts)[:TEXT_LIMIT],
+                    'found_at': self.source_url
+                }
+        del self._pending[:done]
+
+
+def sniff_encoding(head, declared=None):
+    """BOM, HTTP başlığı veya <meta charset> üzerinden karakter setini belirle"""
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    candidates = [declared]
+    match = META_CHARSET.search(head)
+    if match:
+        candidates.append(match.group(1).decode('ascii', 'ignore'))
+    for candidate in candidates:
+        if candidate:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                continue
+    return 'utf-8'
+
+
+def iter_onion_links(chunks, source_url, max_bytes=None, encoding=None):
+    """Bayt parçalarından .onion linklerini okundukça üret.
+
+    `max_bytes` aşılırsa gövdenin kalanı okunmaz; o ana kadar bulunan linkler döner.
+    """
+    max_bytes = config.MAX_BODY_BYTES if max_bytes is None else max_bytes
+    parser = OnionLinkParser(source_url)
+    decoder = None
+    head = b''
+    total = 0
+
+    for chunk in chunks:
+        if max_bytes and total + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - total]
+            print(f"⚠️ {source_url} boyut sınırını ({max_bytes} bayt) aştı, kalanı okunmadı")
+        total += len(chunk)
+
+        if decoder is None:
+            # Karakter seti tespiti için ilk baytları biriktir
+            head += chunk
+            if len(head) < SNIFF_SIZE and not (max_bytes and total >= max_bytes):
+                continue
+            decoder = codecs.getincrementaldecoder(sniff_encoding(head, encoding))(errors='replace')
+            chunk, head = head, b''
+
+        parser.feed(decoder.decode(chunk))
+        yield from parser.drain()
+        if max_bytes and total >= max_bytes:
+            break
+
+    if decoder is None:
+        decoder = codecs.getincrementaldecoder(sniff_encoding(head, encoding))(errors='replace')
+    parser.feed(decoder.decode(head, final=True))
+    parser.close()
+    yield from parser.drain()
+
+
+def iter_chunks(content, size=CHUNK_SIZE):
+    """Bellekteki içeriği sabit boyutlu parçalara böl"""
+    view = memoryview(content)
+    for start in range(0, len(view), size):
+        yield view[start:start + size].tobytes()
+
+
+def extract_onion_links(content, source_url, max_bytes=None, encoding=None):
+    """Sayfa içeriğindeki .onion linklerini çıkar"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+        encoding = 'utf-8'
+    return list(iter_onion_links(iter_chunks(content), source_url, max_bytes, encoding))
+
+
+def stream_onion_links(response, source_url=None, max_bytes=None):
+    """`requests` yanıtını (stream=True) iter_content ile okuyarak linkleri üret"""
+    encoding = None
+    match = re.search(r"charset=([\w-]+)", response.headers.get('content-type', ''), re.I)
+    if match:
+        encoding = match.group(1)
+    try:
+        yield from iter_onion_links(
+            response.iter_content(CHUNK_SIZE), source_url or response.url, max_bytes, encoding
+        )
+    finally:
+        response.close()
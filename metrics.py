@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Tarama süresinin nereye gittiğini ölçen histogramlar, sayaçlar ve aşama süreleri.
+
+İndirme yolu her istek için SOCKS bağlantı süresini, ilk bayta kadar geçen süreyi (TTFB),
+indirme ve ayrıştırma süresini ve bayt sayısını kaydeder; `script.main` her aşamanın
+duvar saati süresini ekler. Sonuçlar rapora (`scan_metrics`) yazılır ve Prometheus
+metin biçiminde dışa aktarılabilir (`METRICS_FILE`, daemon'da `GET /metrics`).
+"""
+import contextlib
+import math
+import os
+import threading
+import time
+
+import config
+
+TIME_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BYTE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+DEPTH_BUCKETS = (1, 5, 10, 50, 100, 500, 1000)
+
+HISTOGRAMS = {
+    "fetch_socks_connect_seconds": ("SOCKS5 bağlantı kurulum süresi", TIME_BUCKETS),
+    "fetch_ttfb_seconds": ("İstek gönderiminden yanıt başlığına kadar geçen süre", TIME_BUCKETS),
+    "fetch_download_seconds": ("Yanıt gövdesinin indirilme süresi", TIME_BUCKETS),
+    "fetch_parse_seconds": ("Sayfadan link çıkarma süresi", TIME_BUCKETS),
+    "fetch_response_bytes": ("Yanıt gövdesi boyutu (bayt)", BYTE_BUCKETS),
+    "indicator_extract_seconds": ("Sayfadan sızıntı göstergelerinin çıkarılma süresi", TIME_BUCKETS),
+    "page_fingerprint_seconds": ("Sayfa gövdesinin ayna tespiti için imzalanma süresi", TIME_BUCKETS),
+    "scheduler_wait_seconds": ("URL'nin host kuyruğunda gönderilmeyi beklediği süre", TIME_BUCKETS),
+    "scheduler_queue_depth": ("Gönderim anında zamanlayıcıda bekleyen URL sayısı", DEPTH_BUCKETS),
+}
+COUNTERS = {
+    "fetch_requests_total": "Başarılı HTTP istekleri",
+    "fetch_errors_total": "Başarısız HTTP istekleri (SOCKS, bağlantı veya zaman aşımı)",
+    "fetch_retries_total": "Geçici hatadan sonra yeniden denenen istekler",
+    "fetch_skipped_total": "Devre kesicisi açık olduğu için gönderilmeyen istekler",
+    "fetch_bytes_total": "İndirilen toplam gövde baytı",
+    "indicators_found_total": "Sayfalardan çıkarılan göstergeler (tekilleştirme öncesi)",
+    "watchlist_alerts_total": "Sayfalarda bulunan izleme listesi eşleşmeleri",
+    "mirror_pages_total": "Daha önce görülen bir sayfanın aynası olduğu için ayrıştırılmayan sayfalar",
+}
+PREFIX = "onion_scan_"
+
+
+class Histogram:
+    """Sabit kovalı histogram; yüzdelikler kova sınırları arasında doğrusal tahmin edilir"""
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # son kova: +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets + (math.inf,), self.counts):
+            if count and seen + count >= rank:
+                if upper == math.inf:
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return lower
+
+    def to_dict(self):
+        cumulative = 0
+        buckets = {}
+        for upper, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[str(upper)] = cumulative
+        buckets["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "p50": _round(self.quantile(0.5)),
+            "p90": _round(self.quantile(0.9)),
+            "p99": _round(self.quantile(0.99)),
+            "buckets": buckets,
+        }
+
+
+def _round(value):
+    return round(value, 6) if value is not None else None
+
+
+class MetricsRegistry:
+    """Bir taramanın ölçümleri (thread güvenli)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.perf_counter()
+            self.histograms = {name: Histogram(buckets) for name, (_, buckets) in HISTOGRAMS.items()}
+            self.counters = dict.fromkeys(COUNTERS, 0)
+            self.stages = {}
+
+    def observe(self, name, value):
+        with self._lock:
+            self.histograms[name].observe(value)
+
+    def inc(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Bloğun duvar saati süresini `name` aşamasına ekle"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def elapsed(self):
+        """Son sıfırlamadan beri geçen süre (saniye)"""
+        return time.perf_counter() - self.started
+
+    def snapshot(self):
+        """Rapora yazılacak özet"""
+        with self._lock:
+            return {
+                "elapsed_seconds": round(self.elapsed(), 3),
+                "stages": {name: round(seconds, 3) for name, seconds in self.stages.items()},
+                "counters": dict(self.counters),
+                "histograms": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            }
+
+    def render_prometheus(self):
+        """Prometheus metin biçimi (exposition format 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, histogram in self.histograms.items():
+                metric = PREFIX + name
+                lines.append(f"# HELP {metric} {HISTOGRAMS[name][0]}")
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for upper, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{upper}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum {histogram.sum}")
+                lines.append(f"{metric}_count {histogram.count}")
+            for name, value in self.counters.items():
+                metric = PREFIX + name
+                lines.append(f"# HELP {metric} {COUNTERS[name]}")
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+            metric = PREFIX + "stage_seconds"
+            lines.append(f"# HELP {metric} Tarama aşamalarının duvar saati süresi")
+            lines.append(f"# TYPE {metric} gauge")
+            for name, seconds in self.stages.items():
+                lines.append(f'{metric}{{stage="{name}"}} {seconds}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path=None):
+        """Prometheus metnini dosyaya atomik yaz (node_exporter textfile collector için)"""
+        path = path or config.METRICS_FILE
+        if not path:
+            return None
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+        return path
+
+
+# İndirme yolu, tarayıcı ve script.main tarafından paylaşılan kayıt
+REGISTRY = MetricsRegistry()
+observe = REGISTRY.observe
+inc = REGISTRY.inc
+stage = REGISTRY.stage
+reset = REGISTRY.reset
+snapshot = REGISTRY.snapshot
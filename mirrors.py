@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Ayna ve neredeyse aynı sayfa tespiti (MinHash imzaları ve LSH bant indeksi).
+
+Onion servisleri çok sayıda adreste aynalanır; aynı dizin sayfası onlarca kez indirilir.
+Her sayfanın ham gövdesi ayrıştırılmadan önce boşluklardan bölünüp üçlülere (shingle) ayrılır ve
+tek permütasyonlu MinHash ile 64 yuvalık bir imzaya indirgenir. İmzalar 16 banda
+ayrılıp bant anahtarlarıyla indekslenir; yalnızca en az bir bandı tutan sayfalar
+karşılaştırılır, bu yüzden yeni bir sayfanın kontrolü görülen sayfa sayısından bağımsızdır.
+"""
+import zlib
+from array import array
+
+import config
+
+SLOTS = 64
+BANDS = 16
+ROWS = SLOTS // BANDS
+SHINGLE = 3
+# Bundan az üçlüsü olan sayfalar (hata sayfaları, yönlendirmeler) karşılaştırılmaz
+MIN_SHINGLES = 16
+EMPTY = 0xFFFFFFFF
+
+
+def fingerprint(body):
+    """Ham sayfa gövdesinin MinHash imzası (`array('I')`); içerik çok kısaysa None"""
+    # Etiketler dahil boşlukla ayrılmış parçalar: HTML ayrıştırmadan ve küçük harfe çevirmeden (aynalar birebir kopyadır)
+    tokens = body.split()
+    shingles = set(map(zlib.crc32, map(b" ".join, zip(*(tokens[i:] for i in range(SHINGLE))))))
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    # Tek permütasyon: özetin alt 6 biti yuvayı seçer, yuvada en küçük özet kalır.
+    # Özetler küçükten büyüğe gezildiğinden her yuvaya ilk gelen değer en küçüğüdür.
+    slots = [EMPTY] * SLOTS
+    empty = SLOTS
+    for h in sorted(shingles):
+        slot = h & (SLOTS - 1)
+        if slots[slot] == EMPTY:
+            slots[slot] = h
+            empty -= 1
+            if not empty:
+                break
+    return array("I", slots)
+
+
+def similarity(first, second):
+    """İki imzanın tahmini Jaccard benzerliği (yalnızca en az birinde dolu olan yuvalar sayılır)"""
+    used = equal = 0
+    for a, b in zip(first, second):
+        if a != EMPTY or b != EMPTY:
+            used += 1
+            equal += a == b
+    return equal / used if used else 0.0
+
+
+class MirrorIndex:
+    """Görülen sayfaların imzaları; yeni sayfanın daha önce görülen bir kopyasını bulur"""
+
+    def __init__(self, threshold=None):
+        threshold = config.MIRROR_SIMILARITY if threshold is None else threshold
+        self.threshold = threshold / 100
+        self._buckets = [{} for _ in range(BANDS)]  # bant anahtarı -> [imza numarası, ...]
+        self.urls = []
+        self.signatures = []
+
+    def __len__(self):
+        return len(self.urls)
+
+    @staticmethod
+    def _bands(signature):
+        raw = signature.tobytes()
+        width = ROWS * signature.itemsize
+        return [raw[band * width:(band + 1) * width] for band in range(BANDS)]
+
+    def find(self, signature):
+        """İmzaya eşik üzerinde benzeyen ilk sayfanın URL'si, yoksa None"""
+        seen = set()
+        for buckets, key in zip(self._buckets, self._bands(signature)):
+            for candidate in buckets.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if similarity(signature, self.signatures[candidate]) >= self.threshold:
+                    return self.urls[candidate]
+        return None
+
+    def add(self, url, signature):
+        """Sayfayı özgün kopya olarak indekse ekle"""
+        number = len(self.urls)
+        self.urls.append(url)
+        self.signatures.append(signature)
+        for buckets, key in zip(self._buckets, self._bands(signature)):
+            buckets.setdefault(key, []).append(number)
+
+    def check(self, url, signature):
+        """Sayfa bir aynaysa özgün kopyanın URL'sini döndür, değilse sayfayı indekse ekleyip None döndür"""
+        original = self.find(signature)
+        if original is None:
+            self.add(url, signature)
+        return original
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Testler ve çevrimdışı benchmark'lar için sahte Tor ağı: yerel SOCKS5 proxy + gecikmeli HTTP yanıtlayıcıları ve sahte kontrol portu"""
+import asyncio
+import random
+import struct
+import threading
+
+
+class MockSite:
+    """Sanal bir .onion sitesinin yanıt ayarları"""
+
+    def __init__(self, body=b"", status=200, delay=0.0, headers=None):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.delay = delay
+        self.headers = headers or {}
+        self.requests = 0
+        self.not_modified = 0
+
+
+class MockTorNetwork:
+    """Arka plan thread'inde çalışan SOCKS5 proxy ve sanal siteler.
+
+    SOCKS5 CONNECT isteğindeki alan adı `add_site` ile eklenen sitelerden biri
+    değilse proxy "host erişilemez" yanıtı verir. Devre kurulumunu taklit etmek için
+    her CONNECT `latency` (+ en fazla `jitter`) saniye bekletilir; `failure_rate`
+    olasılıkla "TTL süresi doldu" hatası döner (`seed` ile tekrarlanabilir).
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, failure_rate=0.0, seed=None):
+        self.sites = {}
+        self.socks_connections = 0
+        self.socks_failures = 0
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._loop = None
+        self._thread = None
+        self._socks_server = None
+        self._http_server = None
+
+    def add_site(self, host, body=b"", status=200, delay=0.0, headers=None):
+        site = MockSite(body, status, delay, headers)
+        self.sites[host] = site
+        return site
+
+    @property
+    def proxy(self):
+        return ("127.0.0.1", self._socks_server.sockets[0].getsockname()[1])
+
+    def start(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_servers(), self._loop).result()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._stop_servers(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    async def _start_servers(self):
+        self._http_server = await asyncio.start_server(self._handle_http, "127.0.0.1", 0)
+        self._socks_server = await asyncio.start_server(self._handle_socks, "127.0.0.1", 0)
+
+    async def _stop_servers(self):
+        for server in (self._socks_server, self._http_server):
+            server.close()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    async def _handle_socks(self, reader, writer):
+        try:
+            _, method_count = await reader.readexactly(2)
+            await reader.readexactly(method_count)
+            writer.write(b"\x05\x00")
+
+            _, _, _, address_type = await reader.readexactly(4)
+            if address_type == 3:
+                length = (await reader.readexactly(1))[0]
+                host = (await reader.readexactly(length)).decode("idna")
+            elif address_type == 1:
+                host = ".".join(str(b) for b in await reader.readexactly(4))
+            else:
+                writer.write(b"\x05\x08\x00\x01" + b"\x00" * 6)
+                return
+            await reader.readexactly(2)
+
+            if host not in self.sites:
+                writer.write(b"\x05\x04\x00\x01" + b"\x00" * 6)
+                return
+            if self.latency or self.jitter:
+                await asyncio.sleep(self.latency + self._rng.uniform(0, self.jitter))
+            if self.failure_rate and self._rng.random() < self.failure_rate:
+                self.socks_failures += 1
+                writer.write(b"\x05\x06\x00\x01" + b"\x00" * 6)
+                return
+
+            self.socks_connections += 1
+            http_port = self._http_server.sockets[0].getsockname()[1]
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", http_port)
+            writer.write(b"\x05\x00\x00\x01" + bytes(4) + struct.pack(">H", 0))
+            await writer.drain()
+            await asyncio.gather(
+                self._pipe(reader, upstream_writer),
+                self._pipe(upstream_reader, writer),
+            )
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _pipe(reader, writer):
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_http(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                site = self.sites.get(headers.get("host", "").split(":")[0])
+                if site is None:
+                    break
+                site.requests += 1
+                if site.delay:
+                    await asyncio.sleep(site.delay)
+
+                status, body = site.status, site.body
+                etag = site.headers.get("ETag")
+                if etag and headers.get("if-none-match") == etag:
+                    site.not_modified += 1
+                    status, body = 304, b""
+
+                response_headers = {"Content-Type": "text/html; charset=utf-8"}
+                response_headers.update(site.headers)
+                response_headers["Content-Length"] = str(len(body))
+                head = f"HTTP/1.1 {status} MOCK\r\n" + "".join(
+                    f"{name}: {value}\r\n" for name, value in response_headers.items()
+                )
+                writer.write(head.encode("latin-1") + b"\r\n" + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class MockTorControl:
+    """Önyükleme yüzdesini taklit eden sahte Tor kontrol portu.
+
+    `progress` her `GETINFO status/bootstrap-phase` sorgusunda `step` kadar artar
+    (100'de durur). `cookie` verilirse AUTHENTICATE bu çerezin hex değerini bekler.
+    """
+
+    def __init__(self, progress=0, step=25, cookie=None):
+        self.progress = progress
+        self.step = step
+        self.cookie = cookie
+        self.queries = 0
+        self._loop = None
+        self._thread = None
+        self._server = None
+
+    @property
+    def address(self):
+        return ("127.0.0.1", self._server.sockets[0].getsockname()[1])
+
+    def start(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_server(), self._loop).result()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._stop_server(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    async def _start_server(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def _stop_server(self):
+        self._server.close()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    async def _handle(self, reader, writer):
+        authenticated = False
+        try:
+            while True:
+                line = (await reader.readline()).decode("ascii").strip()
+                if not line:
+                    break
+                if line.startswith("AUTHENTICATE"):
+                    given = line[len("AUTHENTICATE"):].strip()
+                    authenticated = self.cookie is None or given == self.cookie.hex()
+                    writer.write(b"250 OK\r\n" if authenticated else b"515 Authentication failed\r\n")
+                elif not authenticated:
+                    writer.write(b"514 Authentication required.\r\n")
+                elif line == "GETINFO status/bootstrap-phase":
+                    self.queries += 1
+                    progress, self.progress = self.progress, min(100, self.progress + self.step)
+                    tag = "done" if progress >= 100 else "conn"
+                    writer.write(
+                        f"250-status/bootstrap-phase=NOTICE BOOTSTRAP PROGRESS={progress} TAG={tag} "
+                        f'SUMMARY="Bootstrapping"\r\n250 OK\r\n'.encode("ascii")
+                    )
+                else:
+                    writer.write(b"510 Unrecognized command\r\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Onion adresi yardımcıları: URL normalleştirme, v3 adres doğrulama ve tekilleştirme indeksi"""
+import base64
+import hashlib
+import math
+from array import array
+from collections import Counter
+from urllib.parse import urldefrag, urljoin, urlsplit, urlunsplit
+
+V3_LENGTH = 56
+V3_VERSION = 3
+CHECKSUM_PREFIX = b".onion checksum"
+BASE32_ALPHABET = set("abcdefghijklmnopqrstuvwxyz234567")
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def v3_checksum(pubkey, version=V3_VERSION):
+    return hashlib.sha3_256(CHECKSUM_PREFIX + pubkey + bytes([version])).digest()[:2]
+
+
+def v3_address(pubkey):
+    """32 baytlık ed25519 açık anahtarından v3 onion adresi üret"""
+    raw = pubkey + v3_checksum(pubkey) + bytes([V3_VERSION])
+    return base64.b32encode(raw).decode('ascii').lower() + ".onion"
+
+
+def is_valid_v3(host):
+    """56 karakterlik base32 v3 adresini sağlama toplamı ve sürüm baytıyla doğrula"""
+    label = onion_domain(host)
+    if label is None:
+        return False
+    label = label[:-len(".onion")]
+    if len(label) != V3_LENGTH or not set(label) <= BASE32_ALPHABET:
+        return False
+    raw = base64.b32decode(label.upper())
+    pubkey, checksum, version = raw[:32], raw[32:34], raw[34]
+    return version == V3_VERSION and checksum == v3_checksum(pubkey)
+
+
+def onion_domain(host):
+    """Alt alan adlarını atarak onion alan adını döndür (ör. www.x.onion -> x.onion)"""
+    if not host:
+        return None
+    host = host.lower().rstrip('.')
+    if not host.endswith('.onion'):
+        return None
+    labels = host.split('.')
+    if len(labels) < 2 or not labels[-2]:
+        return None
+    return labels[-2] + '.onion'
+
+
+def canonicalize_url(href, base=None):
+    """Linki mutlak ve normalleştirilmiş http(s) URL'sine çevir; geçersizse None döndür.
+
+    Şema ve host küçük harfe çevrilir, varsayılan port ve fragment atılır, boş yol '/' olur.
+    """
+    href = (href or '').strip()
+    if base:
+        href = urljoin(base, href)
+    href, _ = urldefrag(href)
+    try:
+        parts = urlsplit(href)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower().rstrip('.')
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    return urlunsplit((scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+class BloomFilter:
+    """Çok büyük taramalarda tekilleştirme kümesinin yerine kullanılan olasılıksal küme"""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        """Elemanı ekle; daha önce (muhtemelen) eklenmişse False döndür"""
+        new = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                new = True
+        return new
+
+    def __contains__(self, item):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+
+class LinkList:
+    """Linklerin sütunlu listesi: her link için sözlük yerine üç sütunda birer eleman.
+
+    Adresler ve metinler iki listede tutulur. Aynı kaynak sayfadan bulunan binlerce link
+    kaynak URL'yi (`found_at`) tekrar saklamaz; kaynaklar bir kez internlenir ve link
+    başına 4 baytlık numarayla gösterilir. Okurken her link `{'url', 'text', 'found_at'}`
+    sözlüğü olarak o an üretilir, liste kopyalanmaz.
+    """
+    __slots__ = ("urls", "texts", "source_ids", "sources", "_source_index")
+
+    def __init__(self, links=()):
+        self.urls = []
+        self.texts = []
+        self.source_ids = array("I")
+        self.sources = []
+        self._source_index = {}
+        for link in links:
+            self.append(link['url'], link.get('text', ''), link.get('found_at'))
+
+    def append(self, url, text='', found_at=None):
+        source_id = self._source_index.get(found_at)
+        if source_id is None:
+            source_id = self._source_index[found_at] = len(self.sources)
+            self.sources.append(found_at)
+        self.urls.append(url)
+        self.texts.append(text)
+        self.source_ids.append(source_id)
+
+    def __len__(self):
+        return len(self.urls)
+
+    def __iter__(self):
+        sources = self.sources
+        for url, text, source_id in zip(self.urls, self.texts, self.source_ids):
+            yield {'url': url, 'text': text, 'found_at': sources[source_id]}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {'url': self.urls[index], 'text': self.texts[index], 'found_at': self.sources[self.source_ids[index]]}
+
+    def __eq__(self, other):
+        if isinstance(other, (LinkList, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+
+class OnionIndex:
+    """Normalleştirilmiş onion linklerinin artımlı tekilleştirme indeksi.
+
+    Link ve alan adı sayıları her eklemede O(1) güncellenir. `bloom_capacity`
+    verilirse görülen URL kümesi yerine Bloom filtresi kullanılır (yanlış pozitif
+    oranı kadar tekil link kaybedilebilir).
+    """
+
+    def __init__(self, validate=True, bloom_capacity=None):
+        self.validate = validate
+        self.seen = BloomFilter(bloom_capacity) if bloom_capacity else set()
+        self.links = LinkList()
+        self.domains = Counter()
+        self.sourced = 0
+        self.rejected = 0
+
+    def add(self, url, text='', found_at=None, base=None):
+        """Linki ekle; geçersiz veya tekrar eden linkler için False döndür"""
+        canonical = canonicalize_url(url, base)
+        domain = onion_domain(urlsplit(canonical).hostname) if canonical else None
+        if domain is None or (self.validate and not is_valid_v3(domain)):
+            self.rejected += 1
+            return False
+
+        if isinstance(self.seen, BloomFilter):
+            if not self.seen.add(canonical):
+                return False
+        else:
+            if canonical in self.seen:
+                return False
+            self.seen.add(canonical)
+
+        self.links.append(canonical, text, found_at)
+        self.domains[domain] += 1
+        if found_at:
+            self.sourced += 1
+        return True
+
+    def extend(self, links):
+        for link in links:
+            self.add(link['url'], link.get('text', ''), link.get('found_at'))
+
+    @property
+    def unique_domains(self):
+        return len(self.domains)
+
+    def __len__(self):
+        return len(self.links)
+
+    def __iter__(self):
+        return iter(self.links)
+
+    def __getitem__(self, index):
+        return self.links[index]
@@ -1,185 +1,267 @@
 #!/usr/bin/env python3
+# reportlab ve matplotlib ağır kütüphanelerdir; yalnızca rapor üretilirken, kullanan fonksiyonların
+# içinde içe aktarılırlar. Böylece bu modülü (veya script.py'yi) içe aktarmak tarama süresine eklenmez.
+import functools
+import hashlib
+import io
 import json
 import os
-from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
+import threading
 
-def create_charts(data):
-    """Create charts and save as files (English)"""
-    charts = {}
+import config
+
+CHART_DPI = 300
+CHART_CACHE_FILES = 64  # Önbellekte tutulan en fazla grafik sayısı
+CHART_VERSION = 1  # Grafik çizim kodu değişince artırılır; önbellekteki eski görseller kullanılmaz
+
+def chart_key(name, payload):
+    """Chart cache key: hash of the chart name and the data it is drawn from"""
+    raw = json.dumps([CHART_VERSION, CHART_DPI, name, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def _cached_chart(name, payload, render):
+    """Return PNG bytes for a chart, rendering it only if the same data was not drawn before"""
+    cache_dir = config.CHART_CACHE_DIR
+    path = os.path.join(cache_dir, f"{chart_key(name, payload)}.png") if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            png = f.read()
+        os.utime(path)  # En son kullanılanlar budamada korunur
+        return png
+    
+    png = render(payload)
+    if path:
+        # Eşzamanlı rapor üretimleri birbirinin yarım dosyasını okumasın
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+        _prune_chart_cache(cache_dir)
+    return png
+
+def _prune_chart_cache(cache_dir):
+    """Keep only the most recently used chart images"""
+    paths = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.png')]
+    if len(paths) <= CHART_CACHE_FILES:
+        return
+    paths.sort(key=os.path.getmtime, reverse=True)
+    for path in paths[CHART_CACHE_FILES:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def _figure_png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=CHART_DPI, bbox_inches='tight')
+    return buffer.getvalue()
+
+def _render_stats_chart(values):
+    from matplotlib.figure import Figure
     
     # 1. Onion link count chart
-    plt.figure(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
     categories = ['Total Links', 'Unique Domains', 'Successful Connections']
-    values = [
-        data['total_onion_links'],
-        data['scan_summary']['unique_domains'],
-        data['scan_summary']['successful_connections']
-    ]
     
-    bars = plt.bar(categories, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
-    plt.title('Onion Scan Statistics', fontsize=16, fontweight='bold')
-    plt.ylabel('Count', fontsize=12)
-    plt.xticks(rotation=45)
+    bars = ax.bar(categories, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
+    ax.set_title('Onion Scan Statistics', fontsize=16, fontweight='bold')
+    ax.set_ylabel('Count', fontsize=12)
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Değerleri barların üzerine yaz
     for bar, value in zip(bars, values):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
+        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
                 str(value), ha='center', va='bottom', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('onion_stats.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    charts['stats'] = 'onion_stats.png'
+    fig.tight_layout()
+    return _figure_png(fig)
+
+def _render_dark_web_chart(counts):
+    from matplotlib import cm
+    from matplotlib.figure import Figure
     
     # 2. Dark Web data distribution chart
+    categories = [cat for cat, _ in counts]
+    values = [value for _, value in counts]
+    
+    fig = Figure(figsize=(12, 8))
+    ax = fig.add_subplot()
+    ax.bar(range(len(categories)), values, color=cm.Set3(range(len(categories))))
+    ax.set_title('Dark Web Data Distribution', fontsize=16, fontweight='bold')
+    ax.set_ylabel('Record Count', fontsize=12)
+    ax.set_xticks(range(len(categories)))
+    ax.set_xticklabels([cat.replace('_', ' ').title() for cat in categories], rotation=45, ha='right')
+    
+    # Değerleri barların üzerine yaz
+    for i, v in enumerate(values):
+        ax.text(i, v + 0.1, str(v), ha='center', va='bottom', fontweight='bold')
+    
+    fig.tight_layout()
+    return _figure_png(fig)
+
+def create_charts(data):
+    """Create charts as in-memory PNG images (English); unchanged data is served from the chart cache"""
+    charts = {}
+    
+    stats = [
+        data['total_onion_links'],
+        data['scan_summary']['unique_domains'],
+        data['scan_summary']['successful_connections']
+    ]
+    charts['stats'] = _cached_chart('stats', stats, _render_stats_chart)
+    
     if 'dark_web_data' in data:
         dark_data = data['dark_web_data']
-        categories = list(dark_data.keys())
-        values = [len(dark_data[cat]) for cat in categories]
-        
-        plt.figure(figsize=(12, 8))
-        bars = plt.bar(range(len(categories)), values, color=plt.cm.Set3(range(len(categories))))
-        plt.title('Dark Web Data Distribution', fontsize=16, fontweight='bold')
-        plt.ylabel('Record Count', fontsize=12)
-        plt.xticks(range(len(categories)), [cat.replace('_', ' ').title() for cat in categories], rotation=45, ha='right')
-        
-        # Değerleri barların üzerine yaz
-        for i, v in enumerate(values):
-            plt.text(i, v + 0.1, str(v), ha='center', va='bottom', fontweight='bold')
-        
-        plt.tight_layout()
-        plt.savefig('dark_web_data.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        charts['dark_web'] = 'dark_web_data.png'
+        counts = [[cat, len(dark_data[cat])] for cat in dark_data]
+        charts['dark_web'] = _cached_chart('dark_web', counts, _render_dark_web_chart)
     
     return charts
 
-def create_dark_web_tables(dark_data):
-    """Create dark web data tables in English"""
-    tables = []
-    
-    # Email/Password table
-    if dark_data.get('email_passwords'):
-        email_data = [['Email', 'Password', 'Source']]
-        for item in dark_data['email_passwords'][:5]:  # İlk 5 kayıt
-            email_data.append([item['email'], item['password'], item['source']])
-        
-        email_table = Table(email_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-        email_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkred),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-        ]))
-        tables.append(('📧 Email Addresses and Passwords', email_table))
-    
-    # Credit card table
-    if dark_data.get('credit_cards'):
-        card_data = [['Card Number', 'Expiry', 'Bank']]
-        for item in dark_data['credit_cards']:
-            card_data.append([item['number'], item['expiry'], item['bank']])
-        
-        card_table = Table(card_data, colWidths=[2*inch, 1*inch, 2*inch])
-        card_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-        ]))
-        tables.append(('💳 Credit Card Numbers', card_table))
-    
-    # Identity numbers table
-    if dark_data.get('identity_numbers'):
-        id_data = [['Type', 'Number', 'Country']]
-        for item in dark_data['identity_numbers']:
-            id_data.append([item['type'], item['number'], item['country']])
-        
-        id_table = Table(id_data, colWidths=[1*inch, 2*inch, 1*inch])
-        id_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-        ]))
-        tables.append(('🆔 Identity Numbers', id_table))
-    
-    # Phishing sites table
-    if dark_data.get('phishing_sites'):
-        phish_data = [['URL', 'Target', 'Status']]
-        for item in dark_data['phishing_sites']:
-            phish_data.append([item['url'], item['target'], item['status']])
-        
-        phish_table = Table(phish_data, colWidths=[2.5*inch, 1.5*inch, 1*inch])
-        phish_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.orange),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-        ]))
-        tables.append(('🎣 Phishing Sites', phish_table))
-    
-    # Ransomware announcements table
-    if dark_data.get('ransomware_announcements'):
-        ransom_data = [['Group', 'Victim', 'Demand']]
-        for item in dark_data['ransomware_announcements']:
-            ransom_data.append([item['group'], item['victim'], item['demand']])
-        
-        ransom_table = Table(ransom_data, colWidths=[1.5*inch, 2*inch, 1.5*inch])
-        ransom_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.red),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-        ]))
-        tables.append(('🔒 Ransomware Announcements', ransom_table))
+def chart_flowable(png, width, height):
+    from reportlab.platypus import Image
     
+    return Image(io.BytesIO(png), width=width, height=height)
+
+class TableCategory:
+    """Table layout of one dark_web_data category"""
+    __slots__ = ('key', 'title', 'columns', 'widths', 'header_color')
+    
+    def __init__(self, key, title, columns, widths, header_color):
+        self.key = key
+        self.title = title
+        self.columns = columns            # [(alan adı, sütun başlığı), ...]
+        self.widths = widths              # inç cinsinden sütun genişlikleri
+        self.header_color = header_color  # reportlab.lib.colors içindeki renk adı
+
+TABLE_CATEGORIES = {}
+TABLE_CHUNK_ROWS = 250  # Tek tablodaki en fazla satır; büyük kategoriler parçalara bölünür
+TABLE_WIDTH = 5         # Kayıtlı olmayan kategoriler için toplam tablo genişliği (inç)
+
+@functools.lru_cache(maxsize=None)
+def _category_style(header_color):
+    """One TableStyle shared by every table chunk with the same header colour"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), getattr(colors, header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+    ])
+
+def register_category(key, title, columns, widths, header_color='darkslategray'):
+    """Add (or replace) the table layout of a dark_web_data category"""
+    if len(columns) != len(widths):
+        raise ValueError(f"{key}: sütun ve genişlik sayıları farklı")
+    TABLE_CATEGORIES[key] = TableCategory(key, title, columns, widths, header_color)
+
+register_category('email_passwords', '📧 Email Addresses and Passwords',
+                  [('email', 'Email'), ('password', 'Password'), ('source', 'Source')], [2, 1.5, 1.5], 'darkred')
+register_category('credit_cards', '💳 Credit Card Numbers',
+                  [('number', 'Card Number'), ('expiry', 'Expiry'), ('bank', 'Bank')], [2, 1, 2], 'darkblue')
+register_category('identity_numbers', '🆔 Identity Numbers',
+                  [('type', 'Type'), ('number', 'Number'), ('country', 'Country')], [1, 2, 1], 'darkgreen')
+register_category('phone_numbers', '📞 Phone Numbers',
+                  [('number', 'Number'), ('country', 'Country'), ('type', 'Type')], [2, 1, 1], 'purple')
+register_category('database_dumps', '🗄️ Database Dumps',
+                  [('name', 'Name'), ('size', 'Size'), ('records', 'Records')], [2.5, 1, 1.5], 'darkslategray')
+register_category('phishing_sites', '🎣 Phishing Sites',
+                  [('url', 'URL'), ('target', 'Target'), ('status', 'Status')], [2.5, 1.5, 1], 'orange')
+register_category('ransomware_announcements', '🔒 Ransomware Announcements',
+                  [('group', 'Group'), ('victim', 'Victim'), ('demand', 'Demand')], [1.5, 2, 1.5], 'red')
+register_category('malware_links', '🦠 Malware Links',
+                  [('url', 'URL'), ('type', 'Type'), ('detection', 'Detection')], [2.5, 1.5, 1], 'darkmagenta')
+register_category('hacked_sites', '💻 Hacked Sites',
+                  [('domain', 'Domain'), ('breach_date', 'Breach Date'), ('records', 'Records')], [2, 1.5, 1.5], 'brown')
+register_category('username_passwords', '👤 Usernames and Passwords',
+                  [('username', 'Username'), ('password', 'Password'), ('source', 'Source')], [1.5, 1.5, 2], 'darkcyan')
+register_category('personal_data', '👨‍💼 Personal Data',
+                  [('name', 'Name'), ('email', 'Email'), ('phone', 'Phone'), ('address', 'Address')],
+                  [1.2, 1.6, 1.1, 1.6], 'darkolivegreen')
+register_category('watchlist_alerts', '🚨 Watchlist Alerts',
+                  [('entry', 'Entry'), ('kind', 'Type'), ('matched', 'Matched'), ('source', 'Source'),
+                   ('context', 'Seen In')], [1.1, 0.6, 1.1, 1.7, 0.5], 'red')
+
+def category_for(key, rows):
+    """Registered layout of a category, or one derived from the fields of its first row"""
+    if key in TABLE_CATEGORIES:
+        return TABLE_CATEGORIES[key]
+    fields = list(rows[0]) if rows and isinstance(rows[0], dict) else ['value']
+    columns = [(field, field.replace('_', ' ').title()) for field in fields]
+    widths = [TABLE_WIDTH / len(columns)] * len(columns)
+    return TableCategory(key, f"📁 {key.replace('_', ' ').title()}", columns, widths, 'darkslategray')
+
+def _cell(item, field):
+    if not isinstance(item, dict):
+        return str(item)
+    value = item.get(field, '')
+    return '' if value is None else str(value)
+
+def iter_category_tables(category, rows, chunk_rows=None):
+    """Yield LongTable chunks of at most `chunk_rows` rows, each repeating the header"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import LongTable
+    
+    chunk_rows = chunk_rows or TABLE_CHUNK_ROWS
+    header = [title for _, title in category.columns]
+    fields = [field for field, _ in category.columns]
+    widths = [width * inch for width in category.widths]
+    style = _category_style(category.header_color)
+    
+    for start in range(0, len(rows), chunk_rows):
+        data = [header]
+        data.extend([_cell(item, field) for field in fields] for item in rows[start:start + chunk_rows])
+        yield LongTable(data, colWidths=widths, repeatRows=1, style=style)
+
+def create_dark_web_tables(dark_data, chunk_rows=None):
+    """Create dark web data tables in English: [(title, [table chunk, ...]), ...] for every non-empty category"""
+    tables = []
+    for key, rows in dark_data.items():
+        if not rows:
+            continue
+        category = category_for(key, rows)
+        tables.append((category.title, list(iter_category_tables(category, rows, chunk_rows))))
     return tables
 
-def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_scan_report.pdf"):
-    """Create PDF report in English"""
-    
-    # JSON dosyasını oku
-    if not os.path.exists(json_file):
-        print(f"❌ {json_file} not found!")
-        return False
-    
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # PDF dokümanı oluştur
-    doc = SimpleDocTemplate(output_file, pagesize=A4)
-    story = []
+LINKS_PER_TABLE = 500  # Büyük rapor modunda her LongTable parçasındaki satır sayısı
+FLOWABLE_BUFFER = 64   # Akış modunda bellekte bekletilen flowable sayısı
+
+class FlowableStream(list):
+    """Flowable list that is refilled lazily from a generator while doc.build() consumes it"""
+    
+    def __init__(self, flowables, buffer_size=FLOWABLE_BUFFER):
+        super().__init__()
+        self._source = iter(flowables)
+        self._buffer_size = buffer_size
+    
+    def _refill(self):
+        while list.__len__(self) < self._buffer_size:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                break
+    
+    def __len__(self):
+        self._refill()
+        return list.__len__(self)
+    
+    def __getitem__(self, index):
+        self._refill()
+        return list.__getitem__(self, index)
+
+def _report_styles():
+    """Return (title, heading, normal) paragraph styles"""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     
-    # Stil tanımları
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -198,7 +280,56 @@ def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_sc
         textColor=colors.darkred
     )
     
-    normal_style = styles['Normal']
+    return title_style, heading_style, styles['Normal']
+
+METRIC_LABELS = {
+    'fetch_socks_connect_seconds': "SOCKS connect (s)",
+    'fetch_ttfb_seconds': "Time to first byte (s)",
+    'fetch_download_seconds': "Download (s)",
+    'fetch_parse_seconds': "Parse (s)",
+    'fetch_response_bytes': "Response size (bytes)",
+    'indicator_extract_seconds': "Indicator extraction (s)",
+    'page_fingerprint_seconds': "Mirror fingerprint (s)",
+    'scheduler_wait_seconds': "Host queue wait (s)",
+    'scheduler_queue_depth': "Host queue depth",
+}
+
+def _metrics_table(scan_metrics):
+    """Stage wall times and per-request histogram summaries"""
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table, TableStyle
+    
+    def fmt(value):
+        return "-" if value is None else f"{value:.3f}" if value < 1000 else f"{value:,.0f}"
+    
+    rows = [["Measurement", "Count", "Mean", "p50", "p90", "p99"]]
+    for stage, seconds in scan_metrics.get('stages', {}).items():
+        rows.append([f"Stage: {stage} (s)", "1", fmt(seconds), "", "", ""])
+    for name, histogram in scan_metrics.get('histograms', {}).items():
+        if histogram['count']:
+            rows.append([METRIC_LABELS.get(name, name), str(histogram['count']), fmt(histogram['mean']),
+                         fmt(histogram['p50']), fmt(histogram['p90']), fmt(histogram['p99'])])
+    
+    table = Table(rows, colWidths=[2.2*inch, 0.7*inch, 0.9*inch, 0.9*inch, 0.9*inch, 0.9*inch])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
+    ]))
+    return table
+
+def _summary_story(data, charts):
+    """Build title, scan summary, charts and dark web tables"""
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, PageBreak
+    
+    title_style, heading_style, _ = _report_styles()
+    story = []
     
     # Başlık
     story.append(Paragraph("🔍 Tor Onion Scanner - Dark Web Intelligence Report", title_style))
@@ -230,19 +361,30 @@ def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_sc
     story.append(scan_table)
     story.append(Spacer(1, 20))
     
-    # Grafikleri oluştur
-    charts = create_charts(data)
+    # İzleme listesi eşleşmeleri özetin hemen ardından gösterilir
+    if data.get('watchlist_alerts'):
+        alerts = data['watchlist_alerts']
+        category = category_for('watchlist_alerts', alerts)
+        story.append(Paragraph(f"{category.title} ({len(alerts)})", heading_style))
+        story.extend(iter_category_tables(category, alerts))
+        story.append(Spacer(1, 20))
+    
+    # Ölçülen aşama ve istek süreleri
+    if data.get('scan_metrics'):
+        story.append(Paragraph("⏱️ Scan Timing", heading_style))
+        story.append(_metrics_table(data['scan_metrics']))
+        story.append(Spacer(1, 20))
     
     # İstatistik grafiği
     if 'stats' in charts:
         story.append(Paragraph("📈 Scan Statistics", heading_style))
-        story.append(Paragraph(f"<img src='{charts['stats']}' width='400' height='240'/>", normal_style))
+        story.append(chart_flowable(charts['stats'], 400, 240))
         story.append(Spacer(1, 20))
     
     # Dark Web veri grafiği
     if 'dark_web' in charts:
         story.append(Paragraph("🌐 Dark Web Data Distribution", heading_style))
-        story.append(Paragraph(f"<img src='{charts['dark_web']}' width='400' height='320'/>", normal_style))
+        story.append(chart_flowable(charts['dark_web'], 400, 320))
         story.append(Spacer(1, 20))
     
     # Dark Web verileri tabloları
@@ -253,11 +395,76 @@ def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_sc
         
         dark_tables = create_dark_web_tables(data['dark_web_data'])
         
-        for title, table in dark_tables:
+        for title, chunks in dark_tables:
             story.append(Paragraph(title, heading_style))
-            story.append(table)
+            story.extend(chunks)
             story.append(Spacer(1, 12))
     
+    return story
+
+@functools.lru_cache(maxsize=None)
+def _link_table_style():
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
+    ])
+
+def _link_row(i, link):
+    url = link['url'][:50] + "..." if len(link['url']) > 50 else link['url']
+    text = link['text'][:30] + "..." if len(link['text']) > 30 else link['text']
+    return [str(i), url, text]
+
+def _security_warning_story():
+    from reportlab.platypus import Paragraph, PageBreak
+    
+    _, heading_style, normal_style = _report_styles()
+    return [
+        PageBreak(),
+        Paragraph("⚠️ Security Warning", heading_style),
+        Paragraph(
+        """
+        This report is for educational and research purposes only. The indicators shown were extracted from crawled pages; sensitive values (passwords, card and identity numbers) are masked. 
+        The content of the found links has not been checked and may be potentially dangerous. Before accessing these links, 
+        take your security precautions and do not forget your legal responsibilities.
+        """, normal_style)
+    ]
+
+def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_scan_report.pdf", large=False):
+    """Create PDF report in English (set `large` to stream every link with bounded memory)"""
+    
+    # JSON dosyasını oku
+    if not os.path.exists(json_file):
+        print(f"❌ {json_file} not found!")
+        return False
+    
+    if large:
+        from report_source import JsonReportSource
+        return create_large_pdf_report(JsonReportSource(json_file), output_file)
+    
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak
+    
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    # PDF dokümanı oluştur
+    doc = SimpleDocTemplate(output_file, pagesize=A4)
+    _, heading_style, normal_style = _report_styles()
+    
+    # Grafikleri oluştur
+    charts = create_charts(data)
+    story = _summary_story(data, charts)
+    
     # Onion linkleri listesi
     story.append(PageBreak())
     story.append(Paragraph("🔗 Found Onion Links", heading_style))
@@ -267,21 +474,10 @@ def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_sc
     table_data = [["#", "URL", "Description"]]
     
     for i, link in enumerate(data['onion_links'][:20], 1):
-        url = link['url'][:50] + "..." if len(link['url']) > 50 else link['url']
-        text = link['text'][:30] + "..." if len(link['text']) > 30 else link['text']
-        table_data.append([str(i), url, text])
+        table_data.append(_link_row(i, link))
     
     link_table = Table(table_data, colWidths=[0.5*inch, 3*inch, 2*inch])
-    link_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey])
-    ]))
+    link_table.setStyle(_link_table_style())
     
     story.append(link_table)
     
@@ -290,25 +486,59 @@ def create_pdf_report(json_file="onion_scan_results.json", output_file="onion_sc
         story.append(Paragraph(f"... and {len(data['onion_links']) - 20} more links", normal_style))
     
     # Güvenlik notu
-    story.append(PageBreak())
-    story.append(Paragraph("⚠️ Security Warning", heading_style))
-    story.append(Paragraph(
-        """
-        This report is for educational and research purposes only. The data shown are fake and do not represent real individuals. 
-        The content of the found links has not been checked and may be potentially dangerous. Before accessing these links, 
-        take your security precautions and do not forget your legal responsibilities.
-        """, normal_style))
+    story.extend(_security_warning_story())
     
     # PDF'i oluştur
     doc.build(story)
     
-    # Geçici dosyaları temizle
-    for chart_file in charts.values():
-        if os.path.exists(chart_file):
-            os.remove(chart_file)
-    
     print(f"✅ PDF report generated: {output_file}")
     return True
 
+def _large_report_story(source, charts, chunk_rows):
+    """Yield report flowables lazily; links are laid out as paginated LongTable chunks"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer, LongTable, PageBreak
+    
+    _, heading_style, normal_style = _report_styles()
+    data = dict(source.header, total_onion_links=source.link_count)
+    
+    yield from _summary_story(data, charts)
+    
+    yield PageBreak()
+    yield Paragraph(f"🔗 Found Onion Links ({source.link_count})", heading_style)
+    yield Spacer(1, 12)
+    
+    # Tüm parçalar aynı stil nesnesini paylaşır
+    style = _link_table_style()
+    rows = [["#", "URL", "Description"]]
+    for i, link in enumerate(source.iter_links(), 1):
+        rows.append(_link_row(i, link))
+        if len(rows) > chunk_rows:
+            yield LongTable(rows, colWidths=[0.7*inch, 3*inch, 2*inch], repeatRows=1, style=style)
+            rows = [["#", "URL", "Description"]]
+    if len(rows) > 1:
+        yield LongTable(rows, colWidths=[0.7*inch, 3*inch, 2*inch], repeatRows=1, style=style)
+    
+    yield from _security_warning_story()
+
+def create_large_pdf_report(source, output_file="onion_scan_report.pdf", chunk_rows=LINKS_PER_TABLE):
+    """Create PDF report for very large scans.
+    
+    `source` is a `report_source` object (JSON file or scan store). Links are streamed from
+    the source and the story is produced lazily, so the whole result set is never held in memory.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate
+    
+    doc = SimpleDocTemplate(output_file, pagesize=A4)
+    data = dict(source.header, total_onion_links=source.link_count)
+    charts = create_charts(data)
+    
+    doc.build(FlowableStream(_large_report_story(source, charts, chunk_rows)))
+    
+    print(f"✅ PDF report generated: {output_file} ({source.link_count} links)")
+    return True
+
 if __name__ == "__main__":
-    create_pdf_report() 
\ No newline at end of file
+    import sys
+    create_pdf_report(large='--large' in sys.argv[1:])
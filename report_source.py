@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Rapor üretimi için sonuçları belleğe toplamadan okuyan kaynaklar (JSON dosyası veya tarama deposu)"""
+import json
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\r\n"
+
+
+class _StreamReader:
+    """JSON metnini dosyadan parça parça okuyup değerleri tek tek çözen yardımcı"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        # Tüketilen kısmı at ki tampon büyümesin
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Boşlukları atlayıp sıradaki karakteri döndür (dosya sonunda '')"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON ayrıştırma hatası: '{char}' bekleniyordu, '{self.peek()}' bulundu")
+        self.pos += 1
+
+    def value(self):
+        """Sıradaki tam JSON değerini çöz"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Tamponun sonunda biten sayı yarım kalmış olabilir
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_top_level(path, stream_key):
+    """Üst seviye JSON nesnesini akış halinde oku.
+
+    Diğer anahtarlar için (anahtar, değer) üretilir; `stream_key` dizisinin her elemanı
+    ayrı ayrı (stream_key, eleman) olarak üretilir, dizi bir bütün olarak belleğe alınmaz.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _StreamReader(f)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == stream_key and reader.peek() == "[":
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield key, reader.value()
+                        if reader.peek() == ",":
+                            reader.pos += 1
+                            continue
+                        reader.expect("]")
+                        break
+            else:
+                yield key, reader.value()
+            if reader.peek() == ",":
+                reader.pos += 1
+                continue
+            reader.expect("}")
+            return
+
+
+class JsonReportSource:
+    """`onion_scan_results.json` biçimindeki dosyayı iki geçişte okuyan kaynak"""
+
+    def __init__(self, path):
+        self.path = path
+        self.header = {}
+        self.link_count = 0
+        # İlk geçiş: linkler sayılır ama saklanmaz
+        for key, value in iter_json_top_level(path, "onion_links"):
+            if key == "onion_links":
+                self.link_count += 1
+            else:
+                self.header[key] = value
+
+    def iter_links(self):
+        for key, value in iter_json_top_level(self.path, "onion_links"):
+            if key == "onion_links":
+                yield value
+
+
+class StoreReportSource:
+    """Tarama deposundaki (`ScanStore`) bir taramayı okuyan kaynak"""
+
+    def __init__(self, db_path=None, scan_id=None):
+        from scan_store import ScanStore
+        self.store = ScanStore(db_path)
+        self.scan_id = scan_id or self.store.latest_scan_id()
+        self.header = self.store.scan_header(self.scan_id)
+        self.link_count = self.header["total_onion_links"]
+
+    def iter_links(self):
+        return self.store.iter_links(self.scan_id)
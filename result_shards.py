@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Çalıştırma başına sıralı sonuç parçaları (shard) ve bunların akışlı k-yollu birleştirilmesi.
+
+Her parça, onion alan adına göre sıralı JSON satırlarından oluşur; her satır bir alan
+adının o çalıştırmadaki özetidir:
+
+    {"domain": ..., "url": ..., "text": ..., "first_seen": ..., "last_seen": ..., "hits": ..., "runs": 1}
+
+Birleştirme tüm parçaları aynı anda belleğe almaz: `heapq.merge` her parçadan yalnızca
+sıradaki satırı tutar. Açık dosya sayısı `fan_in` ile sınırlanır; daha fazla parça varsa
+ara parçalar üretilerek birden çok geçişte birleştirilir. Kullanım:
+
+    python result_shards.py runs/ -o merged.shard.jsonl --fan-in 256
+"""
+import argparse
+import glob
+import heapq
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from operator import itemgetter
+from urllib.parse import urlsplit
+
+import config
+from onion_address import canonicalize_url, onion_domain
+
+SHARD_SUFFIX = ".shard.jsonl"
+RESULT_SUFFIX = ".json"
+
+
+def shard_path_for(json_file):
+    """`onion_scan_results.json` -> `onion_scan_results.shard.jsonl`"""
+    return os.path.splitext(json_file)[0] + SHARD_SUFFIX
+
+
+def domain_records(links, seen_at):
+    """Linkleri alan adına göre özetleyip alan adı sırasıyla döndür"""
+    records = {}
+    for link in links:
+        url = canonicalize_url(link['url'])
+        domain = onion_domain(urlsplit(url).hostname) if url else None
+        if domain is None:
+            continue
+        record = records.get(domain)
+        if record is None:
+            records[domain] = {"domain": domain, "url": url, "text": link.get('text', ''),
+                               "first_seen": seen_at, "last_seen": seen_at, "hits": 1, "runs": 1}
+        else:
+            record["hits"] += 1
+    return [records[domain] for domain in sorted(records)]
+
+
+def write_records(path, records):
+    """Sıralı kayıtları parçaya atomik olarak yaz (yarım parça okunmasın)"""
+    tmp_path = f"{path}.tmp"
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def write_shard(links, path, seen_at):
+    """Bir çalıştırmanın linklerinden parça dosyası yaz; alan adı sayısını döndür"""
+    return write_records(path, domain_records(links, seen_at))
+
+
+def read_shard(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def shard_from_results(json_file, path):
+    """Eski biçimdeki bir JSON sonuç dosyasından parça üret (yalnızca bu dosyanın linkleri okunur)"""
+    from report_source import JsonReportSource
+
+    source = JsonReportSource(json_file)
+    return write_shard(source.iter_links(), path, source.header.get("scan_date"))
+
+
+def combine(records):
+    """Aynı alan adına ait kayıtları birleştir: ilk/son görülme, toplam isabet ve çalıştırma sayısı"""
+    records = iter(records)
+    merged = dict(next(records))
+    for record in records:
+        if record["first_seen"] and (not merged["first_seen"] or record["first_seen"] < merged["first_seen"]):
+            # Temsilci link, alan adının ilk görüldüğü çalıştırmadan alınır
+            merged["first_seen"], merged["url"], merged["text"] = record["first_seen"], record["url"], record["text"]
+        if record["last_seen"] and (not merged["last_seen"] or record["last_seen"] > merged["last_seen"]):
+            merged["last_seen"] = record["last_seen"]
+        merged["hits"] += record["hits"]
+        merged["runs"] += record["runs"]
+    return merged
+
+
+def merge_records(streams):
+    """Alan adına göre sıralı kayıt akışlarını k-yollu birleştir ve tekilleştir"""
+    merged = heapq.merge(*streams, key=itemgetter("domain"))
+    for _, group in itertools.groupby(merged, key=itemgetter("domain")):
+        yield combine(group)
+
+
+def _merge_pass(paths, output):
+    files = [read_shard(path) for path in paths]
+    try:
+        return write_records(output, merge_records(files))
+    finally:
+        for stream in files:
+            stream.close()
+
+
+def merge_shards(paths, output, fan_in=None, tmp_dir=None):
+    """Parçaları `output` dosyasında birleştir; en fazla `fan_in` parça aynı anda açılır.
+
+    Birleştirilen alan adı sayısını döndürür.
+    """
+    fan_in = max(2, fan_in or config.MERGE_FAN_IN)
+    paths = list(paths)
+    if not paths:
+        return write_records(output, [])
+
+    scratch = tempfile.mkdtemp(prefix="shard_merge_", dir=tmp_dir)
+    try:
+        level = 0
+        while len(paths) > fan_in:
+            # Ara geçiş: parçaları fan_in'lik gruplar halinde birleştir
+            next_paths = []
+            for i in range(0, len(paths), fan_in):
+                intermediate = os.path.join(scratch, f"level{level}_{i // fan_in}{SHARD_SUFFIX}")
+                _merge_pass(paths[i:i + fan_in], intermediate)
+                next_paths.append(intermediate)
+            for path in paths:
+                if path.startswith(scratch):
+                    os.remove(path)
+            paths = next_paths
+            level += 1
+        return _merge_pass(paths, output)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def find_shards(source, tmp_dir):
+    """Dizindeki parçaları bul; parçası olmayan JSON sonuç dosyalarını parçaya çevir"""
+    if os.path.isdir(source):
+        shards = sorted(glob.glob(os.path.join(source, "**", f"*{SHARD_SUFFIX}"), recursive=True))
+        results = sorted(glob.glob(os.path.join(source, "**", f"*{RESULT_SUFFIX}"), recursive=True))
+    else:
+        matches = sorted(glob.glob(source))
+        shards = [path for path in matches if path.endswith(SHARD_SUFFIX)]
+        results = [path for path in matches if path.endswith(RESULT_SUFFIX)]
+
+    existing = set(shards)
+    for i, json_file in enumerate(results):
+        if shard_path_for(json_file) in existing:
+            continue
+        try:
+            shard = os.path.join(tmp_dir, f"converted_{i}{SHARD_SUFFIX}")
+            shard_from_results(json_file, shard)
+        except (ValueError, KeyError, OSError) as e:
+            print(f"⚠️ {json_file} atlandı: {e}")
+            continue
+        shards.append(shard)
+    return shards
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="çalıştırma çıktılarının dizini veya glob deseni")
+    parser.add_argument("-o", "--output", default="merged" + SHARD_SUFFIX)
+    parser.add_argument("--fan-in", type=int, default=config.MERGE_FAN_IN, help="aynı anda açık parça sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="shard_convert_") as tmp_dir:
+        shards = find_shards(args.source, tmp_dir)
+        domains = merge_shards(shards, args.output, args.fan_in)
+    print(f"✅ {len(shards)} parça birleştirildi: {domains} tekil alan adı -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
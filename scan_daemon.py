@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Sürekli çalışan tarayıcı servisi: yerel HTTP API üzerinden tarama işi kuyruğu.
+
+İşler tek bir tarama thread'inde sırayla çalışır. Bu thread'in event loop'u işler
+arasında kapanmaz; Tor devre havuzu, keep-alive bağlantılar, sayfa önbelleği, Tor durum
+önbelleği ve içe aktarılmış modüller sonraki işlerde sıcak olarak kullanılır.
+
+    POST   /jobs        {"seeds": [...], "max_depth": 1, "max_pages": 200, "output": "ad", "report": true}
+    GET    /jobs        tüm işler
+    GET    /jobs/<id>   iş durumu ve sonucu
+    DELETE /jobs/<id>   kuyruktaki işi iptal et
+    GET    /health      servis durumu
+    GET    /metrics     son taramanın metrikleri (Prometheus metin biçimi)
+"""
+import itertools
+import json
+import os
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import config
+import metrics
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+OUTPUT_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+MAX_BODY = 64 * 1024
+
+
+class ScanJob:
+    """Kuyruktaki bir tarama işi"""
+    __slots__ = ("id", "seeds", "max_depth", "max_pages", "output", "report", "priority",
+                 "status", "created_at", "started_at", "finished_at", "result", "error")
+
+    def __init__(self, job_id, seeds, max_depth, max_pages, output, report, priority):
+        self.id = job_id
+        self.seeds = seeds
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.output = output
+        self.report = report
+        self.priority = priority
+        self.status = QUEUED
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def parse_job_spec(spec):
+    """İstek gövdesini doğrula; (seeds, max_depth, max_pages, output, report, priority) döndür"""
+    if not isinstance(spec, dict):
+        raise ValueError("İş tanımı bir JSON nesnesi olmalı")
+    seeds = spec.get("seeds")
+    if seeds is not None and (not isinstance(seeds, list) or not seeds
+                              or not all(isinstance(seed, str) and seed for seed in seeds)):
+        raise ValueError("'seeds' boş olmayan bir URL listesi olmalı")
+    values = {}
+    for name in ("max_depth", "max_pages", "priority"):
+        value = spec.get(name)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 0):
+            raise ValueError(f"'{name}' negatif olmayan bir tam sayı olmalı")
+        values[name] = value
+    output = spec.get("output")
+    if output is not None and (not isinstance(output, str) or not OUTPUT_NAME_RE.match(output)
+                               or output in (".", "..")):
+        raise ValueError("'output' yalnızca harf, rakam, '.', '_' ve '-' içeren bir ad olmalı")
+    report = spec.get("report", False)
+    if not isinstance(report, bool):
+        raise ValueError("'report' true ya da false olmalı")
+    return seeds, values["max_depth"], values["max_pages"], output, report, values["priority"] or 0
+
+
+class ScanDaemon:
+    """İş kuyruğu, tarama thread'i ve HTTP API"""
+
+    def __init__(self, host=None, port=None, output_dir=None, history=None, scan=None):
+        self.output_dir = os.path.abspath(output_dir or config.DAEMON_OUTPUT_DIR)
+        self.history = history or config.DAEMON_JOB_HISTORY
+        self.scan = scan or run_scan
+        self.jobs = {}
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._completed = 0
+        self._worker = threading.Thread(target=self._work, name="scan-worker", daemon=True)
+        self.server = ThreadingHTTPServer((host or config.DAEMON_HOST,
+                                           config.DAEMON_PORT if port is None else port), _Handler)
+        self.server.scan_daemon = self
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def start(self):
+        """Tarama thread'ini ve HTTP sunucusunu arka planda başlat"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._worker.start()
+        threading.Thread(target=self.server.serve_forever, name="scan-api", daemon=True).start()
+        return self
+
+    def serve_forever(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._worker.start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._worker.is_alive():
+            self._queue.put((float("-inf"), -1, None))
+            self._worker.join()
+
+    # --- kuyruk ---
+
+    def submit(self, spec):
+        seeds, max_depth, max_pages, output, report, priority = parse_job_spec(spec)
+        with self._lock:
+            job_id = str(next(self._ids))
+            job = ScanJob(job_id, seeds, max_depth, max_pages, output or f"job_{job_id}", report, priority)
+            self.jobs[job_id] = job
+            self._forget_old_jobs()
+        # Yüksek öncelikli iş önce çalışır; eşitlikte geliş sırası korunur
+        self._queue.put((-priority, next(self._order), job))
+        return job
+
+    def cancel(self, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status != QUEUED:
+                return job, False
+            job.status = CANCELLED
+            job.finished_at = datetime.now().isoformat()
+            return job, True
+
+    def _forget_old_jobs(self):
+        finished = [job for job in self.jobs.values() if job.status in (DONE, FAILED, CANCELLED)]
+        for job in finished[:max(0, len(self.jobs) - self.history)]:
+            del self.jobs[job.id]
+
+    def health(self):
+        with self._lock:
+            counts = {}
+            for job in self.jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.monotonic() - self._started, 1),
+            "queue_depth": counts.get(QUEUED, 0),
+            "running": counts.get(RUNNING, 0),
+            "completed": self._completed,
+            "jobs": counts,
+        }
+
+    def _work(self):
+        from async_fetcher import warm_loop
+
+        with warm_loop():
+            while True:
+                _, _, job = self._queue.get()
+                if job is None:
+                    return
+                with self._lock:
+                    if job.status != QUEUED:
+                        continue
+                    job.status = RUNNING
+                    job.started_at = datetime.now().isoformat()
+                try:
+                    result = self.scan(job, os.path.join(self.output_dir, job.output))
+                    status, error = DONE, None
+                except Exception as e:
+                    result, status, error = None, FAILED, f"{type(e).__name__}: {e}"
+                with self._lock:
+                    job.result, job.status, job.error = result, status, error
+                    job.finished_at = datetime.now().isoformat()
+                    self._completed += 1
+
+
+def _remove_frontier(db_path):
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def run_scan(job, output_dir):
+    """Bir işi çalıştır: Tor kontrolü, tarama, depoya kayıt ve isteğe bağlı PDF rapor"""
+    import script
+
+    os.makedirs(output_dir, exist_ok=True)
+    json_file = os.path.join(output_dir, "onion_scan_results.json")
+    # Her iş boş, kendine ait bir frontier ile başlar: aynı çıktı adını kullanan işler
+    # (veya yeniden başlatılan servisin aynı numaralı işi) önceki işin kuyruğunu devralmaz
+    crawl_db = os.path.join(output_dir, f"crawl_frontier_{job.id}.db")
+    _remove_frontier(crawl_db)
+    started = time.perf_counter()
+    metrics.reset()
+
+    try:
+        with metrics.stage("tor_check"):
+            tor_status = script.test_tor_connection()
+        with metrics.stage("crawl"):
+            onion_links = script.get_onion_links(job.seeds, max_depth=job.max_depth, max_pages=job.max_pages,
+                                                 db_path=crawl_db)
+        with metrics.stage("indicators"):
+            dark_web_data = script.collect_dark_web_data(onion_links, crawl_db)
+            watchlist_alerts = script.collect_watchlist_alerts(onion_links, crawl_db)
+            mirror_groups = script.collect_mirror_groups(crawl_db)
+        with metrics.stage("save"):
+            report_data = script.save_to_json(onion_links, tor_status, dark_web_data, json_file=json_file,
+                                              watchlist_alerts=watchlist_alerts, mirror_groups=mirror_groups)
+        result = {
+            "scan_id": report_data["scan_id"],
+            "tor_connection": tor_status,
+            "total_onion_links": report_data["total_onion_links"],
+            "unique_domains": report_data["scan_summary"]["unique_domains"],
+            "watchlist_alerts": len(watchlist_alerts) if watchlist_alerts is not None else None,
+            "mirror_groups": len(mirror_groups) if mirror_groups is not None else None,
+            "json_file": json_file,
+            "pdf_file": None,
+        }
+        if job.report:
+            from pdf_generator import create_pdf_report
+            pdf_file = os.path.join(output_dir, "onion_scan_report.pdf")
+            with metrics.stage("pdf_report"):
+                ok = create_pdf_report(json_file, pdf_file,
+                                       large=report_data["total_onion_links"] > config.LARGE_REPORT_THRESHOLD)
+            if ok:
+                result["pdf_file"] = pdf_file
+    finally:
+        _remove_frontier(crawl_db)
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    result["stages"] = metrics.snapshot()["stages"]
+    return result
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "OnionScanDaemon/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_id(self):
+        parts = self.path.rstrip("/").split("/")
+        return parts[2] if len(parts) == 3 and parts[1] == "jobs" else None
+
+    def do_GET(self):
+        daemon = self.server.scan_daemon
+        if self.path == "/health":
+            return self._send(200, daemon.health())
+        if self.path == "/metrics":
+            body = metrics.REGISTRY.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path.rstrip("/") == "/jobs":
+            with daemon._lock:
+                jobs = [job.to_dict() for job in daemon.jobs.values()]
+            return self._send(200, {"jobs": jobs})
+        job_id = self._job_id()
+        job = daemon.jobs.get(job_id) if job_id else None
+        if job is None:
+            return self._send(404, {"error": "İş bulunamadı"})
+        with daemon._lock:
+            return self._send(200, job.to_dict())
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            return self._send(404, {"error": "Bilinmeyen adres"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY:
+                raise ValueError("İstek gövdesi çok büyük")
+            spec = json.loads(self.rfile.read(length) or b"{}")
+            job = self.server.scan_daemon.submit(spec)
+        except ValueError as e:
+            return self._send(400, {"error": str(e)})
+        self._send(202, job.to_dict())
+
+    def do_DELETE(self):
+        job_id = self._job_id()
+        job, cancelled = self.server.scan_daemon.cancel(job_id) if job_id else (None, False)
+        if job is None:
+            return self._send(404, {"error": "İş bulunamadı"})
+        if not cancelled:
+            return self._send(409, {"error": f"İş iptal edilemez (durum: {job.status})"})
+        self._send(200, job.to_dict())
+
+
+def serve(host=None, port=None, output_dir=None):
+    daemon = ScanDaemon(host, port, output_dir)
+    host, port = daemon.address
+    print(f"🛰️ Tarama servisi dinleniyor: http://{host}:{port} (çıktılar: {daemon.output_dir})")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Tarama servisi durduruluyor...")
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Tarama sonuçlarının kalıcı, indeksli SQLite deposu (JSON raporu bu deponun bir görünümüdür)"""
+import json
+import sqlite3
+from urllib.parse import urlsplit
+
+import config
+from onion_address import onion_domain
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY,
+    scan_date TEXT NOT NULL,
+    tor_connection INTEGER NOT NULL,
+    total_onion_links INTEGER NOT NULL DEFAULT 0,
+    successful_connections INTEGER NOT NULL DEFAULT 0,
+    unique_domains INTEGER NOT NULL DEFAULT 0,
+    scan_duration TEXT,
+    dark_web_data TEXT,
+    scan_metrics TEXT,
+    watchlist_alerts TEXT,
+    mirror_groups TEXT
+);
+CREATE INDEX IF NOT EXISTS scans_date ON scans (scan_date);
+
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY,
+    scan_id INTEGER NOT NULL REFERENCES scans (id),
+    url TEXT NOT NULL,
+    domain TEXT,
+    text TEXT NOT NULL,
+    found_at TEXT
+);
+CREATE INDEX IF NOT EXISTS links_scan ON links (scan_id, id);
+CREATE INDEX IF NOT EXISTS links_domain ON links (domain);
+
+CREATE TABLE IF NOT EXISTS domains (
+    domain TEXT PRIMARY KEY,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    first_scan_id INTEGER NOT NULL,
+    last_scan_id INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS domains_first_seen ON domains (first_seen);
+CREATE INDEX IF NOT EXISTS domains_last_seen ON domains (last_seen);
+"""
+
+UPSERT_DOMAIN = """
+INSERT INTO domains (domain, first_seen, last_seen, first_scan_id, last_scan_id, hits)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (domain) DO UPDATE SET
+    last_seen = MAX(last_seen, excluded.last_seen),
+    last_scan_id = MAX(last_scan_id, excluded.last_scan_id),
+    hits = hits + excluded.hits
+"""
+
+
+class ScanStore:
+    """Taramaları, linkleri ve alan adlarının ilk/son görülme bilgisini tutan depo"""
+
+    def __init__(self, db_path=None, batch_size=None):
+        self.db_path = db_path or config.SCAN_DB_PATH
+        self.batch_size = batch_size or config.STORE_BATCH_SIZE
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        # Eski depolarda sonradan eklenen sütunlar yoksa eklenir
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(scans)")}
+        for column in ("scan_metrics", "watchlist_alerts", "mirror_groups"):
+            if column not in columns:
+                self.db.execute(f"ALTER TABLE scans ADD COLUMN {column} TEXT")
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def begin_scan(self, scan_date, tor_connection):
+        """Yeni tarama kaydı aç ve kimliğini döndür"""
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO scans (scan_date, tor_connection) VALUES (?, ?)",
+                (scan_date, int(bool(tor_connection))),
+            )
+        return cursor.lastrowid
+
+    def add_links(self, scan_id, links):
+        """Linkleri `batch_size`'lık gruplar halinde, her grup tek işlemde yaz"""
+        scan_date = self.db.execute("SELECT scan_date FROM scans WHERE id = ?", (scan_id,)).fetchone()[0]
+        batch = []
+        for link in links:
+            batch.append(link)
+            if len(batch) >= self.batch_size:
+                self._write_batch(scan_id, scan_date, batch)
+                batch = []
+        if batch:
+            self._write_batch(scan_id, scan_date, batch)
+
+    def _write_batch(self, scan_id, scan_date, links):
+        rows = []
+        hits = {}
+        for link in links:
+            domain = onion_domain(urlsplit(link['url']).hostname)
+            rows.append((scan_id, link['url'], domain, link.get('text', ''), link.get('found_at')))
+            if domain:
+                hits[domain] = hits.get(domain, 0) + 1
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO links (scan_id, url, domain, text, found_at) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self.db.executemany(
+                UPSERT_DOMAIN,
+                [(domain, scan_date, scan_date, scan_id, scan_id, count) for domain, count in hits.items()],
+            )
+
+    def finish_scan(self, scan_id, summary, dark_web_data=None, scan_metrics=None, watchlist_alerts=None,
+                    mirror_groups=None):
+        """Tarama özetini (ve varsa ölçülen metrikleri, izleme listesi uyarılarını ve ayna gruplarını) kaydet"""
+        with self.db:
+            self.db.execute(
+                """UPDATE scans SET total_onion_links = ?, successful_connections = ?,
+                   unique_domains = ?, scan_duration = ?, dark_web_data = ?, scan_metrics = ?,
+                   watchlist_alerts = ?, mirror_groups = ? WHERE id = ?""",
+                (
+                    summary['total_onion_links'],
+                    summary['successful_connections'],
+                    summary['unique_domains'],
+                    summary['scan_duration'],
+                    json.dumps(dark_web_data, ensure_ascii=False) if dark_web_data is not None else None,
+                    json.dumps(scan_metrics) if scan_metrics is not None else None,
+                    json.dumps(watchlist_alerts, ensure_ascii=False) if watchlist_alerts is not None else None,
+                    json.dumps(mirror_groups) if mirror_groups is not None else None,
+                    scan_id,
+                ),
+            )
+
+    # --- sorgular ---
+
+    def latest_scan_id(self):
+        row = self.db.execute("SELECT MAX(id) FROM scans").fetchone()
+        return row[0]
+
+    def iter_links(self, scan_id):
+        """Taramanın linklerini kayıt sırasıyla, belleğe toplamadan üret"""
+        cursor = self.db.execute(
+            "SELECT url, text, found_at FROM links WHERE scan_id = ? ORDER BY id", (scan_id,)
+        )
+        for url, text, found_at in cursor:
+            yield {'url': url, 'text': text, 'found_at': found_at}
+
+    def links_for_domain(self, domain):
+        """Bir alan adının tüm taramalarda bulunan linkleri"""
+        cursor = self.db.execute(
+            "SELECT scan_id, url, text, found_at FROM links WHERE domain = ? ORDER BY id", (domain,)
+        )
+        return [dict(zip(('scan_id', 'url', 'text', 'found_at'), row)) for row in cursor]
+
+    def domains_seen_since(self, since, column='first_seen'):
+        """`since` tarihinden sonra ilk (veya son) kez görülen alan adları"""
+        if column not in ('first_seen', 'last_seen'):
+            raise ValueError(f"Geçersiz sütun: {column}")
+        cursor = self.db.execute(
+            f"""SELECT domain, first_seen, last_seen, hits FROM domains
+                WHERE {column} >= ? ORDER BY {column}""",
+            (since,),
+        )
+        return [dict(zip(('domain', 'first_seen', 'last_seen', 'hits'), row)) for row in cursor]
+
+    def scan_header(self, scan_id):
+        row = self.db.execute(
+            """SELECT scan_date, tor_connection, total_onion_links, successful_connections,
+                      unique_domains, scan_duration, dark_web_data, scan_metrics, watchlist_alerts,
+                      mirror_groups
+               FROM scans WHERE id = ?""",
+            (scan_id,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Tarama bulunamadı: {scan_id}")
+        (scan_date, tor, total, successful, unique, duration, dark_web_data, scan_metrics, watchlist_alerts,
+         mirror_groups) = row
+        header = {
+            "scan_id": scan_id,
+            "scan_date": scan_date,
+            "tor_connection": bool(tor),
+            "total_onion_links": total,
+            "scan_summary": {
+                "successful_connections": successful,
+                "unique_domains": unique,
+                "scan_duration": duration,
+            },
+            "dark_web_data": json.loads(dark_web_data) if dark_web_data else {},
+        }
+        if watchlist_alerts is not None:
+            header["watchlist_alerts"] = json.loads(watchlist_alerts)
+        if mirror_groups is not None:
+            header["mirror_groups"] = json.loads(mirror_groups)
+        if scan_metrics:
+            header["scan_metrics"] = json.loads(scan_metrics)
+        return header
+
+    def export_json(self, path, scan_id=None):
+        """Taramayı `create_pdf_report`'un okuduğu JSON biçiminde dışa aktar.
+
+        Linkler veritabanından akış halinde yazılır, tamamı belleğe alınmaz.
+        """
+        scan_id = scan_id or self.latest_scan_id()
+        header = self.scan_header(scan_id)
+        summary = header.pop("scan_summary")
+        dark_web_data = header.pop("dark_web_data")
+        scan_metrics = header.pop("scan_metrics", None)
+        lists = {key: header.pop(key) for key in ("watchlist_alerts", "mirror_groups") if key in header}
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{\n")
+            for key, value in header.items():
+                f.write(f'  "{key}": {json.dumps(value, ensure_ascii=False)},\n')
+            f.write('  "onion_links": [')
+            for i, link in enumerate(self.iter_links(scan_id)):
+                f.write(",\n    " if i else "\n    ")
+                f.write(json.dumps(link, ensure_ascii=False))
+            f.write("\n  ],\n")
+            f.write('  "scan_summary": ')
+            f.write(json.dumps(summary, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+            # Uyarılar ve ayna grupları satır başına bir kayıt olarak yazılır
+            for key, rows in lists.items():
+                f.write(f',\n  "{key}": [')
+                for i, row in enumerate(rows):
+                    f.write(",\n    " if i else "\n    ")
+                    f.write(json.dumps(row, ensure_ascii=False))
+                f.write("\n  ]" if rows else "]")
+            if scan_metrics is not None:
+                f.write(',\n  "scan_metrics": ')
+                f.write(json.dumps(scan_metrics, indent=2).replace("\n", "\n  "))
+            f.write(',\n  "dark_web_data": ')
+            f.write(json.dumps(dark_web_data, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+            f.write("\n}\n")
+        return path
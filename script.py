@@ -1,40 +1,32 @@
 #!/usr/bin/env python3
-import requests
 import time
-from bs4 import BeautifulSoup
 import sys
-import json
 from datetime import datetime
 import random
+from crawler import CrawlFrontier, crawl
+from indicators import classify_links, group_records
+from watchlist import get_watchlist, link_alerts
+from tor_probe import check_tor
+from onion_address import OnionIndex
+from scan_store import ScanStore
+import metrics
+from result_shards import shard_path_for, write_shard
+import config
 
-def test_tor_connection():
+# Hidden Wiki URL'leri (bazıları erişilemeyebilir)
+HIDDEN_WIKI_URLS = [
+    "http://zqktlwiuavvvqqt4ybvgvi7tyo4hjl5xgfuvpdf6otjiycgwqbym2qad.onion/wiki/index.php/Main_Page",
+    "http://hiddenwiki.com",
+    "http://thehiddenwiki.org"
+]
+
+def test_tor_connection(refresh=False):
     """Tor bağlantısını test et"""
     print("🔍 Tor bağlantısı test ediliyor...")
     
-    proxies = {
-        'http': 'socks5h://127.0.0.1:9050',
-        'https': 'socks5h://127.0.0.1:9050'
-    }
-    
-    # Farklı .onion sitelerini dene
-    test_sites = [
-        'http://duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzczad.onion',
-        'http://zqktlwiuavvvqqt4ybvgvi7tyo4hjl5xgfuvpdf6otjiycgwqbym2qad.onion',
-        'http://protonmailrmez3lotccipshtkleegetolb73fuirgj7r4o4vfu7ozyd.onion'
-    ]
-    
-    for site in test_sites:
-        try:
-            print(f"📡 {site} deneniyor...")
-            response = requests.get(site, proxies=proxies, timeout=30)
-            if response.status_code == 200:
-                print(f"✅ Tor üzerinden bağlantı başarılı: {site}")
-                return True
-            else:
-                print(f"⚠️ Bağlantı kodu: {response.status_code}")
-        except Exception as e:
-            print(f"❌ {site} başarısız: {str(e)[:100]}...")
-            continue
+    # Test siteleri yarıştırılır, sonuç bir süre önbellekte tutulur
+    if check_tor(refresh=refresh):
+        return True
     
     print("❌ Hiçbir .onion sitesine bağlanılamadı")
     return False
@@ -102,49 +94,24 @@ def generate_fake_data():
     }
     return fake_data
 
-def get_onion_links():
-    """Hidden Wiki'den .onion linklerini topla"""
+def get_onion_links(seeds=None, concurrency=None, proxy=None, max_depth=None, max_pages=None, db_path=None):
+    """Hidden Wiki'den başlayarak .onion linklerini topla"""
     print("\n🌐 Hidden Wiki'den .onion linkleri toplanıyor...")
     
-    proxies = {
-        'http': 'socks5h://127.0.0.1:9050',
-        'https': 'socks5h://127.0.0.1:9050'
-    }
-    
     # Hidden Wiki URL'leri (bazıları erişilemeyebilir)
-    hidden_wiki_urls = [
-        "http://zqktlwiuavvvqqt4ybvgvi7tyo4hjl5xgfuvpdf6otjiycgwqbym2qad.onion/wiki/index.php/Main_Page",
-        "http://hiddenwiki.com",
-        "http://thehiddenwiki.org"
-    ]
-    
-    onion_links = []
-    
-    for url in hidden_wiki_urls:
-        try:
-            print(f"📡 {url} deneniyor...")
-            response = requests.get(url, proxies=proxies, timeout=30)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # .onion linklerini bul
-                links = soup.find_all('a', href=True)
-                for link in links:
-                    href = link['href']
-                    if '.onion' in href:
-                        onion_links.append({
-                            'url': href,
-                            'text': link.get_text(strip=True)[:50],
-                            'found_at': url
-                        })
-                
-                print(f"✅ {len([l for l in onion_links if '.onion' in l['url']])} .onion linki bulundu")
-                break
-                
-        except Exception as e:
-            print(f"❌ {url} erişilemedi: {e}")
-            continue
+    hidden_wiki_urls = seeds or HIDDEN_WIKI_URLS
+    
+    # Kaynaklar eşzamanlı indirilir, bulunan .onion linkleri derinlik sınırına kadar takip edilir
+    print(f"📡 {len(hidden_wiki_urls)} kaynaktan tarama başlatılıyor...")
+    onion_links = crawl(
+        hidden_wiki_urls,
+        max_depth=max_depth,
+        max_pages=max_pages,
+        db_path=db_path,
+        concurrency=concurrency,
+        proxy=proxy
+    )
+    print(f"✅ Toplam {len(onion_links)} .onion linki bulundu")
     
     # Eğer gerçek link bulunamazsa sahte linkler ekle
     if not onion_links:
@@ -156,47 +123,118 @@ def get_onion_links():
             {"url": "http://email.onion", "text": "Secure Email", "found_at": "fake_source"},
             {"url": "http://chat.onion", "text": "Anonymous Chat", "found_at": "fake_source"}
         ]
+        onion_links = OnionIndex(validate=False)
         onion_links.extend(fake_links)
     
     return onion_links
 
-def save_to_json(onion_links, tor_status, fake_data):
-    """Sonuçları JSON dosyasına kaydet"""
+def collect_dark_web_data(onion_links, db_path=None):
+    """Taranan sayfalardan çıkarılan göstergeleri dark_web_data şemasında topla"""
+    frontier = CrawlFrontier(db_path)
+    try:
+        found = list(frontier.indicators())
+    finally:
+        frontier.close()
+    found.extend(classify_links(onion_links))
+    dark_web_data = group_records(found)
+    
+    # Temiz bir tarama boş kategorilerle raporlanır, sahte kayıtlarla doldurulmaz
+    if not any(dark_web_data.values()):
+        print("ℹ️ Sayfalarda gösterge bulunamadı")
+    return dark_web_data
+
+def collect_watchlist_alerts(onion_links, db_path=None):
+    """Sayfalarda ve link adres/metinlerinde bulunan izleme listesi eşleşmeleri; liste yoksa None"""
+    watchlist = get_watchlist()
+    if watchlist is None:
+        return None
+    frontier = CrawlFrontier(db_path)
+    try:
+        alerts = list(frontier.alerts())
+    finally:
+        frontier.close()
+    alerts.extend(link_alerts(watchlist, onion_links))
+    print(f"🚨 İzleme listesi ({len(watchlist)} girdi): {len(alerts)} uyarı")
+    return alerts
+
+def collect_mirror_groups(db_path=None):
+    """Taramada aynı içeriği sunduğu bulunan sayfa grupları; ayna tespiti kapalıysa None"""
+    if not config.MIRROR_SIMILARITY:
+        return None
+    frontier = CrawlFrontier(db_path)
+    try:
+        return frontier.mirror_groups()
+    finally:
+        frontier.close()
+
+def save_to_json(onion_links, tor_status, dark_web_data, json_file="onion_scan_results.json", db_path=None,
+                 scan_metrics=None, watchlist_alerts=None, mirror_groups=None):
+    """Sonuçları tarama deposuna kaydet ve JSON görünümünü dışa aktar"""
+    # Sayılar indeks tarafından her eklemede güncellenir, burada yeniden hesaplanmaz
+    if not isinstance(onion_links, OnionIndex):
+        index = OnionIndex(validate=False)
+        index.extend(onion_links)
+        onion_links = index
+    # Süre ve başarılı bağlantı sayısı indirme yolunda ölçülen değerlerden gelir
+    if scan_metrics is None:
+        scan_metrics = metrics.snapshot()
+    
     report_data = {
         "scan_date": datetime.now().isoformat(),
         "tor_connection": tor_status,
         "total_onion_links": len(onion_links),
-        "onion_links": onion_links,
+        "onion_links": onion_links.links,
         "scan_summary": {
-            "successful_connections": len([l for l in onion_links if l.get('found_at')]),
-            "unique_domains": len(set([l['url'].split('/')[2] for l in onion_links if '.onion' in l['url']])),
-            "scan_duration": "~30 seconds"
-        },
-        "dark_web_data": fake_data
+            "successful_connections": scan_metrics["counters"]["fetch_requests_total"],
+            "unique_domains": onion_links.unique_domains,
+            "scan_duration": f"{scan_metrics['elapsed_seconds']:.1f} seconds"
+        }
     }
+    if watchlist_alerts is not None:
+        report_data["watchlist_alerts"] = watchlist_alerts
+    if mirror_groups is not None:
+        report_data["mirror_groups"] = mirror_groups
+    report_data["scan_metrics"] = scan_metrics
+    report_data["dark_web_data"] = dark_web_data
     
-    with open("onion_scan_results.json", "w", encoding="utf-8") as f:
-        json.dump(report_data, f, indent=2, ensure_ascii=False)
+    # Geçmiş taramalar depoda kalır, JSON dosyası yalnızca bu taramanın görünümüdür
+    with ScanStore(db_path) as store:
+        scan_id = store.begin_scan(report_data["scan_date"], tor_status)
+        store.add_links(scan_id, onion_links)
+        store.finish_scan(scan_id, dict(report_data["scan_summary"], total_onion_links=len(onion_links)), dark_web_data,
+                          scan_metrics, watchlist_alerts, mirror_groups)
+        store.export_json(json_file, scan_id)
+    report_data["scan_id"] = scan_id
+    # Çalıştırmalar arası birleştirme için alan adına göre sıralı parça (result_shards.py)
+    write_shard(onion_links, shard_path_for(json_file), report_data["scan_date"])
     
-    print(f"\n📄 Sonuçlar 'onion_scan_results.json' dosyasına kaydedildi")
+    print(f"\n📄 Sonuçlar '{json_file}' dosyasına kaydedildi (tarama #{scan_id}, depo: {store.db_path})")
     return report_data
 
-def main():
+def main(scan_only=None):
+    if scan_only is None:
+        scan_only = config.SCAN_ONLY
     print("🚀 Tor üzerinden .onion siteleri tarayıcısı başlatılıyor...")
     print("=" * 50)
+    metrics.reset()
     
     # Tor bağlantısını test et
-    tor_status = test_tor_connection()
+    with metrics.stage("tor_check"):
+        tor_status = test_tor_connection()
     
     if not tor_status:
         print("⚠️ Tor bağlantısı kurulamadı, sahte verilerle devam ediliyor...")
         tor_status = False
     
     # .onion linklerini topla
-    onion_links = get_onion_links()
+    with metrics.stage("crawl"):
+        onion_links = get_onion_links()
     
-    # Sahte veri üret
-    fake_data = generate_fake_data()
+    # Sayfalardan çıkarılan göstergeleri topla
+    with metrics.stage("indicators"):
+        dark_web_data = collect_dark_web_data(onion_links)
+        watchlist_alerts = collect_watchlist_alerts(onion_links)
+        mirror_groups = collect_mirror_groups()
     
     if onion_links:
         print(f"\n📋 Bulunan .onion linkleri ({len(onion_links)} adet):")
@@ -213,30 +251,54 @@ def main():
     # Dark web verilerini göster
     print("🔍 Dark Web Veri Özeti:")
     print("-" * 50)
-    print(f"📧 E-posta/Şifre: {len(fake_data['email_passwords'])} kayıt")
-    print(f"💳 Kredi Kartı: {len(fake_data['credit_cards'])} kayıt")
-    print(f"🆔 Kimlik No: {len(fake_data['identity_numbers'])} kayıt")
-    print(f"📞 Telefon: {len(fake_data['phone_numbers'])} kayıt")
-    print(f"🗄️ Veritabanı: {len(fake_data['database_dumps'])} dump")
-    print(f"🎣 Phishing: {len(fake_data['phishing_sites'])} site")
-    print(f"🔒 Ransomware: {len(fake_data['ransomware_announcements'])} duyuru")
-    print(f"🦠 Malware: {len(fake_data['malware_links'])} link")
-    print(f"💻 Hacklenen: {len(fake_data['hacked_sites'])} site")
-    print(f"👤 Kullanıcı/Şifre: {len(fake_data['username_passwords'])} kombinasyon")
-    print(f"👨‍💼 Kişisel Veri: {len(fake_data['personal_data'])} kayıt")
+    print(f"📧 E-posta/Şifre: {len(dark_web_data['email_passwords'])} kayıt")
+    print(f"💳 Kredi Kartı: {len(dark_web_data['credit_cards'])} kayıt")
+    print(f"🆔 Kimlik No: {len(dark_web_data['identity_numbers'])} kayıt")
+    print(f"📞 Telefon: {len(dark_web_data['phone_numbers'])} kayıt")
+    print(f"🗄️ Veritabanı: {len(dark_web_data['database_dumps'])} dump")
+    print(f"🎣 Phishing: {len(dark_web_data['phishing_sites'])} site")
+    print(f"🔒 Ransomware: {len(dark_web_data['ransomware_announcements'])} duyuru")
+    print(f"🦠 Malware: {len(dark_web_data['malware_links'])} link")
+    print(f"💻 Hacklenen: {len(dark_web_data['hacked_sites'])} site")
+    print(f"👤 Kullanıcı/Şifre: {len(dark_web_data['username_passwords'])} kombinasyon")
+    print(f"👨‍💼 Kişisel Veri: {len(dark_web_data['personal_data'])} kayıt")
     
     # JSON dosyasına kaydet
-    report_data = save_to_json(onion_links, tor_status, fake_data)
+    with metrics.stage("save"):
+        report_data = save_to_json(onion_links, tor_status, dark_web_data, watchlist_alerts=watchlist_alerts,
+                                   mirror_groups=mirror_groups)
+    
+    if scan_only:
+        write_metrics()
+        print("✅ Tarama tamamlandı! (yalnızca tarama modu, PDF oluşturulmadı)")
+        return
     
     # PDF raporu oluştur
     try:
-        from pdf_generator import create_pdf_report
-        create_pdf_report()
+        with metrics.stage("pdf_report"):
+            from pdf_generator import create_pdf_report
+            create_pdf_report(large=report_data['total_onion_links'] > config.LARGE_REPORT_THRESHOLD)
         print("📄 PDF raporu oluşturuldu: onion_scan_report.pdf")
     except Exception as e:
         print(f"⚠️ PDF oluşturma hatası: {e}")
     
+    write_metrics()
     print("✅ Tarama tamamlandı!")
 
+def write_metrics():
+    """Aşama sürelerini yazdır; METRICS_FILE ayarlıysa Prometheus dosyasını yaz"""
+    stages = metrics.snapshot()["stages"]
+    print("⏱️ Aşama süreleri: " + ", ".join(f"{name} {seconds:.1f} sn" for name, seconds in stages.items()))
+    path = metrics.REGISTRY.write_prometheus()
+    if path:
+        print(f"📈 Metrikler yazıldı: {path}")
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    if "--daemon" in sys.argv[1:]:
+        # Sürekli çalışan servis modu: işler HTTP API ile kuyruğa alınır
+        from scan_daemon import serve
+        serve()
+    else:
+        if "--resume" in sys.argv[1:]:
+            config.CRAWL_RESUME = True
+        main(scan_only=True if "--scan-only" in sys.argv[1:] else None) 
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Çevrimdışı benchmark ve testler için sentetik Hidden Wiki benzeri onion sayfaları.
+
+Sayfa boyutu (bayt) ve link yoğunluğu (KB başına link) ayarlanabilir. Onion linkleri
+korpustaki diğer sitelere işaret eder; böylece tarayıcı korpus içinde gezinebilir.
+Aynı `seed` her zaman aynı korpusu üretir.
+"""
+import random
+
+from onion_address import v3_address
+
+CATEGORIES = ["Financial Services", "Commercial Services", "Hosting", "Blogs", "Forums",
+              "Email / Messaging", "Drugs", "Hacking", "Whistleblowing", "Search Engines"]
+WORDS = ("market escrow mirror forum wiki vendor hosting bitcoin monero privacy secure anonymous "
+         "archive library mail chat index directory verified trusted service").split()
+
+
+def onion_hosts(count, seed=0):
+    """`count` adet geçerli v3 onion adresi (tekrarlanabilir)"""
+    rng = random.Random(seed)
+    return [v3_address(rng.randbytes(32)) for _ in range(count)]
+
+
+def _filler(rng, length):
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def hidden_wiki_page(rng, hosts, size_bytes=64 * 1024, links_per_kb=4.0, onion_ratio=0.8):
+    """Kategori başlıkları altında link listeleri içeren bir dizin sayfası üret.
+
+    Linklerin `onion_ratio` kadarı `hosts` içindeki onion sitelerine, kalanı clearnet
+    adreslerine gider. Sayfa yaklaşık `size_bytes` boyutundadır.
+    """
+    bytes_per_link = 1024 / links_per_kb if links_per_kb > 0 else float("inf")
+    parts = ["<html><head><title>The Hidden Wiki</title></head><body>\n<h1>The Hidden Wiki</h1>\n"]
+    size = len(parts[0])
+    row = 0
+    while size < size_bytes:
+        if row % 25 == 0:
+            parts.append(f"<h2>{CATEGORIES[(row // 25) % len(CATEGORIES)]}</h2>\n")
+        title = f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {row}"
+        if hosts and rng.random() < onion_ratio:
+            href = f"http://{rng.choice(hosts)}/{rng.choice(('', 'index.php', 'forum/'))}"
+        else:
+            href = f"https://{rng.choice(WORDS)}-{row}.example.com/"
+        anchor = f'<li><a href="{href}">{title}</a> - '
+        # Link yoğunluğu açıklama metninin uzunluğuyla ayarlanır
+        filler_length = max(0, min(int(bytes_per_link), size_bytes) - len(anchor) - 6)
+        line = anchor + _filler(rng, filler_length) + "</li>\n"
+        parts.append(line)
+        size += len(line)
+        row += 1
+    parts.append("</body></html>\n")
+    return "".join(parts)
+
+
+class SyntheticCorpus:
+    """`sites` adet onion sitesi ve her biri için bir dizin sayfası"""
+
+    def __init__(self, sites=50, page_bytes=64 * 1024, links_per_kb=4.0, onion_ratio=0.8, seed=0):
+        self.hosts = onion_hosts(sites, seed)
+        rng = random.Random(seed)
+        self.pages = {host: hidden_wiki_page(rng, self.hosts, page_bytes, links_per_kb, onion_ratio)
+                      for host in self.hosts}
+
+    @property
+    def seeds(self):
+        return [f"http://{self.hosts[0]}/"]
+
+    @property
+    def total_bytes(self):
+        return sum(len(page) for page in self.pages.values())
+
+    def serve(self, network, delay=0.0):
+        """Sayfaları `MockTorNetwork` sitelerine ekle"""
+        for host, page in self.pages.items():
+            network.add_site(host, page, delay=delay)
+        return network
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import time
+
+import pytest
+
+from async_fetcher import FetchError, fetch_many
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+import script
+
+MARKET = v3_address(b"m" * 32)
+FORUM = v3_address(b"f" * 32)
+PAGE = f"""
+<html><body>
+  <a href="http://{MARKET}/">  Market  </a>
+  <a href="http://example.com/">Clearnet</a>
+  <a href="http://{FORUM}/forum"><b>Forum</b> <i>Index</i></a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def tor_network():
+    with MockTorNetwork() as network:
+        yield network
+
+
+def test_fetch_through_socks(tor_network):
+    tor_network.add_site("seed.onion", PAGE)
+
+    result, = fetch_many(["http://seed.onion/wiki"], proxy=tor_network.proxy)
+
+    assert result.status == 200
+    assert MARKET.encode() in result.body
+    assert tor_network.socks_connections == 1
+
+
+def test_fetches_run_concurrently(tor_network):
+    urls = []
+    for i in range(4):
+        tor_network.add_site(f"slow{i}.onion", PAGE, delay=0.5)
+        urls.append(f"http://slow{i}.onion/")
+
+    started = time.monotonic()
+    results = fetch_many(urls, concurrency=4, proxy=tor_network.proxy)
+    elapsed = time.monotonic() - started
+
+    assert all(r.status == 200 for r in results)
+    assert elapsed < 1.5
+
+
+def test_concurrency_is_capped(tor_network, monkeypatch):
+    monkeypatch.setattr("config.MAX_FETCH_CONCURRENCY", 2)
+    urls = []
+    for i in range(4):
+        tor_network.add_site(f"slow{i}.onion", PAGE, delay=0.3)
+        urls.append(f"http://slow{i}.onion/")
+
+    started = time.monotonic()
+    fetch_many(urls, concurrency=50, proxy=tor_network.proxy)
+    elapsed = time.monotonic() - started
+
+    # 4 istek / 2 eşzamanlı = en az iki tur
+    assert elapsed >= 0.6
+
+
+def test_dead_seed_does_not_block_others(tor_network):
+    tor_network.add_site("dead.onion", PAGE, delay=5)
+    tor_network.add_site("alive.onion", PAGE)
+
+    started = time.monotonic()
+    dead, alive, unknown = fetch_many(
+        ["http://dead.onion/", "http://alive.onion/", "http://unknown.onion/"],
+        proxy=tor_network.proxy,
+        timeout=1,
+    )
+
+    assert time.monotonic() - started < 2
+    assert isinstance(dead, FetchError)
+    assert isinstance(unknown, FetchError)
+    assert alive.status == 200
+
+
+def test_get_onion_links_keeps_link_shape(tor_network, tmp_path):
+    tor_network.add_site("seed.onion", PAGE)
+    tor_network.add_site("other.onion", "", status=503)
+
+    links = script.get_onion_links(
+        seeds=["http://seed.onion/wiki", "http://other.onion/"],
+        proxy=tor_network.proxy,
+        db_path=str(tmp_path / "frontier.db"),
+    )
+
+    assert list(links) == [
+        {"url": f"http://{MARKET}/", "text": "Market", "found_at": "http://seed.onion/wiki"},
+        {"url": f"http://{FORUM}/forum", "text": "ForumIndex", "found_at": "http://seed.onion/wiki"},
+    ]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+import json
+import os
+
+import pytest
+
+import script
+from batch_report import create_pdf_reports, find_result_files, report_paths
+
+
+def write_results(path, link_count):
+    data = {"scan_date": "2026-01-01T00:00:00", "tor_connection": True, "total_onion_links": link_count,
+            "onion_links": [{"url": f"http://{i}.onion/", "text": str(i), "found_at": "seed"}
+                            for i in range(link_count)],
+            "scan_summary": {"unique_domains": link_count, "successful_connections": 1, "scan_duration": "1s"},
+            "dark_web_data": script.generate_fake_data()}
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_batch_renders_in_worker_processes(tmp_path, monkeypatch):
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    for i in range(3):
+        write_results(results_dir / f"scan_{i}.json", i + 1)
+    (results_dir / "broken.json").write_text('{"scan_date": ', encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("config.LARGE_REPORT_THRESHOLD", 2)
+
+    results = create_pdf_reports(str(results_dir), str(tmp_path / "reports"), workers=2)
+
+    assert [r["json_file"] for r in results] == find_result_files(str(results_dir))
+    assert [os.path.basename(r["json_file"]) for r in results] == ["broken.json", "scan_0.json", "scan_1.json", "scan_2.json"]
+    broken, *good = results
+    assert not broken["ok"] and broken["error"]
+    assert all(r["ok"] and r["seconds"] > 0 for r in good)
+    assert sorted(os.listdir(tmp_path / "reports")) == ["scan_0.pdf", "scan_1.pdf", "scan_2.pdf"]
+    assert {r["worker"] for r in good} - {os.getpid()}
+    assert sorted(os.listdir(tmp_path)) == ["chart_cache", "reports", "results"]
+
+
+def test_fleet_runs_get_separate_reports(tmp_path, monkeypatch):
+    runs = tmp_path / "runs"
+    for name in ("run-a", "run-b"):
+        (runs / name).mkdir(parents=True)
+        write_results(runs / name / "onion_scan_results.json", 1)
+    monkeypatch.chdir(tmp_path)
+
+    results = create_pdf_reports(str(runs), str(tmp_path / "reports"), workers=2)
+
+    assert [os.path.relpath(r["output_file"], tmp_path / "reports") for r in results] == [
+        os.path.join("run-a", "onion_scan_results.pdf"), os.path.join("run-b", "onion_scan_results.pdf")]
+    assert all(r["ok"] for r in results)
+
+    # Aynı rapor yoluna düşen dosyalar hiçbir şey üretilmeden reddedilir
+    json_file = str(runs / "run-a" / "onion_scan_results.json")
+    with pytest.raises(ValueError):
+        report_paths([json_file, json_file], str(tmp_path / "reports"))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import pytest
+
+from crawler import CrawlFrontier, crawl
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+
+# Kısa adlar -> geçerli v3 onion adresleri
+HOSTS = {name: v3_address(bytes([i]) * 32) for i, name in enumerate("seed a b c d".split())}
+
+
+def onion(name, path="/"):
+    return f"http://{HOSTS[name]}{path}"
+
+
+def page(*hrefs):
+    return "<html><body>" + "".join(f'<a href="{h}">{h}</a>' for h in hrefs) + "</body></html>"
+
+
+@pytest.fixture
+def tor_network():
+    with MockTorNetwork() as network:
+        # seed -> a, b ; a -> c ; c -> d (derinlik 3)
+        network.add_site(HOSTS["seed"], page(onion("a"), onion("b"), "http://clear.net/", "http://fake.onion/"))
+        network.add_site(HOSTS["a"], page(onion("c"), onion("seed")))
+        network.add_site(HOSTS["b"], page(onion("a", "/#top"), onion("a").upper()))
+        network.add_site(HOSTS["c"], page(onion("d", "")))
+        network.add_site(HOSTS["d"], page())
+        yield network
+
+
+def test_crawl_follows_links_up_to_depth(tor_network, tmp_path):
+    links = crawl([onion("seed")], max_depth=2, db_path=str(tmp_path / "f.db"), proxy=tor_network.proxy)
+
+    # Linkler normalleştirilir ve tekilleştirilir, geçersiz adresler atılır
+    assert sorted(l["url"] for l in links) == sorted(onion(n) for n in "seed a b c d".split())
+    assert links.unique_domains == 5
+    # Derinlik 2'deki c taranır, d (derinlik 3) taranmaz
+    assert tor_network.sites[HOSTS["c"]].requests == 1
+    assert tor_network.sites[HOSTS["d"]].requests == 0
+    # Daha önce ziyaret edilen URL tekrar indirilmez
+    assert tor_network.sites[HOSTS["seed"]].requests == 1
+    assert tor_network.sites[HOSTS["a"]].requests == 1
+
+
+def test_crawl_resumes_without_refetching(tor_network, tmp_path):
+    db_path = str(tmp_path / "f.db")
+
+    first = crawl([onion("seed")], max_depth=3, max_pages=2, db_path=db_path,
+                  concurrency=1, proxy=tor_network.proxy)
+    assert CrawlFrontier(db_path).has_pending()
+
+    second = crawl([onion("seed")], max_depth=3, db_path=db_path, proxy=tor_network.proxy)
+
+    assert len(second) > len(first)
+    assert second[:len(first)] == first[:]
+    assert all(site.requests == 1 for site in tor_network.sites.values())
+
+
+def test_finished_crawl_starts_fresh(tor_network, tmp_path):
+    db_path = str(tmp_path / "f.db")
+    crawl([onion("seed")], max_depth=0, db_path=db_path, proxy=tor_network.proxy)
+    crawl([onion("seed")], max_depth=0, db_path=db_path, proxy=tor_network.proxy)
+
+    assert tor_network.sites[HOSTS["seed"]].requests == 2
+
+
+def test_interrupted_crawl_is_resumed_only_for_the_same_seeds(tor_network, tmp_path):
+    db_path = str(tmp_path / "f.db")
+    crawl([onion("seed")], max_depth=3, max_pages=1, db_path=db_path, proxy=tor_network.proxy)
+
+    # Farklı kaynaklarla başlayan tarama eski kuyruğu bırakıp yeni kaynaktan başlar
+    links = crawl([onion("c")], max_depth=0, max_pages=1, db_path=db_path, proxy=tor_network.proxy)
+    assert [link["url"] for link in links] == [onion("d")]
+    assert tor_network.sites[HOSTS["a"]].requests == 0
+    assert CrawlFrontier(db_path).seeds() == [onion("c")]
+
+    # Açıkça istenirse kaynaklar farklı olsa da devam edilir
+    crawl([onion("c")], max_depth=3, max_pages=1, db_path=db_path, proxy=tor_network.proxy)
+    assert CrawlFrontier(db_path).has_pending()
+    crawl([onion("b")], max_depth=3, db_path=db_path, proxy=tor_network.proxy, resume=True)
+    assert tor_network.sites[HOSTS["b"]].requests == 0
+    assert tor_network.sites[HOSTS["d"]].requests == 1
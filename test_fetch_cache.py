@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import pytest
+
+import crawler
+from async_fetcher import fetch_many
+from fetch_cache import FetchCache
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+
+LINKED = v3_address(b"l" * 32)
+PAGE = f'<a href="http://{LINKED}/">linked</a>'
+
+
+@pytest.fixture
+def tor_network():
+    with MockTorNetwork() as network:
+        yield network
+
+
+def test_etag_revalidation_serves_body_from_cache(tor_network, tmp_path):
+    site = tor_network.add_site("seed.onion", PAGE, headers={"ETag": '"v1"'})
+    cache = FetchCache(str(tmp_path / "cache"))
+
+    first, = fetch_many(["http://seed.onion/"], proxy=tor_network.proxy, cache=cache)
+    second, = fetch_many(["http://seed.onion/"], proxy=tor_network.proxy, cache=cache)
+
+    assert first.cache_status == "miss"
+    assert second.cache_status == "hit"
+    assert second.status == 200 and second.body == first.body
+    assert site.not_modified == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_unchanged_content_skips_link_extraction(tor_network, tmp_path, monkeypatch):
+    tor_network.add_site("seed.onion", PAGE)
+    cache = FetchCache(str(tmp_path / "cache"))
+    db_path = str(tmp_path / "frontier.db")
+
+    first = crawler.crawl(["http://seed.onion/"], max_depth=0, db_path=db_path,
+                          proxy=tor_network.proxy, cache=cache)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("değişmemiş sayfa yeniden ayrıştırıldı")
+
+    monkeypatch.setattr(crawler, "extract_onion_links", fail)
+    second = crawler.crawl(["http://seed.onion/"], max_depth=0, db_path=db_path,
+                           proxy=tor_network.proxy, cache=cache)
+
+    assert list(second) == list(first) and len(first) == 1
+    assert cache.stats()["unchanged"] == 1
+
+
+def test_changed_content_is_reparsed(tor_network, tmp_path):
+    site = tor_network.add_site("seed.onion", PAGE)
+    cache = FetchCache(str(tmp_path / "cache"))
+    db_path = str(tmp_path / "frontier.db")
+
+    crawler.crawl(["http://seed.onion/"], max_depth=0, db_path=db_path, proxy=tor_network.proxy, cache=cache)
+    other = v3_address(b"o" * 32)
+    site.body = f'<a href="http://{other}/">other</a>'.encode()
+    links = crawler.crawl(["http://seed.onion/"], max_depth=0, db_path=db_path,
+                          proxy=tor_network.proxy, cache=cache)
+
+    assert [l["url"] for l in links] == [f"http://{other}/"]
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = FetchCache(str(tmp_path / "cache"), max_bytes=250)
+    cache.store("http://a.onion/", {}, b"x" * 100)
+    cache.store("http://b.onion/", {}, b"x" * 100)
+    cache.touch("http://a.onion/")
+    cache.store("http://c.onion/", {}, b"x" * 100)
+
+    assert cache.evictions == 1
+    assert cache.lookup("http://b.onion/") is None
+    assert cache.read_body(cache.lookup("http://a.onion/")) == b"x" * 100
+    assert cache.lookup("http://c.onion/") is not None
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+import threading
+import time
+
+from fleet import ContainerRunner, DockerRunner, FleetRunner, LocalRunner, RunOutcome, container_command, summarize
+
+SCAN = "import json, os; json.dump({'run': os.environ['SCAN_RUN_NAME']}, open('onion_scan_results.json', 'w'))"
+FLAKY = "import os, sys; first = not os.path.exists('tried'); open('tried', 'w').close(); sys.exit(1 if first else 0)"
+
+
+def fleet(tmp_path, runner, **kw):
+    macs = iter(f"02:00:00:00:00:{i:02x}" for i in range(256))
+    return FleetRunner(runner, output_root=str(tmp_path / "runs"), retry_delay=0,
+                       mac_factory=lambda: next(macs), **kw)
+
+
+def test_runs_are_isolated_and_summarized(tmp_path):
+    runner = fleet(tmp_path, LocalRunner([sys.executable, "-c", SCAN]), concurrency=2, retries=0)
+    summaries = runner.run(3)
+
+    assert [s["status"] for s in summaries] == ["ok"] * 3
+    assert len({s["output_dir"] for s in summaries}) == 3
+    for summary in summaries:
+        with open(os.path.join(summary["output_dir"], "onion_scan_results.json")) as f:
+            assert json.load(f)["run"] == summary["name"]
+        assert summary["result_files"] == ["onion_scan_results.json"]
+
+    with open(runner.summary_file) as f:
+        assert sorted(json.loads(line)["run"] for line in f) == [0, 1, 2]
+
+
+def test_retry_and_timeout(tmp_path):
+    flaky = fleet(tmp_path, LocalRunner([sys.executable, "-c", FLAKY]), retries=1).run(1)[0]
+    assert flaky["status"] == "ok"
+    assert [a["returncode"] for a in flaky["attempts"]] == [1, 0]
+    assert flaky["attempts"][0]["mac_address"] != flaky["attempts"][1]["mac_address"]
+
+    slow = LocalRunner([sys.executable, "-c", "import time; time.sleep(30)"])
+    hung = fleet(tmp_path, slow, timeout=0.5, retries=1).run(1)[0]
+    assert hung["status"] == "timeout"
+    assert len(hung["attempts"]) == 2 and hung["seconds"] < 5
+
+
+def test_container_command_keeps_scan_exit_code(tmp_path):
+    def shell(script):
+        scan = f"{sys.executable} -c \"{script}\""
+        return LocalRunner(["sh", "-c", container_command(scan, workdir=".", output_dir=str(tmp_path / "missing"))])
+
+    # Kopyalanacak dosya olmaması hata değildir, başarısız tarama ise yeniden denenir
+    flaky = fleet(tmp_path, shell(FLAKY), retries=1).run(1)[0]
+    assert flaky["status"] == "ok"
+    assert [a["returncode"] for a in flaky["attempts"]] == [1, 0]
+
+    failed = fleet(tmp_path, shell("import sys; sys.exit(3)"), retries=1).run(1)[0]
+    assert failed["status"] == "failed"
+    assert [a["returncode"] for a in failed["attempts"]] == [3, 3]
+
+
+class SleepRunner(ContainerRunner):
+    """Docker'sız sahte çalıştırıcı: yalnızca bekler, aynı anda kaç çalıştırma olduğunu sayar"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+
+    def run(self, name, mac_address, output_dir, timeout):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.seconds)
+        with self.lock:
+            self.active -= 1
+        return RunOutcome(0)
+
+
+def test_concurrency_is_bounded_and_scales(tmp_path):
+    runner = SleepRunner(0.2)
+    started = time.perf_counter()
+    summaries = fleet(tmp_path, runner, concurrency=4).run(8)
+    wall = time.perf_counter() - started
+
+    assert runner.peak == 4
+    assert wall < 0.2 * 8 / 2
+    assert summarize(summaries, wall)["ok"] == 8
+
+
+def test_docker_runner_lends_each_run_its_own_tor_data_volume(tmp_path, monkeypatch):
+    commands = []
+
+    def fake_run_process(cmd, timeout, on_timeout=None, **kw):
+        commands.append(cmd)
+        time.sleep(0.05)
+        return RunOutcome(0)
+
+    monkeypatch.setattr("fleet._run_process", fake_run_process)
+    fleet(tmp_path, DockerRunner(tor_data_volume="tor-data"), concurrency=2).run(6)
+
+    volumes = [arg for cmd in commands for arg in cmd if arg.endswith(":/tmp/tor")]
+    assert len(volumes) == 6
+    assert sorted(set(volumes)) == ["tor-data-0:/tmp/tor", "tor-data-1:/tmp/tor"]
+    assert all("tor_bootstrap.py" in cmd[-1] for cmd in commands)
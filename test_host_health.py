@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import pytest
+
+import config
+import metrics
+from async_fetcher import FetchTimeout, SocksError
+from crawler import crawl
+from host_health import CLOSED, HALF_OPEN, HOST_DOWN, OPEN, PERMANENT, TRANSIENT, HostHealth, backoff_delay, classify
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+
+SEED = v3_address(b"h" * 32)
+DEAD = v3_address(b"d" * 32)
+SLOW = v3_address(b"w" * 32)
+
+
+@pytest.fixture
+def health(tmp_path):
+    health = HostHealth(str(tmp_path / "health.db"))
+    yield health
+    health.close()
+
+
+def test_timeout_adapts_to_host_latency(health, monkeypatch):
+    monkeypatch.setattr("config.FETCH_MIN_TIMEOUT", 1)
+    monkeypatch.setattr("config.FETCH_MAX_TIMEOUT", 60)
+    assert health.timeout_for("new.onion") == config.FETCH_TIMEOUT
+
+    for _ in range(20):
+        health.record_success("fast.onion", 0.2)
+        health.record_success("slow.onion", 12.0)
+    assert health.timeout_for("fast.onion") == 1
+    assert 12 < health.timeout_for("slow.onion") < config.FETCH_TIMEOUT + 20
+
+    # Zaman aşımı sonrası yavaş host'a daha uzun süre tanınır (üst sınırla)
+    before = health.timeout_for("slow.onion")
+    health.record_failure("slow.onion", FetchTimeout("Zaman aşımı"))
+    assert health.timeout_for("slow.onion") == 60 > before
+
+
+def test_breaker_opens_probes_and_persists(health, tmp_path, monkeypatch):
+    monkeypatch.setattr("config.BREAKER_THRESHOLD", 2)
+    monkeypatch.setattr("config.BREAKER_COOLDOWN", 100)
+    error = SocksError(4)
+
+    assert health.record_failure("dead.onion", error, now=0) == CLOSED
+    assert health.record_failure("dead.onion", error, now=0) == OPEN
+    assert not health.allow("dead.onion", now=50)
+
+    # Bekleme dolunca tek bir deneme isteği
+    assert health.allow("dead.onion", now=100)
+    assert health.state("dead.onion").state == HALF_OPEN
+    assert not health.allow("dead.onion", now=100)
+    # Deneme başarısız: bekleme ikiye katlanır
+    assert health.record_failure("dead.onion", error, now=100) == OPEN
+    assert health.state("dead.onion").open_until == 300
+
+    reopened = HostHealth(str(tmp_path / "health.db"))
+    assert not reopened.allow("dead.onion", now=299)
+    assert reopened.open_hosts(now=299) == ["dead.onion"]
+    assert reopened.allow("dead.onion", now=300)
+    reopened.record_success("dead.onion", 1.0)
+    assert reopened.state("dead.onion").state == CLOSED and reopened.allow("dead.onion", now=300)
+    reopened.close()
+
+
+def test_error_classes_and_backoff():
+    assert classify(FetchTimeout("x")) == TRANSIENT
+    assert classify(SocksError(6)) == TRANSIENT
+    assert classify(SocksError(4)) == HOST_DOWN
+    assert classify(ConnectionResetError()) == TRANSIENT
+    assert classify(ConnectionRefusedError()) == PERMANENT
+    assert classify(ValueError()) == PERMANENT
+
+    delays = [backoff_delay(attempt, base=1, cap=5) for attempt in range(10) for _ in range(20)]
+    assert all(0 <= delay <= 5 for delay in delays)
+    assert max(backoff_delay(0, base=1, cap=5) for _ in range(50)) <= 1
+
+
+def test_crawl_retries_transient_errors_and_skips_dead_hosts(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.RETRY_BACKOFF_BASE", 0)
+    monkeypatch.setattr("config.BREAKER_THRESHOLD", 3)
+    dead_pages = "".join(f'<a href="http://{DEAD}/{i}">dead</a>' for i in range(6))
+    with MockTorNetwork() as network:
+        network.add_site(SEED, f'<a href="http://{SLOW}/">slow</a>' + dead_pages)
+        slow = network.add_site(SLOW, "<html></html>", delay=1.0)
+        crawl([f"http://{SEED}/"], max_depth=1, db_path=str(tmp_path / "a.db"), concurrency=1,
+              proxy=network.proxy, timeout=0.2)
+
+        counters = metrics.snapshot()["counters"]
+        # Yavaş host: 1 deneme + 2 yeniden deneme, sonra devresi açılır
+        assert slow.requests == config.FETCH_RETRIES + 1
+        assert counters["fetch_retries_total"] == config.FETCH_RETRIES
+        # Ölü host (SOCKS "host erişilemez"): yeniden denenmez, 3 hatadan sonra kalan URL'ler atlanır
+        assert counters["fetch_skipped_total"] == 3
+
+        # Sonraki tarama: durum kalıcı, bilinen ölü host'lara hiç istek gönderilmez
+        metrics.reset()
+        connections = network.socks_connections
+        crawl([f"http://{SEED}/"], max_depth=1, db_path=str(tmp_path / "b.db"), concurrency=1,
+              proxy=network.proxy, timeout=0.2)
+        assert metrics.snapshot()["counters"]["fetch_skipped_total"] == 7
+        assert slow.requests == config.FETCH_RETRIES + 1
+        assert network.socks_connections == connections + 1  # yalnızca seed
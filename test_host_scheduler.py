@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+import metrics
+from crawler import crawl
+from host_scheduler import HostScheduler, TokenBucket
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+
+SEED = v3_address(b"s" * 32)
+BIG = v3_address(b"b" * 32)
+SMALL = [v3_address(bytes([65 + i]) * 32) for i in range(3)]
+
+
+def test_token_bucket_limits_rate_after_burst():
+    bucket = TokenBucket(rate=2, capacity=3, now=0)
+    for _ in range(3):
+        assert bucket.ready_in(0) == 0
+        bucket.take(0)
+    assert bucket.ready_in(0) == 0.5
+    assert bucket.ready_in(0.5) == 0
+    # Uzun bekleme kapasiteden fazla hak biriktirmez
+    assert bucket.ready_in(100) == 0 and bucket.tokens == 3
+
+
+def test_ready_hosts_are_served_round_robin():
+    scheduler = HostScheduler(max_in_flight=4, per_host=2, per_minute=60, burst=10, host_queue=100)
+    for i in range(50):
+        scheduler.submit("big", i, now=0)
+    for host in ("a", "b", "c"):
+        scheduler.submit(host, 0, now=0)
+
+    first = [scheduler.pop_ready(now=0)[0] for _ in range(4)]
+    assert sorted(first) == ["a", "b", "big", "c"]
+    # Genel sınır dolu: yer açılana kadar hiçbir şey gönderilmez
+    assert scheduler.pop_ready(now=0) is None and scheduler.next_ready_in(now=0) is None
+    scheduler.release("a")
+    assert scheduler.pop_ready(now=0)[0] == "big"
+    # big host başına sınıra ulaştı
+    scheduler.release("b")
+    assert scheduler.pop_ready(now=0) is None
+    assert scheduler.stats()["queued"] == 48 and scheduler.stats()["in_flight"] == 3
+
+
+def test_rate_limited_host_waits_for_token():
+    scheduler = HostScheduler(max_in_flight=8, per_host=8, per_minute=60, burst=2, host_queue=100)
+    for i in range(4):
+        scheduler.submit("h", i, now=0)
+    assert scheduler.pop_ready(now=0) == ("h", 0)
+    assert scheduler.pop_ready(now=0) == ("h", 1)
+    assert scheduler.pop_ready(now=0) is None
+    assert scheduler.next_ready_in(now=0.25) == 0.75
+    assert scheduler.pop_ready(now=1.0) == ("h", 2)
+
+    assert scheduler.is_full("h") is False
+    assert scheduler.drain() == [3] and scheduler.queued == 0
+    assert metrics.snapshot()["histograms"]["scheduler_wait_seconds"]["count"] == 3
+
+
+def test_large_host_does_not_starve_others(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.HOST_BURST", 3)
+    monkeypatch.setattr("config.SCHEDULER_HOST_QUEUE", 5)
+    big_links = "".join(f'<a href="http://{BIG}/page/{i}">big</a>' for i in range(40))
+    small_links = "".join(f'<a href="http://{host}/page">small</a>' for host in SMALL)
+    with MockTorNetwork() as network:
+        network.add_site(SEED, big_links + small_links)
+        big = network.add_site(BIG, "<html></html>")
+        small = [network.add_site(host, "<html></html>") for host in SMALL]
+        crawl([f"http://{SEED}/"], max_depth=1, max_pages=7, db_path=str(tmp_path / "f.db"), concurrency=4,
+              proxy=network.proxy)
+
+    # Büyük host'un 40 linki önce bulunsa da küçük host'lar aynı sayfa bütçesi içinde taranır
+    assert all(site.requests == 1 for site in small)
+    assert big.requests == 3
+    assert metrics.snapshot()["histograms"]["scheduler_queue_depth"]["count"] == 7
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+import script
+from crawler import crawl
+from indicators import (CATEGORIES, classify_links, extract_many, extract_page, group_records, luhn_valid,
+                        normalize_phone, tckn_valid)
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+
+HOST = v3_address(b"i" * 32)
+PAGE = """<html><head><script>var leak = "skip@script.com:notapassword";</script></head><body>
+<p>Combo: admin@corp.com:Hunter22 and proxy@corp.com:8080</p>
+<p>John Smith john@smith.com +90 532 123 45 67</p>
+<div>4111 1111 1111 1111 exp 12/27, 4111 1111 1111 1112</div>
+<li>SSN 123-45-6789, 666-12-3456; TC 10000000146, 10000000147</li>
+<p>username: root password: toor</p>
+<p>users_2024.sql.gz 2.3GB 150,000 records</p>
+<p>LockBit victim: Acme Hospital demand $500,000</p>
+<p>example.com was hacked 2024-01-15 50,000 users</p>
+</body></html>"""
+
+
+def test_validators():
+    assert luhn_valid("4111111111111111") and not luhn_valid("4111111111111112")
+    assert tckn_valid("10000000146") and not tckn_valid("10000000147")
+    assert normalize_phone("+44 (20) 7946 0958") == ("+442079460958", "UK", "unknown")
+    assert normalize_phone("+90 532 123 45 67") == ("+905321234567", "TR", "mobile")
+    assert normalize_phone("+1 23") is None
+
+
+def test_single_pass_extraction_fills_report_schema():
+    data = group_records(extract_page(PAGE.encode(), "utf-8", "http://leak.onion/"))
+
+    assert list(data) == list(CATEGORIES)
+    assert data["email_passwords"] == [{"email": "admin@corp.com", "password": "H******2",
+                                        "source": "http://leak.onion/"}]
+    assert data["credit_cards"] == [{"number": "****-****-****-1111", "expiry": "12/27", "cvv": "***",
+                                     "bank": "Visa"}]
+    assert [(row["type"], row["number"]) for row in data["identity_numbers"]] == [("SSN", "***-**-6789"),
+                                                                                ("TC", "*******0146")]
+    assert data["phone_numbers"] == [{"number": "+905321234567", "country": "TR", "type": "mobile"}]
+    assert data["username_passwords"][0]["username"] == "root"
+    assert data["database_dumps"] == [{"name": "users_2024.sql.gz", "size": "2.3GB", "records": "150,000"}]
+    assert data["ransomware_announcements"] == [{"group": "LockBit", "victim": "Acme Hospital", "demand": "$500,000"}]
+    assert data["hacked_sites"] == [{"domain": "example.com", "breach_date": "2024-01-15", "records": "50,000"}]
+    assert data["personal_data"][0]["name"] == "John Smith"
+    # Ham kart numarası ve parola çıktıya girmez
+    assert "4111 1111 1111 1111" not in str(data) and "Hunter22" not in str(data)
+
+
+def test_process_pool_matches_inline_and_links_are_classified():
+    pages = [(PAGE.encode(), "utf-8", f"http://{i}.onion/") for i in range(20)]
+    assert list(extract_many(pages, workers=2)) == list(extract_many(pages, workers=0))
+
+    found = classify_links([{"url": "http://a.onion/paypal-login", "text": "PayPal verify"},
+                            {"url": "http://b.onion/", "text": "Private RAT builds"},
+                            {"url": "http://c.onion/", "text": "Library"}])
+    assert [(category, record["url"]) for category, _, record in found] == [
+        ("phishing_sites", "http://a.onion/paypal-login"), ("malware_links", "http://b.onion/")]
+
+
+def test_crawl_populates_dark_web_data(tmp_path):
+    db_path = str(tmp_path / "f.db")
+    with MockTorNetwork() as network:
+        network.add_site(HOST, PAGE)
+        links = crawl([f"http://{HOST}/"], max_depth=0, db_path=db_path, proxy=network.proxy)
+    data = script.collect_dark_web_data(links, db_path)
+    assert data["credit_cards"][0]["bank"] == "Visa"
+    assert data["email_passwords"][0]["source"] == f"http://{HOST}/"
+
+    # Hiç gösterge yoksa kategoriler boş kalır
+    empty_db = str(tmp_path / "empty.db")
+    with MockTorNetwork() as network:
+        network.add_site(HOST, "<html>nothing here</html>")
+        links = crawl([f"http://{HOST}/"], max_depth=0, db_path=empty_db, proxy=network.proxy)
+    assert script.collect_dark_web_data(links, empty_db) == group_records([])
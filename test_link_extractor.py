@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from link_extractor import extract_onion_links, iter_onion_links
+
+
+def soup_links(content, source_url):
+    """Önceki BeautifulSoup tabanlı çıkarıcı (referans)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    return [
+        {'url': a['href'], 'text': a.get_text(strip=True)[:50], 'found_at': source_url}
+        for a in soup.find_all('a', href=True)
+        if '.onion' in a['href']
+    ]
+
+
+PAGES = [
+    '<a href="http://a.onion/">  Simple  </a>',
+    '<a href="http://b.onion/x?y=1&amp;z=2"><b>Bold</b>  <i>Italic</i>\n text</a>',
+    '<A HREF="http://c.onion">Upper &amp; case &eacute;</A>',
+    '<a href="http://d.onion">' + 'long text ' * 20 + '</a>',
+    '<a name="anchor">no href</a><a href="">empty</a><a href="http://clear.net">clear</a>',
+    '<a href="http://e.onion">before<!-- comment -->after</a>',
+    '<a href="http://f.onion">unclosed <p>paragraph',
+    '<a href="http://g.onion"><img src="x.png"/>Img <br/>break</a>',
+    '<ul><li><a href="http://h.onion/%20">Türkçe karakterler: ğüşıöç</a></li></ul>',
+    '<a href="http://i.onion">text<script>var x = "<a href=\'http://j.onion\'>";</script>tail</a>',
+    '<a href="http://k.onion" href="http://l.onion">duplicate href</a>',
+    '<a href=http://m.onion/unquoted>unquoted</a>',
+    '<a href="http://n.onion">outer <a href="http://o.onion">inner</a> rest</a>',
+    '<a href="http://p.onion"><![CDATA[cdata]]>x</a>',
+]
+
+
+@pytest.mark.parametrize("html", PAGES)
+def test_matches_beautifulsoup(html):
+    content = f"<html><body>{html}</body></html>".encode("utf-8")
+    assert extract_onion_links(content, "seed") == soup_links(content, "seed")
+
+
+def test_matches_beautifulsoup_with_random_chunk_boundaries():
+    rng = random.Random(42)
+    page = "<html><body>" + "".join(PAGES * 20) + "</body></html>"
+    content = page.encode("utf-8")
+    expected = soup_links(content, "seed")
+
+    for _ in range(20):
+        cuts = sorted(rng.sample(range(1, len(content)), 40))
+        chunks = [content[a:b] for a, b in zip([0] + cuts, cuts + [len(content)])]
+        assert list(iter_onion_links(chunks, "seed")) == expected
+
+
+def test_meta_charset_is_honoured():
+    content = '<meta charset="windows-1254"><a href="http://a.onion">Şifre</a>'.encode("cp1254")
+    assert extract_onion_links(content, "seed")[0]["text"] == "Şifre"
+
+
+def test_body_size_is_capped():
+    content = b"".join(b'<a href="http://%d.onion">x</a>' % i for i in range(1000))
+
+    links = extract_onion_links(content, "seed", max_bytes=len(content) // 2)
+
+    assert 400 < len(links) < 600
+
+
+def test_stream_from_requests_response():
+    from mock_socks import MockTorNetwork
+    from link_extractor import stream_onion_links
+    from tor_pool import CircuitPool
+
+    page = "<html><body>" + "".join(PAGES) + "</body></html>"
+    with MockTorNetwork() as network:
+        network.add_site("seed.onion", page)
+        pool = CircuitPool("127.0.0.1", ports=[network.proxy[1]])
+
+        response = pool.get("http://seed.onion/", stream=True, timeout=5)
+        links = list(stream_onion_links(response, "seed"))
+
+    assert links == soup_links(page.encode("utf-8"), "seed")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import json
+
+import metrics
+import script
+from async_fetcher import FetchTimeout, fetch_many
+from crawler import crawl
+from metrics import Histogram, MetricsRegistry
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+from scan_store import ScanStore
+
+HOST = v3_address(b"m" * 32)
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.observe(value)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 5 and summary["sum"] == 16.5
+    assert summary["buckets"] == {"1": 1, "2": 3, "4": 4, "+Inf": 5}
+    assert 1 < histogram.quantile(0.5) <= 2
+    assert histogram.quantile(0.99) == 4  # +Inf kovası: son sınır döner
+    assert Histogram((1,)).quantile(0.5) is None
+
+
+def test_prometheus_text_format(tmp_path):
+    registry = MetricsRegistry()
+    registry.observe("fetch_ttfb_seconds", 0.2)
+    registry.inc("fetch_requests_total")
+    with registry.stage("crawl"):
+        pass
+
+    text = registry.render_prometheus()
+    assert "# TYPE onion_scan_fetch_ttfb_seconds histogram" in text
+    assert 'onion_scan_fetch_ttfb_seconds_bucket{le="0.1"} 0' in text
+    assert 'onion_scan_fetch_ttfb_seconds_bucket{le="0.25"} 1' in text
+    assert "onion_scan_fetch_ttfb_seconds_count 1" in text
+    assert "onion_scan_fetch_requests_total 1" in text
+    assert 'onion_scan_stage_seconds{stage="crawl"}' in text
+
+    path = registry.write_prometheus(str(tmp_path / "scan.prom"))
+    assert open(path, encoding="utf-8").read() == text
+
+
+def test_fetch_path_records_request_timings(tmp_path):
+    page = f'<a href="http://{HOST}/">self</a>' + "x" * 5000
+    with MockTorNetwork() as network:
+        network.add_site(HOST, page, delay=0.05)
+        crawl([f"http://{HOST}/"], max_depth=0, db_path=str(tmp_path / "f.db"), proxy=network.proxy)
+        fetch_many([f"http://{v3_address(b'z' * 32)}/"], proxy=network.proxy, timeout=2)
+
+    snapshot = metrics.snapshot()
+    histograms = snapshot["histograms"]
+    assert histograms["fetch_socks_connect_seconds"]["count"] == 1
+    assert histograms["fetch_ttfb_seconds"]["count"] == 1
+    assert histograms["fetch_ttfb_seconds"]["sum"] >= 0.05
+    assert histograms["fetch_download_seconds"]["count"] == 1
+    assert histograms["fetch_parse_seconds"]["count"] == 1
+    assert histograms["fetch_response_bytes"]["sum"] == len(page)
+    assert snapshot["counters"] == {"fetch_requests_total": 1, "fetch_errors_total": 1, "fetch_retries_total": 0,
+                                    "fetch_skipped_total": 0, "fetch_bytes_total": len(page),
+                                    "indicators_found_total": 0, "watchlist_alerts_total": 0,
+                                    "mirror_pages_total": 0}
+
+
+def test_timed_out_fetch_counts_as_error():
+    with MockTorNetwork() as network:
+        network.add_site(HOST, "<html>slow</html>", delay=5)
+        result, = fetch_many([f"http://{HOST}/"], proxy=network.proxy, timeout=0.2)
+
+    assert isinstance(result, FetchTimeout)
+    assert metrics.snapshot()["counters"]["fetch_errors_total"] == 1
+
+
+def test_report_contains_measured_summary(tmp_path):
+    metrics.inc("fetch_requests_total", 3)
+    with metrics.stage("crawl"):
+        pass
+    json_file = tmp_path / "results.json"
+    links = [{"url": f"http://{HOST}/", "text": "", "found_at": "seed"}]
+
+    script.save_to_json(links, True, {}, json_file=str(json_file), db_path=str(tmp_path / "scans.db"))
+
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    assert data["scan_summary"]["successful_connections"] == 3
+    assert data["scan_summary"]["scan_duration"].endswith(" seconds")
+    assert "crawl" in data["scan_metrics"]["stages"]
+    assert list(data)[-2:] == ["scan_metrics", "dark_web_data"]
+    with ScanStore(str(tmp_path / "scans.db")) as store:
+        assert store.scan_header(data["scan_id"])["scan_metrics"] == data["scan_metrics"]
+
+
+def test_store_without_metrics_column_is_migrated(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "old.db")
+    db = sqlite3.connect(db_path)
+    db.execute("""CREATE TABLE scans (id INTEGER PRIMARY KEY, scan_date TEXT NOT NULL,
+                  tor_connection INTEGER NOT NULL, total_onion_links INTEGER NOT NULL DEFAULT 0,
+                  successful_connections INTEGER NOT NULL DEFAULT 0, unique_domains INTEGER NOT NULL DEFAULT 0,
+                  scan_duration TEXT, dark_web_data TEXT)""")
+    db.execute("INSERT INTO scans (scan_date, tor_connection) VALUES ('2024-01-01', 1)")
+    db.commit()
+    db.close()
+
+    with ScanStore(db_path) as store:
+        assert "scan_metrics" not in store.scan_header(1)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import json
+import random
+
+import metrics
+import script
+from crawler import CrawlFrontier, crawl
+from mirrors import MirrorIndex, fingerprint, similarity
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+from synthetic_corpus import hidden_wiki_page, onion_hosts
+
+SEED = v3_address(b"s" * 32)
+ORIGINAL = v3_address(b"o" * 32)
+MIRROR = v3_address(b"m" * 32)
+OTHER = v3_address(b"d" * 32)
+EXTRA = v3_address(b"e" * 32)
+
+
+def _directory(seed):
+    return hidden_wiki_page(random.Random(seed), onion_hosts(50, seed), 16 * 1024)
+
+
+def test_signatures_separate_mirrors_from_distinct_pages():
+    page = _directory(1)
+    mirror = page.replace("<body>", f"<body><h1>Mirror of http://{MIRROR}/</h1>")
+    first, second, other = (fingerprint(body.encode()) for body in (page, mirror, _directory(2)))
+
+    assert similarity(first, second) >= 0.85 > similarity(first, other)
+    # Çok kısa sayfalar imzalanmaz
+    assert fingerprint(b"<html>nothing here</html>") is None
+
+    index = MirrorIndex(threshold=85)
+    assert index.check("http://a.onion/", first) is None
+    assert index.check("http://b.onion/", other) is None
+    assert index.check("http://c.onion/", second) == "http://a.onion/"
+    assert len(index) == 2
+
+
+def test_crawl_skips_mirror_parsing_and_records_groups(tmp_path):
+    page = _directory(3)
+    # Aynadaki fazladan link ayrıştırılmadığı için sonuçlara girmez
+    mirror = page.replace("<body>", f'<body><a href="http://{EXTRA}/">mirror list</a>')
+    seed = "".join(f'<a href="http://{host}/">{host}</a>' for host in (ORIGINAL, MIRROR, OTHER))
+    db_path = str(tmp_path / "f.db")
+    with MockTorNetwork() as network:
+        network.add_site(SEED, f"<html><body>{seed}</body></html>")
+        network.add_site(ORIGINAL, page)
+        network.add_site(MIRROR, mirror)
+        network.add_site(OTHER, _directory(4))
+        links = crawl([f"http://{SEED}/"], max_depth=1, concurrency=1, db_path=db_path, proxy=network.proxy)
+
+    urls = {link["url"] for link in links}
+    assert f"http://{MIRROR}/" in urls and f"http://{EXTRA}/" not in urls
+    groups = script.collect_mirror_groups(db_path)
+    assert groups == [{"original": f"http://{ORIGINAL}/", "mirrors": [f"http://{MIRROR}/"]}]
+    assert metrics.snapshot()["counters"]["mirror_pages_total"] == 1
+
+    json_file = str(tmp_path / "results.json")
+    script.save_to_json(links, True, {}, json_file=json_file, db_path=str(tmp_path / "scans.db"),
+                        mirror_groups=groups)
+    with open(json_file, encoding="utf-8") as f:
+        assert json.load(f)["mirror_groups"] == groups
+
+
+def test_resumed_crawl_reloads_signatures(tmp_path):
+    page = _directory(5)
+    db_path = str(tmp_path / "f.db")
+    with MockTorNetwork() as network:
+        network.add_site(ORIGINAL, page)
+        crawl([f"http://{ORIGINAL}/"], max_depth=0, db_path=db_path, proxy=network.proxy)
+    frontier = CrawlFrontier(db_path)
+    try:
+        assert [url for url, _ in frontier.signatures()] == [f"http://{ORIGINAL}/"]
+        # Devam eden taramanın yeni sayfası önceki çalıştırmada görülen sayfayla karşılaştırılır
+        frontier.add(f"http://{MIRROR}/", 0)
+    finally:
+        frontier.close()
+    with MockTorNetwork() as network:
+        network.add_site(MIRROR, page)
+        crawl([], max_depth=0, db_path=db_path, proxy=network.proxy, resume=True)
+    assert script.collect_mirror_groups(db_path) == [
+        {"original": f"http://{ORIGINAL}/", "mirrors": [f"http://{MIRROR}/"]}]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+import pytest
+
+from onion_address import (
+    BloomFilter, LinkList, OnionIndex, canonicalize_url, is_valid_v3, onion_domain, v3_address,
+)
+
+# DuckDuckGo'nun gerçek v3 adresi
+DUCKDUCKGO = "duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzczad.onion"
+
+
+def test_real_v3_address_is_valid():
+    assert is_valid_v3(DUCKDUCKGO)
+    assert is_valid_v3("www." + DUCKDUCKGO.upper())
+
+
+@pytest.mark.parametrize("host", [
+    "duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzczaa.onion",  # sağlama toplamı bozuk
+    "duckduckgogg42xjoc.onion",                                        # v2 / kısa
+    "duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzcza1.onion",  # base32 dışı karakter
+    "example.com",
+    "",
+])
+def test_invalid_addresses(host):
+    assert not is_valid_v3(host)
+
+
+def test_wrong_version_byte_is_rejected():
+    import base64
+    from onion_address import v3_checksum
+    pubkey = b"k" * 32
+    raw = pubkey + v3_checksum(pubkey, version=2) + bytes([2])
+    assert not is_valid_v3(base64.b32encode(raw).decode().lower() + ".onion")
+
+
+@pytest.mark.parametrize("href, base, expected", [
+    (f"HTTP://{DUCKDUCKGO.upper()}", None, f"http://{DUCKDUCKGO}/"),
+    (f"http://{DUCKDUCKGO}:80/a?b=1#frag", None, f"http://{DUCKDUCKGO}/a?b=1"),
+    (f"https://{DUCKDUCKGO}:8443/", None, f"https://{DUCKDUCKGO}:8443/"),
+    ("/wiki/page.onion.html", f"http://{DUCKDUCKGO}/index", f"http://{DUCKDUCKGO}/wiki/page.onion.html"),
+    ("mailto:a@b.onion", None, None),
+    ("http://[broken", None, None),
+])
+def test_canonicalize_url(href, base, expected):
+    assert canonicalize_url(href, base) == expected
+
+
+def test_onion_domain_strips_subdomains():
+    assert onion_domain("Forum.ABC.onion.") == "abc.onion"
+    assert onion_domain("example.com") is None
+
+
+@pytest.mark.parametrize("bloom_capacity", [None, 1000])
+def test_index_dedups_and_counts_incrementally(bloom_capacity):
+    a, b = v3_address(b"a" * 32), v3_address(b"b" * 32)
+    index = OnionIndex(bloom_capacity=bloom_capacity)
+
+    assert index.add(f"http://{a}/", "A", "seed")
+    assert not index.add(f"HTTP://{a.upper()}:80/#x", "A again", "seed")
+    assert index.add(f"http://{a}/other", "A2", None)
+    assert index.add(f"http://www.{b}", "B", "seed")
+    assert not index.add("http://hiddenwiki.onion", "fake", "seed")
+    assert not index.add("/relative.onion", "relative", "seed")
+
+    assert len(index) == 3
+    assert index.unique_domains == 2
+    assert index.sourced == 2
+    assert index.rejected == 2
+    assert index[0] == {"url": f"http://{a}/", "text": "A", "found_at": "seed"}
+
+
+def test_link_list_interns_sources_and_keeps_json_shape():
+    rows = [{"url": f"http://{i}.onion/", "text": f"T{i}", "found_at": "".join(("http://seed", ".onion/"))}
+            for i in range(4)]
+    rows.append({"url": "http://x.onion/", "text": "", "found_at": None})
+    links = LinkList(rows)
+
+    assert len(links) == 5 and links == rows and list(links) == rows
+    assert links[1] == rows[1] and links[-1] == rows[-1] and links[1:3] == rows[1:3]
+    # Aynı kaynak URL tek kez saklanır, linkler yalnızca numarasını tutar
+    assert links.sources == ["http://seed.onion/", None]
+    assert list(links.source_ids) == [0, 0, 0, 0, 1]
+    assert links != rows[:4]
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(10000)
+    items = [f"http://{i}.onion/" for i in range(10000)]
+    for item in items[:5000]:
+        bloom.add(item)
+    assert all(item in bloom for item in items[:5000])
+    false_positives = sum(item in bloom for item in items[5000:])
+    assert false_positives < 50
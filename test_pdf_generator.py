@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import json
+import os
+import subprocess
+import sys
+
+import pdf_generator
+import script
+
+
+def scan_data(total=3):
+    return {"total_onion_links": total,
+            "scan_summary": {"unique_domains": 2, "successful_connections": 1},
+            "dark_web_data": script.generate_fake_data()}
+
+
+def test_charts_are_rendered_in_memory_and_memoized(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    renders = []
+    original = pdf_generator._figure_png
+    monkeypatch.setattr(pdf_generator, "_figure_png", lambda fig: renders.append(fig) or original(fig))
+
+    first = pdf_generator.create_charts(scan_data())
+    assert set(first) == {"stats", "dark_web"}
+    assert all(png.startswith(b"\x89PNG") for png in first.values())
+    assert len(renders) == 2
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".png")]
+
+    # Aynı veri: çizim tamamen atlanır
+    assert pdf_generator.create_charts(scan_data()) == first
+    assert len(renders) == 2
+
+    # Değişen veri yalnızca etkilenen grafiği yeniden çizer
+    changed = pdf_generator.create_charts(scan_data(total=4))
+    assert len(renders) == 3
+    assert changed["dark_web"] == first["dark_web"]
+
+
+def test_chart_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setattr("config.CHART_CACHE_DIR", "")
+    renders = []
+    monkeypatch.setattr(pdf_generator, "_render_stats_chart", lambda values: renders.append(values) or b"png")
+
+    pdf_generator.create_charts(dict(scan_data(), dark_web_data={}))
+    pdf_generator.create_charts(dict(scan_data(), dark_web_data={}))
+    assert renders == [[3, 2, 1], [3, 2, 1]]
+
+
+def test_chart_cache_keeps_recent_images(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_generator, "CHART_CACHE_FILES", 2)
+    monkeypatch.setattr(pdf_generator, "_render_stats_chart", lambda values: b"png")
+
+    for total in range(4):
+        pdf_generator._cached_chart("stats", [total], pdf_generator._render_stats_chart)
+    assert len(os.listdir(tmp_path / "chart_cache")) == 2
+
+
+SCAN_ONLY_CHILD = """
+import sys
+import script
+script.test_tor_connection = lambda: False
+script.get_onion_links = lambda: [{"url": "http://a.onion/", "text": "a", "found_at": "seed"}]
+script.main(scan_only=True)
+heavy = [m for m in ("pdf_generator", "reportlab", "matplotlib") if m in sys.modules]
+assert not heavy, heavy
+"""
+
+
+def test_report_stack_is_imported_lazily(tmp_path):
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=root, SCAN_DB_PATH=str(tmp_path / "scans.db"))
+
+    subprocess.run([sys.executable, "-c", "import sys, pdf_generator\n"
+                    "assert 'reportlab' not in sys.modules and 'matplotlib' not in sys.modules"],
+                   check=True, env=env, cwd=tmp_path)
+    subprocess.run([sys.executable, "-c", SCAN_ONLY_CHILD], check=True, env=env, cwd=tmp_path,
+                   capture_output=True)
+    assert (tmp_path / "onion_scan_results.json").exists()
+    assert not (tmp_path / "onion_scan_report.pdf").exists()
+
+
+def test_every_category_and_row_is_rendered_in_chunks(tmp_path):
+    dark_data = script.generate_fake_data()
+    dark_data["email_passwords"] = dark_data["email_passwords"] * 120  # 600 satır
+    dark_data["crypto_wallets"] = [{"coin": "BTC", "address": f"bc1q{i}"} for i in range(3)]
+
+    tables = dict(pdf_generator.create_dark_web_tables(dark_data, chunk_rows=250))
+    assert len(tables) == 12
+    emails = tables["📧 Email Addresses and Passwords"]
+    assert [len(chunk._cellvalues) for chunk in emails] == [251, 251, 101]
+    assert emails[0]._cellvalues[0] == ["Email", "Password", "Source"]
+    assert tables["📁 Crypto Wallets"][0]._cellvalues == [["Coin", "Address"]] + [["BTC", f"bc1q{i}"] for i in range(3)]
+
+    # Aynı başlık rengini kullanan tüm parçalar tek bir TableStyle nesnesini paylaşır
+    assert pdf_generator._category_style("darkred") is pdf_generator._category_style("darkred")
+
+    data = {"scan_date": "2026-01-01T00:00:00", "tor_connection": True, "total_onion_links": 0,
+            "onion_links": [], "dark_web_data": dark_data,
+            "scan_summary": {"unique_domains": 0, "successful_connections": 0, "scan_duration": "1s"}}
+    json_file = tmp_path / "results.json"
+    json_file.write_text(json.dumps(data), encoding="utf-8")
+    assert pdf_generator.create_pdf_report(str(json_file), str(tmp_path / "report.pdf"))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import json
+
+import pytest
+
+import script
+from onion_address import v3_address
+from pdf_generator import FlowableStream, create_large_pdf_report, create_pdf_report
+from report_source import JsonReportSource, StoreReportSource, iter_json_top_level
+from scan_store import ScanStore
+
+
+def links(count):
+    return [{"url": f"http://{v3_address(bytes([i % 256]) * 32)}/{i}", "text": f"t{i}", "found_at": "seed"}
+            for i in range(count)]
+
+
+def test_json_source_matches_json_load(tmp_path, monkeypatch):
+    monkeypatch.setattr("report_source.CHUNK_SIZE", 7)  # Değerler parça sınırlarına bölünsün
+    data = {"scan_date": "2026-01-01", "total_onion_links": 12.5, "onion_links": links(30),
+            "scan_summary": {"unique_domains": 3}, "dark_web_data": {"x": ["ü", {"y": None}]}}
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    source = JsonReportSource(str(path))
+    assert source.link_count == 30
+    assert list(source.iter_links()) == data["onion_links"]
+    assert source.header == {k: v for k, v in data.items() if k != "onion_links"}
+
+
+def test_json_source_rejects_truncated_file(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"onion_links": [{"url": "a"},', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_top_level(str(path), "onion_links"))
+
+
+def test_flowable_stream_refills_lazily():
+    produced = []
+
+    def flowables():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    stream = FlowableStream(flowables(), buffer_size=3)
+    consumed = []
+    while len(stream):
+        consumed.append(stream[0])
+        del stream[0]
+        assert len(produced) - len(consumed) <= 3
+    assert consumed == list(range(10))
+
+
+def test_large_report_from_json_and_store(tmp_path):
+    db_path = str(tmp_path / "scans.db")
+    json_file = str(tmp_path / "results.json")
+    script.save_to_json(links(1200), True, script.generate_fake_data(), json_file=json_file, db_path=db_path)
+
+    assert create_pdf_report(json_file, str(tmp_path / "from_json.pdf"), large=True)
+
+    source = StoreReportSource(db_path)
+    assert source.link_count == 1200
+    assert create_large_pdf_report(source, str(tmp_path / "from_store.pdf"), chunk_rows=100)
+    source.store.close()
+    with ScanStore(db_path) as store:
+        assert len(list(store.iter_links(1))) == 1200
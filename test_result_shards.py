@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+import json
+
+import script
+from onion_address import v3_address
+from result_shards import find_shards, merge_shards, read_shard, write_shard
+
+HOSTS = [v3_address(bytes([i]) * 32) for i in range(1, 6)]
+
+
+def links(*indexes):
+    return [{"url": f"http://{HOSTS[i]}/page{n}", "text": f"site {i}", "found_at": "seed"}
+            for n, i in enumerate(indexes)]
+
+
+def test_shard_dedups_by_canonical_domain(tmp_path):
+    path = tmp_path / "run.shard.jsonl"
+    mixed_case = {"url": f"http://{HOSTS[0].upper()}/other", "text": "", "found_at": "seed"}
+
+    assert write_shard(links(2, 0, 2, 2) + [mixed_case], str(path), "2026-01-01") == 2
+
+    records = list(read_shard(str(path)))
+    assert [r["domain"] for r in records] == sorted([HOSTS[0], HOSTS[2]])
+    assert {r["domain"]: r["hits"] for r in records} == {HOSTS[0]: 2, HOSTS[2]: 3}
+
+
+def test_multi_pass_merge_keeps_first_last_seen_and_hits(tmp_path):
+    shards = []
+    for day in range(1, 10):
+        path = tmp_path / f"run{day}.shard.jsonl"
+        write_shard(links(0, day % 5, day % 3), str(path), f"2026-01-{day:02d}")
+        shards.append(str(path))
+    output = tmp_path / "merged.shard.jsonl"
+
+    # 9 parça, fan-in 2: ara geçişlerle birleştirilir
+    assert merge_shards(shards, str(output), fan_in=2, tmp_dir=str(tmp_path)) == 5
+
+    merged = {r["domain"]: r for r in read_shard(str(output))}
+    assert list(merged) == sorted(merged)
+    assert merged[HOSTS[0]]["first_seen"] == "2026-01-01"
+    assert merged[HOSTS[0]]["last_seen"] == "2026-01-09"
+    assert merged[HOSTS[0]]["runs"] == 9
+    assert merged[HOSTS[0]]["hits"] == 9 + 1 + 3  # her çalıştırma + 5. gün + 3., 6., 9. günler
+    assert merged[HOSTS[4]]["first_seen"] == "2026-01-04"
+    assert merged[HOSTS[4]]["url"] == f"http://{HOSTS[4]}/page1"
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == []
+
+
+def test_runs_write_shards_and_legacy_results_are_converted(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    new_run, old_run = tmp_path / "runs" / "a", tmp_path / "runs" / "b"
+    new_run.mkdir(parents=True)
+    old_run.mkdir()
+    script.save_to_json(links(0, 1), True, {}, json_file=str(new_run / "onion_scan_results.json"),
+                        db_path=str(tmp_path / "scans.db"))
+    legacy = {"scan_date": "2020-05-05T00:00:00", "tor_connection": True, "total_onion_links": 1,
+              "onion_links": links(1), "scan_summary": {}, "dark_web_data": {}}
+    (old_run / "onion_scan_results.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert (new_run / "onion_scan_results.shard.jsonl").exists()
+    convert_dir = tmp_path / "convert"
+    convert_dir.mkdir()
+    shards = find_shards(str(tmp_path / "runs"), str(convert_dir))
+    assert len(shards) == 2
+    merge_shards(shards, str(tmp_path / "merged.shard.jsonl"))
+
+    merged = {r["domain"]: r for r in read_shard(str(tmp_path / "merged.shard.jsonl"))}
+    assert merged[HOSTS[1]]["first_seen"] == "2020-05-05T00:00:00"
+    assert merged[HOSTS[1]]["runs"] == 2 and merged[HOSTS[0]]["runs"] == 1
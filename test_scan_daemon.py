@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+import tor_probe
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+from scan_daemon import ScanDaemon, ScanJob, run_scan
+
+SEED = v3_address(b"s" * 32)
+LINKED = v3_address(b"l" * 32)
+
+
+def call(daemon, method, path, body=None):
+    host, port = daemon.address
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(f"http://{host}:{port}{path}", data=data, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def wait_for(daemon, job_id, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        _, job = call(daemon, "GET", f"/jobs/{job_id}")
+        if job["status"] in ("done", "failed", "cancelled"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"İş bitmedi: {job}")
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.SCAN_DB_PATH", str(tmp_path / "scans.db"))
+    daemon = ScanDaemon("127.0.0.1", 0, str(tmp_path / "jobs")).start()
+    yield daemon
+    daemon.stop()
+
+
+def test_jobs_run_on_warm_pools(daemon, tmp_path, monkeypatch):
+    with MockTorNetwork() as network:
+        network.add_site(SEED, f'<a href="http://{LINKED}/">linked</a>')
+        network.add_site(LINKED, "<html></html>")
+        monkeypatch.setattr("config.TOR_SOCKS_HOST", network.proxy[0])
+        monkeypatch.setattr("config.TOR_SOCKS_PORTS", [network.proxy[1]])
+        monkeypatch.setattr(tor_probe, "TEST_SITES", [f"http://{SEED}/"])
+        tor_probe.clear_cache()
+
+        status, job = call(daemon, "POST", "/jobs", {"seeds": [f"http://{SEED}/"], "max_depth": 1, "output": "first"})
+        assert status == 202 and job["status"] == "queued"
+        first = wait_for(daemon, job["id"])
+        assert first["status"] == "done", first["error"]
+        assert first["result"]["tor_connection"] is True
+        assert first["result"]["total_onion_links"] == 1
+        with open(first["result"]["json_file"]) as f:
+            assert json.load(f)["onion_links"][0]["url"] == f"http://{LINKED}/"
+        connections = network.socks_connections
+        requests = network.sites[SEED].requests
+
+        _, job = call(daemon, "POST", "/jobs", {"seeds": [f"http://{SEED}/"], "max_depth": 1})
+        second = wait_for(daemon, job["id"])
+        assert second["status"] == "done"
+        # Tor durumu önbellekten gelir, keep-alive bağlantılar yeniden kullanılır: yeni SOCKS bağlantısı yok
+        assert network.sites[SEED].requests > requests
+        assert network.socks_connections == connections
+        assert second["result"]["scan_id"] == first["result"]["scan_id"] + 1
+
+    _, health = call(daemon, "GET", "/health")
+    assert health["completed"] == 2 and health["queue_depth"] == 0
+    assert set(second["result"]["stages"]) == {"tor_check", "crawl", "indicators", "save"}
+    host, port = daemon.address
+    with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=10) as response:
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "onion_scan_fetch_ttfb_seconds_count" in response.read().decode()
+    _, listing = call(daemon, "GET", "/jobs")
+    assert [job["output"] for job in listing["jobs"]] == ["first", f"job_{second['id']}"]
+
+
+def test_queue_priority_cancel_and_validation(tmp_path):
+    gate = threading.Event()
+    order = []
+
+    def scan(job, output_dir):
+        gate.wait(5)
+        order.append(job.output)
+        return {"output_dir": output_dir}
+
+    daemon = ScanDaemon("127.0.0.1", 0, str(tmp_path / "jobs"), scan=scan).start()
+    try:
+        ids = [call(daemon, "POST", "/jobs", {"output": name, "priority": priority})[1]["id"]
+               for name, priority in [("busy", 0), ("low", 0), ("high", 5), ("dropped", 0)]]
+        assert call(daemon, "DELETE", f"/jobs/{ids[3]}")[0] == 200
+        assert call(daemon, "DELETE", f"/jobs/{ids[3]}")[0] == 409
+        assert call(daemon, "POST", "/jobs", {"output": "../escape"})[0] == 400
+        assert call(daemon, "POST", "/jobs", {"seeds": []})[0] == 400
+        assert call(daemon, "POST", "/jobs", {"report": "false"})[0] == 400
+        assert call(daemon, "GET", "/jobs/999")[0] == 404
+
+        gate.set()
+        assert wait_for(daemon, ids[1])["status"] == "done"
+        assert order == ["busy", "high", "low"]
+        assert call(daemon, "GET", f"/jobs/{ids[3]}")[1]["status"] == "cancelled"
+    finally:
+        daemon.stop()
+
+
+def test_jobs_sharing_an_output_do_not_share_a_frontier(daemon, tmp_path, monkeypatch):
+    other = v3_address(b"o" * 32)
+    with MockTorNetwork() as network:
+        network.add_site(SEED, f'<a href="http://{LINKED}/">linked</a>')
+        network.add_site(LINKED, "<html></html>")
+        network.add_site(other, "<html>other</html>")
+        monkeypatch.setattr("config.TOR_SOCKS_HOST", network.proxy[0])
+        monkeypatch.setattr("config.TOR_SOCKS_PORTS", [network.proxy[1]])
+        monkeypatch.setattr(tor_probe, "TEST_SITES", [f"http://{SEED}/"])
+        tor_probe.clear_cache()
+
+        # İlk iş sayfa sınırında durur, LINKED kuyrukta kalır
+        _, job = call(daemon, "POST", "/jobs", {"seeds": [f"http://{SEED}/"], "max_depth": 1, "max_pages": 1,
+                                                "output": "shared"})
+        assert wait_for(daemon, job["id"])["status"] == "done"
+        _, job = call(daemon, "POST", "/jobs", {"seeds": [f"http://{other}/"], "max_depth": 1, "output": "shared"})
+        second = wait_for(daemon, job["id"])
+
+    assert second["status"] == "done", second["error"]
+    assert network.sites[LINKED].requests == 0 and network.sites[other].requests == 1
+    assert not [name for name in os.listdir(tmp_path / "jobs" / "shared") if name.startswith("crawl_frontier")]
+
+
+def test_failed_job_removes_its_frontier(tmp_path, monkeypatch):
+    import script
+
+    def crawl_and_fail(*args, db_path=None, **kwargs):
+        open(db_path, "w").close()
+        raise RuntimeError("crawl failed")
+
+    monkeypatch.setattr(script, "test_tor_connection", lambda: True)
+    monkeypatch.setattr(script, "get_onion_links", crawl_and_fail)
+    job = ScanJob(7, [f"http://{SEED}/"], 1, None, "job_7", False, 0)
+    with pytest.raises(RuntimeError):
+        run_scan(job, str(tmp_path))
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("crawl_frontier")]
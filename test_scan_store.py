@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import json
+
+import script
+from onion_address import v3_address
+from pdf_generator import create_pdf_report
+from scan_store import ScanStore
+
+A = v3_address(b"a" * 32)
+B = v3_address(b"b" * 32)
+
+
+def links(*hosts):
+    return [{"url": f"http://{host}/", "text": host[:5], "found_at": "seed"} for host in hosts]
+
+
+def test_history_and_domain_index(tmp_path):
+    with ScanStore(str(tmp_path / "scans.db"), batch_size=1) as store:
+        first = store.begin_scan("2026-01-01T00:00:00", True)
+        store.add_links(first, links(A, A, B))
+        second = store.begin_scan("2026-02-01T00:00:00", False)
+        store.add_links(second, links(A))
+
+        assert store.latest_scan_id() == second
+        assert [l["url"] for l in store.iter_links(first)] == [f"http://{A}/", f"http://{A}/", f"http://{B}/"]
+
+        domains = {d["domain"]: d for d in store.domains_seen_since("2026-01-01")}
+        assert domains[A] == {"domain": A, "first_seen": "2026-01-01T00:00:00",
+                              "last_seen": "2026-02-01T00:00:00", "hits": 3}
+        assert domains[B]["last_seen"] == "2026-01-01T00:00:00"
+        assert [d["domain"] for d in store.domains_seen_since("2026-01-15", "last_seen")] == [A]
+        assert len(store.links_for_domain(A)) == 3
+
+
+def test_save_to_json_keeps_history_and_pdf_view(tmp_path):
+    db_path = str(tmp_path / "scans.db")
+    json_file = str(tmp_path / "results.json")
+    fake_data = script.generate_fake_data()
+
+    script.save_to_json(links(A), True, fake_data, json_file=json_file, db_path=db_path)
+    report = script.save_to_json(links(A, B), False, fake_data, json_file=json_file, db_path=db_path)
+
+    with open(json_file, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["scan_id"] == report["scan_id"] == 2
+    assert data["total_onion_links"] == 2
+    assert data["onion_links"] == report["onion_links"]
+    assert data["scan_summary"] == report["scan_summary"]
+    assert data["dark_web_data"] == fake_data
+
+    with ScanStore(db_path) as store:
+        assert len(list(store.iter_links(1))) == 1
+
+    assert create_pdf_report(json_file, str(tmp_path / "report.pdf"))
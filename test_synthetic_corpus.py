@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+from crawler import crawl
+from link_extractor import extract_onion_links
+from mock_socks import MockTorNetwork
+from onion_address import is_valid_v3
+from synthetic_corpus import SyntheticCorpus
+
+
+def test_corpus_is_reproducible_with_requested_size_and_density():
+    corpus = SyntheticCorpus(sites=5, page_bytes=32 * 1024, links_per_kb=8, onion_ratio=1.0, seed=3)
+
+    assert corpus.pages == SyntheticCorpus(sites=5, page_bytes=32 * 1024, links_per_kb=8, onion_ratio=1.0,
+                                           seed=3).pages
+    assert all(is_valid_v3(host) for host in corpus.hosts)
+    for host, page in corpus.pages.items():
+        assert 32 * 1024 <= len(page) < 34 * 1024
+        links = extract_onion_links(page, f"http://{host}/", max_bytes=0)
+        assert 7 * 32 <= len(links) <= 9 * 32
+        assert all(link["url"].split("/")[2] in corpus.hosts for link in links)
+
+
+def test_mock_network_injects_latency_and_failures(tmp_path):
+    corpus = SyntheticCorpus(sites=10, page_bytes=4 * 1024, seed=1)
+
+    with corpus.serve(MockTorNetwork(latency=0.01, failure_rate=0.3, seed=7)) as network:
+        seeds = [f"http://{host}/" for host in corpus.hosts]
+        links = crawl(seeds, max_depth=1, db_path=str(tmp_path / "f.db"), proxy=network.proxy)
+
+    assert network.socks_failures > 0
+    assert network.socks_connections > 0
+    assert sum(site.requests for site in network.sites.values()) > 1
+    assert len(links) > 0
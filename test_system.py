@@ -45,11 +45,11 @@ def test_single_run():
         print("=" * 50)
         
         # Tor bağlantısı kontrolü
-        if "Tor üzerinden IP:" in result.stdout:
+        if "Tor üzerinden bağlantı başarılı" in result.stdout:
             print("✅ Tor bağlantısı başarılı")
-            ip_match = re.search(r"Tor üzerinden IP: (.+)", result.stdout)
-            if ip_match:
-                print(f"   IP Adresi: {ip_match.group(1)}")
+            site_match = re.search(r"Tor üzerinden bağlantı başarılı: (.+)", result.stdout)
+            if site_match:
+                print(f"   Test sitesi: {site_match.group(1)}")
         else:
             print("❌ Tor bağlantısı başarısız")
         
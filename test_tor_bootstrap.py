@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+import subprocess
+import sys
+
+from mock_socks import MockTorControl, MockTorNetwork
+from tor_bootstrap import TorControl, bootstrap_progress, socks_ready, wait_until_ready
+
+
+def test_waits_for_full_bootstrap_then_returns(tmp_path):
+    cookie = b"\x01" * 32
+    (tmp_path / "control_auth_cookie").write_bytes(cookie)
+    cookie_path = str(tmp_path / "control_auth_cookie")
+
+    with MockTorNetwork() as network, MockTorControl(progress=0, step=25, cookie=cookie) as control:
+        assert socks_ready(*network.proxy)
+        ready = wait_until_ready(timeout=5, poll_interval=0.01, socks=network.proxy,
+                                 control=control.address, cookie_path=cookie_path)
+        assert ready
+        assert control.queries == 5  # 0, 25, 50, 75, 100
+        with TorControl(*control.address, cookie_path=cookie_path) as ctl:
+            assert ctl.bootstrap_status() == (100, "done")
+
+
+def test_not_ready_without_socks_or_with_bad_cookie(tmp_path):
+    (tmp_path / "cookie").write_bytes(b"wrong")
+    with MockTorControl(progress=100, cookie=b"right") as control:
+        assert bootstrap_progress(*control.address, cookie_path=str(tmp_path / "cookie")) is None
+        # Kontrol portu hazır ama SOCKS portu kapalı
+        assert not wait_until_ready(timeout=0.2, poll_interval=0.05, socks=("127.0.0.1", 1),
+                                    control=control.address, cookie_path=str(tmp_path / "missing"))
+    assert not socks_ready("127.0.0.1", 1)
+
+
+def test_cli_execs_command_once_ready(tmp_path):
+    with MockTorNetwork() as network, MockTorControl(progress=50, step=50) as control:
+        env = {"TOR_SOCKS_HOST": "127.0.0.1", "TOR_SOCKS_PORT": str(network.proxy[1]),
+               "TOR_CONTROL_PORT": str(control.address[1]), "TOR_DATA_DIR": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, "tor_bootstrap.py", "--poll-interval", "0.01", "--",
+             sys.executable, "-c", "print('scan started')"],
+            capture_output=True, text=True, env=dict(env, PATH=""), timeout=30,
+        )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("scan started")
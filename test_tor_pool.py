@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import asyncio
+import socket
+
+import pytest
+
+from async_fetcher import FetchTimeout, fetch, fetch_many, run_sync
+from mock_socks import MockTorNetwork
+from tor_pool import CircuitPool
+
+
+@pytest.fixture
+def tor_network():
+    with MockTorNetwork() as network:
+        network.add_site("a.onion", "<html>a</html>")
+        yield network
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_async_fetches_reuse_keep_alive_connection(tor_network):
+    pool = CircuitPool("127.0.0.1", ports=[tor_network.proxy[1]])
+    urls = [f"http://a.onion/page{i}" for i in range(5)]
+
+    results = fetch_many(urls, concurrency=1, pool=pool)
+
+    assert all(r.status == 200 for r in results)
+    assert tor_network.socks_connections == 1
+    assert pool.circuits[0].requests == 5
+
+
+def test_sync_session_is_reused(tor_network):
+    pool = CircuitPool("127.0.0.1", ports=[tor_network.proxy[1]])
+
+    for _ in range(3):
+        assert pool.get("http://a.onion/", timeout=5).status_code == 200
+
+    assert tor_network.socks_connections == 1
+
+
+def test_traffic_moves_to_healthy_circuit(tor_network):
+    dead_port = unused_port()
+    pool = CircuitPool("127.0.0.1", ports=[dead_port, tor_network.proxy[1]])
+
+    results = fetch_many([f"http://a.onion/{i}" for i in range(20)], concurrency=1, pool=pool)
+
+    dead, alive = pool.circuits
+    assert dead.errors >= 1
+    assert dead.requests <= 2
+    assert alive.score < dead.score
+    assert sum(1 for r in results if not isinstance(r, Exception)) >= 18
+
+
+def test_cancelled_request_leaves_circuit_health_unchanged(tor_network):
+    tor_network.add_site("slow.onion", "<html>slow</html>", delay=5)
+    pool = CircuitPool("127.0.0.1", ports=[tor_network.proxy[1]])
+    circuit, = pool.circuits
+    score = circuit.score
+
+    async def cancel_midway():
+        task = asyncio.ensure_future(fetch("http://slow.onion/", timeout=30, pool=pool))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    run_sync(cancel_midway())
+    assert (circuit.requests, circuit.errors, circuit.score) == (0, 0, score)
+
+
+def test_timed_out_circuit_loses_priority(tor_network):
+    with MockTorNetwork() as stalled_network:
+        stalled_network.add_site("a.onion", "<html>a</html>", delay=5)
+        pool = CircuitPool("127.0.0.1", ports=[stalled_network.proxy[1], tor_network.proxy[1]])
+        stalled, healthy = pool.circuits
+
+        timed_out, = fetch_many(["http://a.onion/"], timeout=0.3, pool=pool)
+        results = fetch_many([f"http://a.onion/{i}" for i in range(5)], concurrency=1, pool=pool)
+
+    assert isinstance(timed_out, FetchTimeout)
+    assert stalled.errors >= 1 and stalled.requests == 1
+    assert healthy.score < stalled.score
+    assert all(r.status == 200 for r in results)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import time
+
+import pytest
+
+import tor_probe
+from mock_socks import MockTorNetwork
+
+
+@pytest.fixture
+def tor_network():
+    tor_probe.clear_cache()
+    with MockTorNetwork() as network:
+        yield network
+    tor_probe.clear_cache()
+
+
+def test_fastest_site_wins_the_race(tor_network):
+    tor_network.add_site("slow.onion", "ok", delay=3)
+    tor_network.add_site("fast.onion", "ok", delay=0.2)
+    tor_network.add_site("medium.onion", "ok", delay=2)
+    sites = ["http://slow.onion", "http://fast.onion", "http://medium.onion"]
+
+    started = time.monotonic()
+    winner = tor_probe.check_tor(sites, proxy=tor_network.proxy, timeout=10)
+
+    assert winner is True
+    assert time.monotonic() - started < 1.5
+
+
+def test_non_200_responses_do_not_win(tor_network):
+    tor_network.add_site("broken.onion", "", status=503)
+    tor_network.add_site("ok.onion", "ok", delay=0.3)
+
+    assert tor_probe.check_tor(["http://broken.onion", "http://ok.onion"], proxy=tor_network.proxy)
+
+
+def test_all_probes_failing(tor_network):
+    tor_network.add_site("broken.onion", "", status=503)
+
+    assert not tor_probe.check_tor(["http://broken.onion", "http://missing.onion"], proxy=tor_network.proxy)
+
+
+def test_verdict_is_cached_until_ttl(tor_network, monkeypatch):
+    site = tor_network.add_site("ok.onion", "ok")
+    sites = ["http://ok.onion"]
+
+    assert tor_probe.check_tor(sites, proxy=tor_network.proxy)
+    assert tor_probe.check_tor(sites, proxy=tor_network.proxy)
+    assert site.requests == 1
+
+    monkeypatch.setattr("config.TOR_STATUS_TTL", 0)
+    assert tor_probe.check_tor(sites, proxy=tor_network.proxy)
+    assert site.requests == 2
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import json
+
+import script
+from crawler import crawl
+from mock_socks import MockTorNetwork
+from onion_address import v3_address
+from scan_store import ScanStore
+from watchlist import DOMAIN, EMAIL, KEYWORD, Watchlist, get_watchlist, link_alerts, parse_entry
+
+HOST = v3_address(b"w" * 32)
+OTHER = v3_address(b"x" * 32)
+WATCHLIST = """# müşteri listesi
+domain: acme.com
+ceo@globex.com
+initech.io
+Acme Bank
+keyword: umbrella
+"""
+
+
+def _watchlist():
+    return Watchlist(filter(None, map(parse_entry, WATCHLIST.splitlines())))
+
+
+def test_parse_entry_infers_kinds():
+    assert parse_entry("  # yorum") is None and parse_entry("") is None
+    assert parse_entry("domain: Acme.com") == (DOMAIN, "Acme.com")
+    assert parse_entry("ceo@globex.com") == (EMAIL, "ceo@globex.com")
+    assert parse_entry("initech.io") == (DOMAIN, "initech.io")
+    assert parse_entry("Acme Bank") == (KEYWORD, "Acme Bank")
+
+
+def test_match_subdomains_emails_labels_and_phrases():
+    watchlist = _watchlist()
+    assert len(watchlist) == 5
+    # Tekrarlanan girdi indekse ikinci kez eklenmez
+    assert not watchlist.add(DOMAIN, "www.ACME.com.")
+
+    text = ("Dump of mail.acme.com users, contact CEO@Globex.com or admin@initech.io. "
+            "Phishing kit: umbrella-login.onion. Customers of ACME\nbank affected.")
+    matched = {watchlist.values[entry]: found for entry, found in watchlist.match(text).items()}
+    assert matched == {"acme.com": "mail.acme.com", "ceo@globex.com": "ceo@globex.com",
+                       "initech.io": "admin@initech.io", "umbrella": "umbrella-login.onion",
+                       "Acme Bank": "acme bank"}
+    # Benzer ama farklı adlar eşleşmez
+    assert watchlist.match("notacme.com globex.com acmebank umbrellas") == {}
+
+
+def test_link_alerts_use_link_as_source():
+    links = [{"url": f"http://{HOST}/acme-bank-login", "text": "Acme Bank secure login"},
+             {"url": f"http://{OTHER}/", "text": "Library"}]
+    alerts = link_alerts(_watchlist(), links)
+    assert [(alert["entry"], alert["source"], alert["context"]) for alert in alerts] == [
+        ("Acme Bank", f"http://{HOST}/acme-bank-login", "link")]
+
+
+def test_crawl_alerts_reach_json_and_store(tmp_path, monkeypatch):
+    watchlist_file = tmp_path / "watchlist.txt"
+    watchlist_file.write_text(WATCHLIST, encoding="utf-8")
+    monkeypatch.setattr("config.WATCHLIST_FILE", str(watchlist_file))
+    db_path = str(tmp_path / "f.db")
+    with MockTorNetwork() as network:
+        network.add_site(HOST, f'<html><body><p>Leaked: ceo@globex.com</p>'
+                               f'<a href="http://{OTHER}/">Umbrella panel</a></body></html>')
+        network.add_site(OTHER, "<html>nothing here</html>")
+        links = crawl([f"http://{HOST}/"], max_depth=1, db_path=db_path, proxy=network.proxy)
+
+    alerts = script.collect_watchlist_alerts(links, db_path)
+    assert {(alert["entry"], alert["source"], alert["context"]) for alert in alerts} == {
+        ("ceo@globex.com", f"http://{HOST}/", "page"),
+        ("umbrella", f"http://{HOST}/", "page"),
+        ("umbrella", f"http://{OTHER}/", "link"),
+    }
+
+    json_file = str(tmp_path / "results.json")
+    store_path = str(tmp_path / "scans.db")
+    report = script.save_to_json(links, True, {}, json_file=json_file, db_path=store_path,
+                                 watchlist_alerts=alerts)
+    with open(json_file, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["watchlist_alerts"] == alerts
+    assert list(data)[-3:] == ["watchlist_alerts", "scan_metrics", "dark_web_data"]
+    with ScanStore(store_path) as store:
+        assert store.scan_header(report["scan_id"])["watchlist_alerts"] == alerts
+
+
+def test_shared_index_is_rebuilt_only_when_file_changes(tmp_path, monkeypatch):
+    assert get_watchlist() is None
+    watchlist_file = tmp_path / "watchlist.txt"
+    watchlist_file.write_text(WATCHLIST, encoding="utf-8")
+    monkeypatch.setattr("config.WATCHLIST_FILE", str(watchlist_file))
+    first = get_watchlist()
+    assert get_watchlist() is first
+    watchlist_file.write_text(WATCHLIST + "hooli.com\n", encoding="utf-8")
+    assert get_watchlist() is not first and len(get_watchlist()) == 6
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tor hazır olana kadar bekleyip taramayı başlatan önyükleme adımı (sabit `sleep 30` yerine).
+
+SOCKS portunun SOCKS5 selamlaşmasına yanıt vermesi ve kontrol portundan okunan
+önyükleme yüzdesinin (`status/bootstrap-phase`) 100'e ulaşması beklenir. Kullanım:
+
+    tor & python3 tor_bootstrap.py -- python3 script.py
+"""
+import argparse
+import os
+import re
+import socket
+import sys
+import time
+
+import config
+
+PROGRESS_RE = re.compile(r"PROGRESS=(\d+)")
+TAG_RE = re.compile(r"TAG=(\S+)")
+
+
+class ControlError(Exception):
+    pass
+
+
+def socks_ready(host=None, port=None, timeout=2):
+    """SOCKS portu bağlantı kabul edip kimlik doğrulamasız SOCKS5 selamlaşmasını yanıtlıyor mu"""
+    try:
+        with socket.create_connection((host or config.TOR_SOCKS_HOST, port or config.TOR_SOCKS_PORT),
+                                      timeout=timeout) as sock:
+            sock.sendall(b"\x05\x01\x00")
+            return sock.recv(2) == b"\x05\x00"
+    except OSError:
+        return False
+
+
+class TorControl:
+    """Tor kontrol portu için en küçük istemci (AUTHENTICATE ve GETINFO)"""
+
+    def __init__(self, host=None, port=None, cookie_path=None, timeout=5):
+        self.sock = socket.create_connection((host or config.TOR_SOCKS_HOST, port or config.TOR_CONTROL_PORT),
+                                             timeout=timeout)
+        self.reader = self.sock.makefile("rb")
+        self.authenticate(cookie_path)
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def command(self, line):
+        """Komutu gönder, yanıt satırlarını (durum kodu ayıklanmış) döndür"""
+        self.sock.sendall(line.encode("ascii") + b"\r\n")
+        lines = []
+        while True:
+            raw = self.reader.readline()
+            if not raw:
+                raise ControlError("Kontrol bağlantısı kapandı")
+            reply = raw.decode("utf-8", "replace").rstrip("\r\n")
+            status, separator, text = reply[:3], reply[3:4], reply[4:]
+            if not status.startswith("2"):
+                raise ControlError(reply)
+            lines.append(text)
+            if separator == " ":
+                return lines
+
+    def authenticate(self, cookie_path=None):
+        # Çerez dosyası varsa çerezle, yoksa parolasız (null) kimlik doğrulaması
+        cookie_path = cookie_path or os.path.join(config.TOR_DATA_DIR, "control_auth_cookie")
+        try:
+            with open(cookie_path, "rb") as f:
+                self.command(f"AUTHENTICATE {f.read().hex()}")
+        except FileNotFoundError:
+            self.command("AUTHENTICATE")
+
+    def bootstrap_status(self):
+        """(yüzde, etiket) döndür, ör. (100, 'done')"""
+        line = self.command("GETINFO status/bootstrap-phase")[0]
+        progress = PROGRESS_RE.search(line)
+        tag = TAG_RE.search(line)
+        return (int(progress.group(1)) if progress else 0), (tag.group(1) if tag else "")
+
+
+def bootstrap_progress(host=None, port=None, cookie_path=None):
+    """Kontrol portundan önyükleme yüzdesini oku; port henüz açık değilse None döndür"""
+    try:
+        with TorControl(host, port, cookie_path) as control:
+            return control.bootstrap_status()
+    except (OSError, ControlError):
+        return None
+
+
+def wait_until_ready(timeout=None, poll_interval=0.5, socks=None, control=None, cookie_path=None,
+                     require_bootstrap=True):
+    """Tor kullanılabilir olana kadar bekle; hazırsa True, `timeout` dolarsa False döndür.
+
+    `require_bootstrap=False` ise (kontrol portu kapalı kurulumlar) yalnızca SOCKS beklenir.
+    """
+    timeout = config.TOR_BOOTSTRAP_TIMEOUT if timeout is None else timeout
+    socks_host, socks_port = socks or (None, None)
+    control_host, control_port = control or (None, None)
+    started = time.monotonic()
+    last_progress = None
+
+    while True:
+        status = bootstrap_progress(control_host, control_port, cookie_path) if require_bootstrap else (100, "done")
+        if status and status[0] != last_progress:
+            last_progress = status[0]
+            print(f"⏳ Tor önyüklemesi: %{status[0]} ({status[1]})")
+        if status and status[0] >= 100 and socks_ready(socks_host, socks_port):
+            print(f"✅ Tor hazır ({time.monotonic() - started:.1f} saniye)")
+            return True
+        if time.monotonic() - started >= timeout:
+            print(f"⚠️ Tor {timeout} saniyede hazır olmadı (son durum: {status})")
+            return False
+        time.sleep(poll_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timeout", type=float, default=config.TOR_BOOTSTRAP_TIMEOUT)
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    parser.add_argument("--socks-only", action="store_true", help="kontrol portunu bekleme, yalnızca SOCKS")
+    parser.add_argument("--strict", action="store_true", help="Tor hazır olmazsa komutu çalıştırma")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="Tor hazır olunca çalıştırılacak komut")
+    args = parser.parse_args()
+
+    ready = wait_until_ready(args.timeout, args.poll_interval, require_bootstrap=not args.socks_only)
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not ready and args.strict:
+        sys.exit(1)
+    if command:
+        # Tarama bu sürecin yerini alır (sinyaller ve çıkış kodu doğrudan komuta ait olur)
+        os.execvp(command[0], command)
+    sys.exit(0 if ready else 1)
+
+
+if __name__ == "__main__":
+    main()
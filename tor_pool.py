@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Birden fazla Tor SOCKS portu (ayrı devreler) üzerinde kalıcı bağlantı havuzu"""
+import asyncio
+import itertools
+import threading
+import time
+
+import config
+
+# Sağlık puanı ayarları
+LATENCY_ALPHA = 0.3      # Gecikme EWMA ağırlığı
+ERROR_ALPHA = 0.2        # Hata oranı EWMA ağırlığı
+ERROR_PENALTY = 4.0      # Hata oranının puana etkisi
+HEALTH_SLACK = 2.0       # En iyi puanın bu katına kadar olan devreler sıraya alınır
+PROBE_EVERY = 50         # Her N seçimde bir, sağlıksız devreler de yeniden denenir
+MAX_IDLE_PER_HOST = 4    # Host başına saklanan boşta bağlantı sayısı
+
+
+class Circuit:
+    """Tek bir SOCKS portu (Tor'da ayrı devre) ve sağlık istatistikleri"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.latency = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.idle = {}
+
+    @property
+    def proxy(self):
+        return (self.host, self.port)
+
+    @property
+    def score(self):
+        """Küçük puan daha sağlıklı devre; hiç denenmemiş devreler önce denenir"""
+        latency = self.latency
+        if latency is None:
+            # Hiç başarılı isteği olmayan devre: denenmemişse öncelikli, hep hata veriyorsa en sonda
+            latency = config.FETCH_TIMEOUT if self.errors else 0.0
+        return latency * (1 + ERROR_PENALTY * self.error_rate)
+
+    def record_success(self, latency):
+        self.requests += 1
+        self.latency = latency if self.latency is None else (
+            LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * self.latency
+        )
+        self.error_rate *= 1 - ERROR_ALPHA
+
+    def record_failure(self):
+        self.requests += 1
+        self.errors += 1
+        self.error_rate = ERROR_ALPHA + (1 - ERROR_ALPHA) * self.error_rate
+
+    def stats(self):
+        return {
+            'port': self.port,
+            'requests': self.requests,
+            'errors': self.errors,
+            'latency': round(self.latency, 3) if self.latency is not None else None,
+            'error_rate': round(self.error_rate, 3),
+        }
+
+
+class CircuitPool:
+    """Devreler arasında sağlık puanına göre round-robin dağıtım yapan havuz.
+
+    Asyncio tarafı için her devrede host başına boşta (keep-alive) bağlantılar
+    saklanır; senkron kod için devre başına bir `requests.Session` tutulur.
+    """
+
+    def __init__(self, host=None, ports=None):
+        host = host or config.TOR_SOCKS_HOST
+        ports = ports or config.TOR_SOCKS_PORTS
+        self.circuits = [Circuit(host, port) for port in ports]
+        self._counter = itertools.count()
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._loop = None
+
+    def choose(self):
+        """En sağlıklı devreler arasından sıradakini seç"""
+        turn = next(self._counter)
+        if turn % PROBE_EVERY == PROBE_EVERY - 1:
+            # Ara sıra tüm devreleri sırayla dene ki toparlanan devreler geri dönebilsin
+            return self.circuits[(turn // PROBE_EVERY) % len(self.circuits)]
+        best = min(circuit.score for circuit in self.circuits)
+        candidates = [c for c in self.circuits if c.score <= best * HEALTH_SLACK + 1e-9]
+        return candidates[turn % len(candidates)]
+
+    # --- asyncio bağlantıları ---
+
+    def take_idle(self, circuit, key):
+        """Devrede bu hedef için boşta bağlantı varsa döndür"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Başka bir event loop'a ait bağlantılar kullanılamaz
+            for pool_circuit in self.circuits:
+                pool_circuit.idle.clear()
+            self._loop = loop
+
+        connections = circuit.idle.get(key, [])
+        while connections:
+            reader, writer = connections.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        return None
+
+    def release(self, circuit, key, reader, writer, reusable):
+        """Bağlantıyı tekrar kullanılmak üzere havuza geri koy ya da kapat"""
+        connections = circuit.idle.setdefault(key, [])
+        if reusable and len(connections) < MAX_IDLE_PER_HOST and not reader.at_eof():
+            connections.append((reader, writer))
+        else:
+            writer.close()
+
+    async def close_idle(self):
+        """Boşta bekleyen tüm bağlantıları kapat (event loop kapanmadan önce çağrılmalı)"""
+        writers = []
+        for circuit in self.circuits:
+            for connections in circuit.idle.values():
+                writers.extend(writer for _, writer in connections)
+            circuit.idle.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    # --- senkron (requests) oturumları ---
+
+    def session(self, circuit):
+        """Devre için kalıcı bağlantılı requests oturumu"""
+        with self._lock:
+            session = self._sessions.get(circuit.port)
+            if session is None:
+                import requests
+                session = requests.Session()
+                proxy_url = f"socks5h://{circuit.host}:{circuit.port}"
+                session.proxies = {'http': proxy_url, 'https': proxy_url}
+                session.headers['User-Agent'] = config.USER_AGENT
+                self._sessions[circuit.port] = session
+            return session
+
+    def get(self, url, **kwargs):
+        """Seçilen devrenin oturumuyla GET isteği yap ve devre sağlığını güncelle"""
+        circuit = self.choose()
+        started = time.monotonic()
+        try:
+            response = self.session(circuit).get(url, **kwargs)
+        except Exception:
+            circuit.record_failure()
+            raise
+        circuit.record_success(time.monotonic() - started)
+        return response
+
+    def stats(self):
+        return [circuit.stats() for circuit in self.circuits]
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(proxy=None):
+    """Paylaşılan havuzu döndür; `proxy` verilirse o tek port için ayrı havuz kullanılır"""
+    key = tuple(proxy) if proxy else (config.TOR_SOCKS_HOST, tuple(config.TOR_SOCKS_PORTS))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = CircuitPool(proxy[0], [proxy[1]]) if proxy else CircuitPool()
+            _pools[key] = pool
+        return pool
+
+
+def all_pools():
+    """Oluşturulmuş tüm havuzlar"""
+    with _pools_lock:
+        return list(_pools.values())
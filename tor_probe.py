@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tor canlılık kontrolü: test siteleri yarıştırılır, sonuç TTL ile önbelleklenir"""
+import asyncio
+import threading
+import time
+
+import config
+from async_fetcher import fetch, release_idle, run_sync
+from fetch_cache import get_fetch_cache
+from tor_pool import get_pool
+
+# Farklı .onion sitelerini dene
+TEST_SITES = [
+    'http://duckduckgogg42xjoc72x3sjasowoarfbgcmvfimaftt6twagswzczad.onion',
+    'http://zqktlwiuavvvqqt4ybvgvi7tyo4hjl5xgfuvpdf6otjiycgwqbym2qad.onion',
+    'http://protonmailrmez3lotccipshtkleegetolb73fuirgj7r4o4vfu7ozyd.onion'
+]
+
+# (siteler, proxy) -> (sonuç, kontrol zamanı)
+_status_cache = {}
+_cache_lock = threading.Lock()
+
+
+async def race_probes(sites, pool, timeout=None):
+    """Tüm siteleri aynı anda dene; ilk 200 yanıtı veren siteyi döndür, diğerlerini iptal et"""
+    cache = get_fetch_cache()
+    tasks = {
+        asyncio.ensure_future(fetch(site, timeout=timeout, pool=pool, cache=cache)): site
+        for site in sites
+    }
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                site = tasks.pop(task)
+                if task.exception() is not None:
+                    print(f"❌ {site} başarısız: {str(task.exception())[:100]}...")
+                elif task.result().status == 200:
+                    return site
+                else:
+                    print(f"⚠️ {site} bağlantı kodu: {task.result().status}")
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await release_idle(pool)
+
+
+def check_tor(sites=None, proxy=None, timeout=None, refresh=False):
+    """Tor üzerinden .onion sitelerine erişilebiliyor mu? Sonuç önbellekten dönebilir"""
+    sites = tuple(sites or TEST_SITES)
+    key = (sites, tuple(proxy) if proxy else None)
+    now = time.monotonic()
+
+    with _cache_lock:
+        cached = _status_cache.get(key)
+    if cached and not refresh:
+        status, checked_at = cached
+        ttl = config.TOR_STATUS_TTL if status else config.TOR_STATUS_FAIL_TTL
+        if now - checked_at < ttl:
+            print(f"♻️ Önbellekteki Tor durumu kullanılıyor ({int(now - checked_at)} sn önce kontrol edildi)")
+            return status
+
+    print(f"📡 {len(sites)} test sitesi aynı anda deneniyor...")
+    winner = run_sync(race_probes(sites, get_pool(proxy), timeout))
+    if winner:
+        print(f"✅ Tor üzerinden bağlantı başarılı: {winner}")
+
+    with _cache_lock:
+        _status_cache[key] = (winner is not None, time.monotonic())
+    return winner is not None
+
+
+def clear_cache():
+    with _cache_lock:
+        _status_cache.clear()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Müşteri alan adları, e-posta adresleri ve marka anahtar kelimeleri için izleme listesi eşleştirici.
+
+Liste bir kez okunup karma tablo tabanlı bir token indeksine dönüştürülür; sayfa metni
+tek geçişte token'lara ayrılır ve her token (ve anahtar kelime uzunluğuna kadar token
+grupları) indekste aranır. Eşleşme süresi liste boyutundan bağımsızdır; yüz binlerce
+girdilik listelerde de sayfa başına maliyet metin uzunluğuyla orantılıdır.
+
+Dosya biçimi: satır başına bir girdi, isteğe bağlı tür öneki ile (`domain:`, `email:`,
+`keyword:`). Öneksiz satırlarda tür içerikten anlaşılır; `#` ile başlayan satırlar atlanır.
+"""
+import os
+import re
+import threading
+
+import config
+
+DOMAIN, EMAIL, KEYWORD = "domain", "email", "keyword"
+KINDS = (DOMAIN, EMAIL, KEYWORD)
+
+# Kelimeler, noktalı adlar (alan adları) ve e-posta adresleri tek token olarak alınır
+TOKEN = re.compile(r"[\w+-]+(?:[.@][\w+-]+)*")
+LABEL_SEPARATORS = re.compile(r"[.@_-]")
+DOMAIN_LIKE = re.compile(r"^[\w-]+(?:\.[\w-]+)+$")
+
+
+def parse_entry(line):
+    """Satırı (tür, değer) olarak çözümle; boş veya yorum satırı için None döndür"""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    kind, sep, value = line.partition(":")
+    if sep and kind.lower() in KINDS:
+        return kind.lower(), value.strip()
+    if "@" in line:
+        return EMAIL, line
+    if DOMAIN_LIKE.match(line):
+        return DOMAIN, line
+    return KEYWORD, line
+
+
+def _index_key(kind, value):
+    value = value.lower()
+    if kind == DOMAIN:
+        value = value.rstrip(".")
+        return value[4:] if value.startswith("www.") else value
+    if kind == EMAIL:
+        return value
+    return " ".join(TOKEN.findall(value))
+
+
+class Watchlist:
+    """İzleme listesinin token indeksi (anahtar -> girdi numarası)"""
+
+    def __init__(self, entries=()):
+        self.kinds = []
+        self.values = []
+        self._index = {}
+        self._phrase_starts = set()  # Çok kelimeli anahtar kelimelerin ilk kelimeleri
+        self.max_words = 1
+        for kind, value in entries:
+            self.add(kind, value)
+
+    @classmethod
+    def from_file(cls, path):
+        watchlist = cls()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                entry = parse_entry(line)
+                if entry:
+                    watchlist.add(*entry)
+        return watchlist
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, kind, value):
+        key = _index_key(kind, value)
+        if not key or key in self._index:
+            return False
+        self._index[key] = len(self.values)
+        self.kinds.append(kind)
+        self.values.append(value)
+        if " " in key:
+            self._phrase_starts.add(key.partition(" ")[0])
+            self.max_words = max(self.max_words, key.count(" ") + 1)
+        return True
+
+    def match(self, text):
+        """Metinde geçen girdiler: {girdi numarası: eşleşen metin}"""
+        index = self._index
+        tokens = TOKEN.findall(text.lower())
+        unique = set(tokens)
+        # Tek token'lık girdiler küme kesişimiyle bulunur; Python döngüsü yalnızca özel durumlar için
+        hits = {index[token]: token for token in index.keys() & unique}
+        for token in unique:
+            if token.isalnum():
+                continue
+            if "." in token or "@" in token:
+                # Alt alan adları ve e-posta adreslerinin alan adı kısmı: mail.acme.com, x@acme.com -> acme.com
+                user, at, host = token.rpartition("@")
+                if not at:
+                    host = host.partition(".")[2]  # Tam ad zaten yukarıda arandı
+                while "." in host:
+                    entry = index.get(host)
+                    if entry is not None and self.kinds[entry] == DOMAIN:
+                        hits.setdefault(entry, token)
+                    host = host.partition(".")[2]
+            # Adres içindeki marka adları: acme-login.onion, acme_support -> acme
+            for label in LABEL_SEPARATORS.split(token):
+                entry = index.get(label)
+                if entry is not None and self.kinds[entry] == KEYWORD:
+                    hits.setdefault(entry, token)
+        if self._phrase_starts and not unique.isdisjoint(self._phrase_starts):
+            for position, token in enumerate(tokens):
+                if token not in self._phrase_starts:
+                    continue
+                phrase = token
+                for word in tokens[position + 1:position + self.max_words]:
+                    phrase = f"{phrase} {word}"
+                    entry = index.get(phrase)
+                    if entry is not None:
+                        hits.setdefault(entry, phrase)
+        return hits
+
+    def alerts(self, text, source, context="page"):
+        """Eşleşmeleri rapora yazılacak uyarı kayıtları olarak döndür"""
+        return [{"entry": self.values[entry], "kind": self.kinds[entry], "matched": matched,
+                 "source": source, "context": context}
+                for entry, matched in self.match(text).items()]
+
+
+def link_alerts(watchlist, links):
+    """Link adresleri ve metinlerindeki eşleşmeler (kaynak: linkin kendisi)"""
+    alerts = []
+    for link in links:
+        alerts.extend(watchlist.alerts(f"{link['url']} {link.get('text', '')}", link['url'], "link"))
+    return alerts
+
+
+_watchlist = None
+_watchlist_key = None
+_watchlist_lock = threading.Lock()
+
+
+def get_watchlist(path=None):
+    """Paylaşılan izleme listesini döndür; dosya değişmedikçe indeks yeniden kurulmaz.
+
+    `WATCHLIST_FILE` ayarlı değilse veya dosya yoksa None döner.
+    """
+    global _watchlist, _watchlist_key
+    path = path or config.WATCHLIST_FILE
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _watchlist_lock:
+        if _watchlist_key != key:
+            _watchlist = Watchlist.from_file(path)
+            _watchlist_key = key
+        return _watchlist